@@ -1,13 +1,14 @@
 
 import time
+import math
 import random
-import matplotlib.pyplot as plt
-import numpy as np
 from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional
 from enum import Enum
-import psutil
 import os
+import sys
+from bisect import bisect_left
+from transacciones import PlanificadorTransaccional
 
 class DiaSemana(Enum):
     LUNES = "Lunes"
@@ -40,9 +41,64 @@ class HorarioAsignado:
     hora_fin: int
     aula: Aula
 
-class PlanificadorVoraz:
+FASES_GREEDY = ('seleccion_criterio', 'ordenamiento_aulas', 'verificacion_conflictos', 'construccion_objetos')
+
+def _perfil_fases_vacio() -> Dict:
+    perfil = {fase: {'tiempo': 0.0, 'llamadas': 0} for fase in FASES_GREEDY}
+    perfil['verificacion_conflictos']['comparaciones'] = 0
+    return perfil
+
+# Criterios de ordenamiento: cada uno recibe (clases, aulas) y devuelve las
+# clases en el orden en que el voraz las intenta colocar
+def _orden_duracion(clases: List[Clase], aulas: List[Aula]) -> List[Clase]:
+    return sorted(clases, key=lambda c: (c.duracion, -c.estudiantes), reverse=True)
+
+def _orden_estudiantes(clases: List[Clase], aulas: List[Aula]) -> List[Clase]:
+    return sorted(clases, key=lambda c: (c.estudiantes, -c.duracion), reverse=True)
+
+def _orden_carga(clases: List[Clase], aulas: List[Aula]) -> List[Clase]:
+    return sorted(clases, key=lambda c: (c.duracion * c.estudiantes, -c.duracion), reverse=True)
+
+def _orden_mas_restringida(clases: List[Clase], aulas: List[Aula]) -> List[Clase]:
+    """Primero las clases con menos aulas de capacidad suficiente"""
+    capacidades = sorted(a.capacidad for a in aulas)
+    return sorted(clases, key=lambda c: (len(capacidades) - bisect_left(capacidades, c.estudiantes),
+                                         -c.duracion, -c.estudiantes))
+
+def _orden_profesor_cargado(clases: List[Clase], aulas: List[Aula]) -> List[Clase]:
+    """Primero las clases de los profesores con más horas semanales"""
+    horas = {}
+    for c in clases:
+        horas[c.profesor] = horas.get(c.profesor, 0) + c.duracion
+    return sorted(clases, key=lambda c: (horas[c.profesor], c.duracion), reverse=True)
+
+CRITERIOS_GREEDY = {
+    'duracion': _orden_duracion,
+    'estudiantes': _orden_estudiantes,
+    'carga': _orden_carga,
+    'mas_restringida': _orden_mas_restringida,
+    'profesor_cargado': _orden_profesor_cargado,
+}
+
+def seleccionar_criterio(clases: List[Clase]) -> str:
+    """Criterio del voraz adaptativo según la dispersión de duraciones y estudiantes"""
+    if not clases:
+        return 'duracion'
+    duraciones = [c.duracion for c in clases]
+    estudiantes = [c.estudiantes for c in clases]
+    if max(duraciones) - min(duraciones) > 2:
+        return 'duracion'
+    if max(estudiantes) - min(estudiantes) > 30:
+        return 'estudiantes'
+    return 'carga'
+
+class PlanificadorVoraz(PlanificadorTransaccional):
+    
+    ATRIBUTOS_INSTANTANEA = ('estadisticas_greedy', 'perfil_fases', 'resultados_portafolio',
+                             'resultados_multiarranque', 'resultados_replanificacion',
+                             'resultados_reparacion', 'truncado', 'disrupciones')
     
-    def __init__(self, aulas: List[Aula]):
+    def __init__(self, aulas: List[Aula], instrumentar: bool = False):
         self.aulas = aulas
         self.horarios_asignados: List[HorarioAsignado] = []
         self.estadisticas_greedy = {
@@ -50,25 +106,55 @@ class PlanificadorVoraz:
             'asignaciones_exitosas': 0,
             'asignaciones_fallidas': 0,
             'criterios_aplicados': 0,
-            'mejoras_locales': 0
+            'mejoras_locales': 0,
+            'criterio': None
         }
-    
-    def _verificar_conflicto(self, clase: Clase, dia: DiaSemana, 
-                           hora_inicio: int, aula: Aula) -> bool:
+        # Instrumentación opcional por fase: solo cuesta un `if` cuando está desactivada
+        self.instrumentar = instrumentar
+        self.perfil_fases = _perfil_fases_vacio()
+        self.resultados_portafolio: Dict[str, Dict] = {}
+        self.resultados_multiarranque: Dict = {}
+        self.resultados_replanificacion: Dict = {}
+        self.resultados_reparacion: Dict = {}
+        # Franjas no disponibles aplicadas con `reparar`; `replanificar` las respeta
+        self.disrupciones: List = []
+        # Verdadero si un plazo o una cancelación cortó la construcción del horario
+        self.truncado = False
+    
+    def _acumular_fase(self, fase: str, inicio: float):
+        datos = self.perfil_fases[fase]
+        datos['tiempo'] += time.perf_counter() - inicio
+        datos['llamadas'] += 1
+    
+    def _indice_conflicto(self, clase: Clase, dia: DiaSemana, 
+                          hora_inicio: int, aula: Aula) -> int:
         hora_fin = hora_inicio + clase.duracion
         
-        for horario in self.horarios_asignados:
+        for i, horario in enumerate(self.horarios_asignados):
             if (horario.aula.id == aula.id and 
                 horario.dia == dia and
                 not (hora_fin <= horario.hora_inicio or hora_inicio >= horario.hora_fin)):
-                return True
+                return i
             
             if (horario.clase.profesor == clase.profesor and
                 horario.dia == dia and
                 not (hora_fin <= horario.hora_inicio or hora_inicio >= horario.hora_fin)):
-                return True
+                return i
         
-        return False
+        return -1
+    
+    def _verificar_conflicto(self, clase: Clase, dia: DiaSemana, 
+                           hora_inicio: int, aula: Aula) -> bool:
+        if not self.instrumentar:
+            return self._indice_conflicto(clase, dia, hora_inicio, aula) >= 0
+        
+        inicio = time.perf_counter()
+        indice = self._indice_conflicto(clase, dia, hora_inicio, aula)
+        self._acumular_fase('verificacion_conflictos', inicio)
+        self.perfil_fases['verificacion_conflictos']['comparaciones'] += (
+            indice + 1 if indice >= 0 else len(self.horarios_asignados)
+        )
+        return indice >= 0
     
     def _asignar_horario(self, clase: Clase, dia: DiaSemana, 
                         hora_inicio: int, aula: Aula) -> bool:
@@ -76,6 +162,8 @@ class PlanificadorVoraz:
             self.estadisticas_greedy['asignaciones_fallidas'] += 1
             return False
         
+        if self.instrumentar:
+            inicio = time.perf_counter()
         horario = HorarioAsignado(
             clase=clase,
             dia=dia,
@@ -83,27 +171,219 @@ class PlanificadorVoraz:
             hora_fin=hora_inicio + clase.duracion,
             aula=aula
         )
+        if self.instrumentar:
+            self._acumular_fase('construccion_objetos', inicio)
         
         self.horarios_asignados.append(horario)
         self.estadisticas_greedy['asignaciones_exitosas'] += 1
         return True
 
-    def greedy_adaptativo(self, clases: List[Clase]) -> List[HorarioAsignado]:
-        duraciones = [c.duracion for c in clases]
-        estudiantes = [c.estudiantes for c in clases]
+    def greedy_adaptativo(self, clases: List[Clase], token=None) -> List[HorarioAsignado]:
+        """`token` (TokenCancelacion) permite cortar la pasada y devolver el horario parcial"""
+        self.truncado = False
+        if self.instrumentar:
+            inicio = time.perf_counter()
         
-        if max(duraciones) - min(duraciones) > 2:
-            criterio = lambda c: (c.duracion, -c.estudiantes)
-        elif max(estudiantes) - min(estudiantes) > 30:
-            criterio = lambda c: (c.estudiantes, -c.duracion)
-        else:
-            criterio = lambda c: (c.duracion * c.estudiantes, -c.duracion)
+        criterio = seleccionar_criterio(clases)
+        clases_ordenadas = CRITERIOS_GREEDY[criterio](clases, self.aulas)
+        self.estadisticas_greedy['criterios_aplicados'] += 1
+        self.estadisticas_greedy['criterio'] = criterio
+        if self.instrumentar:
+            self._acumular_fase('seleccion_criterio', inicio)
+        
+        return self._greedy_ordenado(clases_ordenadas, token)
+
+    def greedy_anytime(self, clases: List[Clase], token, semilla: int = 42) -> List[HorarioAsignado]:
+        """
+        Voraz adaptativo seguido de pasadas con desempates aleatorios hasta que
+        `token` expira; conserva el horario con más clases.
+
+        El token debe tener plazo (o cancelarse desde fuera). Las pasadas de
+        refinamiento cortadas por el plazo también cuentan si mejoran. Como el
+        resto de entradas, añade las nuevas asignaciones a las que ya tenga el
+        planificador (las pasadas las respetan) y devuelve solo las nuevas.
+        """
+        if token.limite is None and not token.cancelado:
+            raise ValueError("greedy_anytime necesita un token con plazo")
+        
+        previos = list(self.horarios_asignados)
+        mejor = self.greedy_adaptativo(clases, token)
+        truncado = self.truncado
+        criterio = self.estadisticas_greedy['criterio']
+        generador = random.Random(semilla)
+        pasadas = 0
+        while not token.expirado():
+            candidato, nuevos = _pasada_aleatoria(clases, self.aulas, criterio, generador, token, previos)
+            pasadas += 1
+            if len(nuevos) > len(mejor):
+                mejor = nuevos
+                truncado = candidato.truncado
+        
+        self.horarios_asignados = previos + mejor
+        self.truncado = truncado
+        self.estadisticas_greedy['mejoras_locales'] += pasadas
+        return mejor
+
+    def replanificar(self, clases: List[Clase], horario_previo, token=None) -> List[HorarioAsignado]:
+        """
+        Arranque en caliente desde `horario_previo` (lista de HorarioAsignado o
+        ruta a un .hcol): conserva las asignaciones que siguen siendo válidas y
+        coloca solo las clases nuevas o invalidadas, con el criterio del
+        adaptativo y mejor ajuste de aula. Usa un índice de ocupación en bits,
+        así que el coste depende de las clases a colocar y no del tamaño del
+        horario. No usa las franjas de las disrupciones aplicadas con
+        `reparar`. Devuelve el horario completo.
+        """
+        from indice_ocupacion import cargar_horario_previo, colocar, conservar_validas
+        
+        tipos = sys.modules[__name__]
+        if isinstance(horario_previo, (str, os.PathLike)):
+            horario_previo = cargar_horario_previo(horario_previo, tipos)
+        conservados, pendientes, indice, descartes = conservar_validas(horario_previo, clases, self.aulas, tipos,
+                                                                        self.disrupciones)
+        
+        criterio = seleccionar_criterio(pendientes)
+        mejor_ajuste = lambda clase, aulas: sorted(aulas, key=lambda a: abs(a.capacidad - clase.estudiantes))
+        nuevos, self.truncado = colocar(indice, CRITERIOS_GREEDY[criterio](pendientes, self.aulas), self.aulas,
+                                        tipos, orden_aulas=mejor_ajuste, token=token)
+        
+        self.horarios_asignados = conservados + nuevos
+        self.estadisticas_greedy['criterio'] = criterio
+        self.estadisticas_greedy['iteraciones'] += len(pendientes)
+        self.estadisticas_greedy['asignaciones_exitosas'] += len(nuevos)
+        self.resultados_replanificacion = {
+            'conservadas': len(conservados),
+            'pendientes': len(pendientes),
+            'colocadas': len(nuevos),
+            'descartes': descartes,
+        }
+        return self.horarios_asignados
+
+
+    def greedy_portafolio(self, clases: List[Clase], criterios: Optional[List[str]] = None,
+                          trabajadores: Optional[int] = None) -> List[HorarioAsignado]:
+        """
+        Ejecuta el voraz con todos los criterios en paralelo y conserva el horario
+        con más clases asignadas (a igualdad, el primer criterio de la lista).
+
+        La instancia se publica una vez en memoria compartida; cada proceso
+        devuelve tuplas de índices y el horario se reconstruye aquí con las
+        clases y aulas originales. Las asignaciones que ya tenga el planificador
+        se envían como ocupación previa, así que las nuevas las respetan. El
+        tiempo de pared es el del criterio más lento más el arranque del pool.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from instancia_compartida import InstanciaCompartida, inicializar_trabajador
+        
+        self.truncado = False
+        criterios = list(criterios or CRITERIOS_GREEDY)
+        trabajadores = trabajadores or min(len(criterios), os.cpu_count() or 1)
+        with InstanciaCompartida(clases, self.aulas) as instancia, \
+                ProcessPoolExecutor(max_workers=trabajadores, initializer=inicializar_trabajador,
+                                    initargs=(instancia.nombre,)) as pool:
+            previas = self._ocupacion_previa(instancia.profesores)
+            futuros = [pool.submit(_ejecutar_criterio, criterio, previas) for criterio in criterios]
+            resultados = [futuro.result() for futuro in futuros]
+        
+        self.resultados_portafolio = {criterio: {'clases_asignadas': len(asignaciones), 'tiempo': tiempo}
+                                      for criterio, tiempo, asignaciones in resultados}
+        criterio, _, asignaciones = max(resultados, key=lambda r: len(r[2]))
+        
+        horarios_asignados = self._desde_indices(clases, asignaciones)
+        self.horarios_asignados.extend(horarios_asignados)
+        self.estadisticas_greedy['criterios_aplicados'] += len(criterios)
+        self.estadisticas_greedy['criterio'] = criterio
+        self.estadisticas_greedy['iteraciones'] += len(clases)
+        self.estadisticas_greedy['asignaciones_exitosas'] += len(horarios_asignados)
+        return horarios_asignados
+
+    def greedy_multiarranque(self, clases: List[Clase], k: int = 16, semilla_maestra: int = 42,
+                             trabajadores: Optional[int] = None,
+                             criterio: Optional[str] = None) -> List[HorarioAsignado]:
+        """
+        Ejecuta `k` pasadas del voraz con desempates aleatorios en un pool de
+        procesos y conserva la de más clases asignadas.
+
+        La pasada i usa la semilla derivada `semilla_maestra * 2**32 + i`, así
+        que el resultado es reproducible e independiente del número de
+        trabajadores (a igualdad gana la pasada de menor índice). La instancia
+        se comparte en memoria compartida; cada tarea solo recibe su rango de
+        pasadas (y la ocupación previa del planificador, que las pasadas
+        respetan) y devuelve la mejor de ellas como tuplas de índices.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from instancia_compartida import InstanciaCompartida, inicializar_trabajador
         
-        clases_ordenadas = sorted(clases, key=criterio, reverse=True)
+        self.truncado = False
+        criterio = criterio or seleccionar_criterio(clases)
+        trabajadores = trabajadores or min(k, os.cpu_count() or 1)
+        # Varios bloques por trabajador para repartir la carga entre pasadas desiguales
+        bloque = max(1, math.ceil(k / (trabajadores * 4)))
+        inicio = time.perf_counter()
+        with InstanciaCompartida(clases, self.aulas) as instancia, \
+                ProcessPoolExecutor(max_workers=trabajadores, initializer=inicializar_trabajador,
+                                    initargs=(instancia.nombre,)) as pool:
+            previas = self._ocupacion_previa(instancia.profesores)
+            futuros = [pool.submit(_pasadas_multiarranque, primera, min(primera + bloque, k),
+                                   semilla_maestra, criterio, previas)
+                       for primera in range(0, k, bloque)]
+            resultados = [futuro.result() for futuro in futuros]
+        tiempo = time.perf_counter() - inicio
         
+        asignadas_por_pasada = [asignadas for conteos, _, _ in resultados for asignadas in conteos]
+        _, mejor_pasada, asignaciones = max(resultados, key=lambda r: (len(r[2]), -r[1]))
+        self.resultados_multiarranque = {
+            'pasadas': k,
+            'criterio': criterio,
+            'semilla_maestra': semilla_maestra,
+            'mejor_pasada': mejor_pasada,
+            'asignadas_por_pasada': asignadas_por_pasada,
+            'tiempo': tiempo,
+            'pasadas_por_segundo': k / tiempo if tiempo > 0 else 0.0,
+        }
+        
+        horarios_asignados = self._desde_indices(clases, asignaciones)
+        self.horarios_asignados.extend(horarios_asignados)
+        self.estadisticas_greedy['criterios_aplicados'] += 1
+        self.estadisticas_greedy['criterio'] = criterio
+        self.estadisticas_greedy['iteraciones'] += len(clases)
+        self.estadisticas_greedy['asignaciones_exitosas'] += len(horarios_asignados)
+        return horarios_asignados
+
+    def _ocupacion_previa(self, profesores: Dict[str, int]) -> List[Tuple[int, str, int, int, str]]:
+        """
+        Asignaciones actuales como (aula, día, hora, duración, profesor) con los
+        nombres de la instancia compartida ("P{i}"); un profesor que no imparte
+        ninguna de las clases compartidas conserva su nombre.
+        """
+        posicion_aula = {a.id: r for r, a in enumerate(self.aulas)}
+        return [(posicion_aula[h.aula.id], h.dia.name, h.hora_inicio, h.hora_fin - h.hora_inicio,
+                 f"P{profesores[h.clase.profesor]}" if h.clase.profesor in profesores else h.clase.profesor)
+                for h in self.horarios_asignados]
+
+    def _desde_indices(self, clases: List[Clase], asignaciones) -> List[HorarioAsignado]:
+        """Reconstruye horarios a partir de tuplas (clase, día, hora, aula) por índices"""
+        horarios_asignados = []
+        for indice_clase, dia, hora_inicio, indice_aula in asignaciones:
+            clase = clases[indice_clase]
+            horarios_asignados.append(HorarioAsignado(
+                clase=clase,
+                dia=DiaSemana[dia],
+                hora_inicio=hora_inicio,
+                hora_fin=hora_inicio + clase.duracion,
+                aula=self.aulas[indice_aula]
+            ))
+        return horarios_asignados
+
+    def _greedy_ordenado(self, clases_ordenadas: List[Clase], token=None) -> List[HorarioAsignado]:
+        """Coloca las clases en el orden dado en la primera franja y aula libres"""
+        instrumentar = self.instrumentar
         horarios_asignados = []
         
         for clase in clases_ordenadas:
+            if token is not None and token.expirado():
+                self.truncado = True
+                break
             self.estadisticas_greedy['iteraciones'] += 1
             asignada = False
             
@@ -115,13 +395,19 @@ class PlanificadorVoraz:
                     if asignada:
                         break
                     
+                    if instrumentar:
+                        inicio = time.perf_counter()
                     aulas_ordenadas = sorted(self.aulas, 
                                            key=lambda a: abs(a.capacidad - clase.estudiantes))
+                    if instrumentar:
+                        self._acumular_fase('ordenamiento_aulas', inicio)
                     
                     for aula in aulas_ordenadas:
                         if (aula.capacidad >= clase.estudiantes and 
                             not self._verificar_conflicto(clase, dia, hora, aula)):
                             
+                            if instrumentar:
+                                inicio = time.perf_counter()
                             horario = HorarioAsignado(
                                 clase=clase,
                                 dia=dia,
@@ -129,6 +415,8 @@ class PlanificadorVoraz:
                                 hora_fin=hora + clase.duracion,
                                 aula=aula
                             )
+                            if instrumentar:
+                                self._acumular_fase('construccion_objetos', inicio)
                             
                             horarios_asignados.append(horario)
                             self.horarios_asignados.append(horario)
@@ -144,15 +432,21 @@ class PlanificadorVoraz:
             'asignaciones_exitosas': 0,
             'asignaciones_fallidas': 0,
             'criterios_aplicados': 0,
-            'mejoras_locales': 0
+            'mejoras_locales': 0,
+            'criterio': None
         }
+        self.perfil_fases = _perfil_fases_vacio()
+        self.disrupciones = []
+        self.truncado = False
 
     def estadisticas(self) -> Dict:
         if not self.horarios_asignados:
             return {
                 "clases_asignadas": 0,
                 "utilizacion_aulas": {},
-                "estadisticas_greedy": self.estadisticas_greedy
+                "estadisticas_greedy": self.estadisticas_greedy,
+                "perfil_fases": self.perfil_fases,
+                "truncado": self.truncado
             }
         
         clases_asignadas = len(self.horarios_asignados)
@@ -169,10 +463,77 @@ class PlanificadorVoraz:
             "clases_asignadas": clases_asignadas,
             "total_horas": total_horas,
             "utilizacion_aulas": utilizacion_aulas,
-            "estadisticas_greedy": self.estadisticas_greedy
+            "estadisticas_greedy": self.estadisticas_greedy,
+            "perfil_fases": self.perfil_fases,
+            "truncado": self.truncado
         }
 
-def generar_datos_prueba_greedy(num_clases: int, num_aulas: int = 5) -> Tuple[List[Clase], List[Aula]]:
+def _a_indices(horarios: List[HorarioAsignado], clases: List[Clase], aulas: List[Aula]):
+    posicion_clase = {id(c): i for i, c in enumerate(clases)}
+    posicion_aula = {id(a): r for r, a in enumerate(aulas)}
+    return [(posicion_clase[id(h.clase)], h.dia.name, h.hora_inicio, posicion_aula[id(h.aula)])
+            for h in horarios]
+
+def _horarios_previos(previas, aulas: List[Aula]) -> List[HorarioAsignado]:
+    """Ocupación previa (`_ocupacion_previa`) como asignaciones de clases ficticias"""
+    horarios = []
+    for indice_aula, dia, hora_inicio, duracion, profesor in previas:
+        clase = Clase(id=-1, nombre="", profesor=profesor, duracion=duracion,
+                      horario_preferido=(DiaSemana[dia], hora_inicio), aula_requerida="", estudiantes=0)
+        horarios.append(HorarioAsignado(clase=clase, dia=DiaSemana[dia], hora_inicio=hora_inicio,
+                                        hora_fin=hora_inicio + duracion, aula=aulas[indice_aula]))
+    return horarios
+
+def _ejecutar_criterio(criterio: str, previas=()):
+    """Trabajador del portafolio: devuelve (criterio, tiempo, [(clase, día, hora, aula)]) por índices"""
+    from instancia_compartida import instancia_trabajador
+    clases, aulas = instancia_trabajador()
+    inicio = time.perf_counter()
+    planificador = PlanificadorVoraz(aulas)
+    planificador.horarios_asignados = _horarios_previos(previas, aulas)
+    nuevos = planificador._greedy_ordenado(CRITERIOS_GREEDY[criterio](clases, aulas))
+    tiempo = time.perf_counter() - inicio
+    return criterio, tiempo, _a_indices(nuevos, clases, aulas)
+
+def _pasada_aleatoria(clases: List[Clase], aulas: List[Aula], criterio: str,
+                      generador: random.Random, token=None, previos=()) -> Tuple[PlanificadorVoraz, List]:
+    """
+    Una pasada del voraz con desempates aleatorios: baraja clases y aulas antes
+    del ordenamiento estable del criterio, así que solo cambian los empates.
+    Parte de las asignaciones `previos` y devuelve (planificador, nuevas).
+    """
+    clases_barajadas = generador.sample(clases, len(clases))
+    aulas_barajadas = generador.sample(aulas, len(aulas))
+    planificador = PlanificadorVoraz(aulas_barajadas)
+    planificador.horarios_asignados = list(previos)
+    nuevos = planificador._greedy_ordenado(CRITERIOS_GREEDY[criterio](clases_barajadas, aulas_barajadas), token)
+    return planificador, nuevos
+
+def _pasadas_multiarranque(primera: int, ultima: int, semilla_maestra: int, criterio: str, previas=()):
+    """
+    Trabajador del multiarranque: ejecuta las pasadas [primera, ultima) y
+    devuelve (asignadas por pasada, mejor pasada, asignaciones de la mejor).
+    """
+    from instancia_compartida import instancia_trabajador
+    clases, aulas = instancia_trabajador()
+    previos = _horarios_previos(previas, aulas)
+    conteos = []
+    mejor = (-1, primera, [])
+    for pasada in range(primera, ultima):
+        _, nuevos = _pasada_aleatoria(clases, aulas, criterio,
+                                      random.Random(semilla_maestra * 2**32 + pasada), previos=previos)
+        asignadas = len(nuevos)
+        conteos.append(asignadas)
+        if asignadas > mejor[0]:
+            mejor = (asignadas, pasada, nuevos)
+    return conteos, mejor[1], _a_indices(mejor[2], clases, aulas)
+
+def generar_datos_prueba_greedy(num_clases: int, num_aulas: int = 5, num_profesores: Optional[int] = None,
+                                pesos_duracion: Optional[Dict[int, float]] = None) -> Tuple[List[Clase], List[Aula]]:
+    """
+    Genera una instancia aleatoria. `num_profesores` recorta o amplía el grupo de
+    profesores y `pesos_duracion` ({horas: peso}) sustituye la mezcla de duraciones.
+    """
     aulas = []
     for i in range(num_aulas):
         aula = Aula(
@@ -199,10 +560,17 @@ def generar_datos_prueba_greedy(num_clases: int, num_aulas: int = 5) -> Tuple[Li
         "Dr. Morales", "Dra. Jiménez", "Dr. Ruiz", "Dra. Díaz", "Dr. Herrera",
         "Dr. Vargas", "Dra. Castro", "Dr. Romero", "Dra. Aguilar", "Dr. Mendoza"
     ]
+    if num_profesores is not None:
+        profesores = profesores[:num_profesores] + [
+            f"Prof. {i+1}" for i in range(len(profesores), num_profesores)
+        ]
+    
+    duraciones, pesos = ([1, 2, 3], [0.3, 0.5, 0.2]) if pesos_duracion is None else (
+        list(pesos_duracion), list(pesos_duracion.values()))
     
     clases = []
     for i in range(num_clases):
-        duracion = random.choices([1, 2, 3], weights=[0.3, 0.5, 0.2])[0]
+        duracion = random.choices(duraciones, weights=pesos)[0]
         
         estudiantes = random.choices(
             [15, 25, 35, 45, 55, 65, 75], 
@@ -223,6 +591,7 @@ def generar_datos_prueba_greedy(num_clases: int, num_aulas: int = 5) -> Tuple[Li
     return clases, aulas
 
 def medir_rendimiento_greedy(func, *args, **kwargs):
+    import psutil  # solo lo necesitan las mediciones, no el planificador
     proceso = psutil.Process(os.getpid())
     memoria_inicial = proceso.memory_info().rss / 1024 / 1024
     inicio = time.time()
@@ -233,7 +602,9 @@ def medir_rendimiento_greedy(func, *args, **kwargs):
     
     return resultado, fin - inicio, memoria_final - memoria_inicial
 
-def pruebas_sobrecarga_greedy():
+def pruebas_sobrecarga_greedy(instrumentar: bool = True, repeticiones: int = 3,
+                              perfil: Optional[str] = None, semilla: int = 42):
+    import statistics
     
     print("="*70)
     print("PRUEBAS DE SOBRECARGA - ALGORITMO VORAZ (GREEDY)")
@@ -251,7 +622,14 @@ def pruebas_sobrecarga_greedy():
         'asignaciones_exitosas': [],
         'asignaciones_fallidas': [],
         'mejoras_locales': [],
-        'eficiencia_greedy_adaptativo': []
+        'eficiencia_greedy_adaptativo': [],
+        'perfil_fases': [],
+        'tiempos_instrumentados': [],
+        'muestras_tiempo': [],
+        'violaciones': [],
+        'cota_superior': [],
+        'brecha': [],
+        'perfil_carga': perfil
     }
     
     print(f"Configuración de pruebas:")
@@ -259,21 +637,56 @@ def pruebas_sobrecarga_greedy():
     print(f"- Aulas disponibles: {num_aulas}")
     print(f"- Horarios: 8:00-18:00, lunes a viernes")
     print(f"- Algoritmo: Greedy Adaptativo")
+    print(f"- Perfil de carga: {perfil or 'aleatorio (generador del módulo)'}")
+    print(f"- Repeticiones por tamaño: {repeticiones} (se reporta la mediana)")
     print()
     
     for tamano in tamanos_prueba:
         print(f"Probando con {tamano} clases...")
         
         try:
-            clases, aulas = generar_datos_prueba_greedy(tamano, num_aulas)
+            if perfil is None:
+                clases, aulas = generar_datos_prueba_greedy(tamano, num_aulas)
+            else:
+                from perfiles_carga import generar_perfil
+                clases, aulas = generar_perfil(perfil, tamano, num_aulas, semilla + tamano,
+                                               tipos=sys.modules[__name__])
             
-            planificador = PlanificadorVoraz(aulas)
-            
-            resultado_greedy_adaptativo, tiempo_greedy_adaptativo, memoria_greedy_adaptativo = medir_rendimiento_greedy(
-                planificador.greedy_adaptativo, clases
-            )
+            # Las repeticiones medidas corren sin instrumentar; el perfil por
+            # fase sale de una ejecución aparte que no entra en los tiempos
+            muestras_tiempo = []
+            muestras_memoria = []
+            for _ in range(repeticiones):
+                planificador = PlanificadorVoraz(aulas)
+                resultado_greedy_adaptativo, tiempo_repeticion, memoria_repeticion = medir_rendimiento_greedy(
+                    planificador.greedy_adaptativo, clases
+                )
+                muestras_tiempo.append(tiempo_repeticion)
+                muestras_memoria.append(memoria_repeticion)
+            tiempo_greedy_adaptativo = statistics.median(muestras_tiempo)
+            memoria_greedy_adaptativo = max(muestras_memoria)
             stats_greedy_adaptativo = planificador.estadisticas()
             
+            perfil_fases, tiempo_instrumentado = {}, 0.0
+            if instrumentar:
+                instrumentado = PlanificadorVoraz(aulas, instrumentar=True)
+                inicio_instrumentado = time.perf_counter()
+                instrumentado.greedy_adaptativo(clases)
+                tiempo_instrumentado = time.perf_counter() - inicio_instrumentado
+                perfil_fases = instrumentado.perfil_fases
+            
+            # Validación del horario producido (fuera del tiempo medido)
+            from validador import validar_horario
+            validacion = validar_horario(planificador.horarios_asignados, clases, aulas)
+            resultados['violaciones'].append(validacion.total)
+            
+            # Brecha de optimalidad frente a la cota superior de la instancia
+            from cotas import calcular_cotas
+            cotas = calcular_cotas(clases, aulas)
+            brecha = cotas.brecha(stats_greedy_adaptativo['clases_asignadas'])
+            resultados['cota_superior'].append(cotas.cota)
+            resultados['brecha'].append(brecha)
+            
             resultados['tamanos'].append(tamano)
             resultados['tiempos_greedy_adaptativo'].append(tiempo_greedy_adaptativo)
             resultados['memoria_greedy_adaptativo'].append(memoria_greedy_adaptativo)
@@ -282,15 +695,19 @@ def pruebas_sobrecarga_greedy():
             resultados['asignaciones_exitosas'].append(stats_greedy_adaptativo['estadisticas_greedy']['asignaciones_exitosas'])
             resultados['asignaciones_fallidas'].append(stats_greedy_adaptativo['estadisticas_greedy']['asignaciones_fallidas'])
             resultados['mejoras_locales'].append(0)  # No hay mejoras locales en el adaptativo
+            resultados['perfil_fases'].append(perfil_fases)
+            resultados['tiempos_instrumentados'].append(tiempo_instrumentado)
+            resultados['muestras_tiempo'].append(muestras_tiempo)
             
             eficiencia_greedy_adaptativo = stats_greedy_adaptativo['clases_asignadas'] / tiempo_greedy_adaptativo if tiempo_greedy_adaptativo > 0 else 0
             resultados['eficiencia_greedy_adaptativo'].append(eficiencia_greedy_adaptativo)
             
             print(f"  🎯 GREEDY ADAPTATIVO:")
-            print(f"     Tiempo: {tiempo_greedy_adaptativo:.4f}s, Memoria: {memoria_greedy_adaptativo:.2f} MB")
-            print(f"     Clases asignadas: {stats_greedy_adaptativo['clases_asignadas']}/{tamano} ({stats_greedy_adaptativo['clases_asignadas']/tamano*100:.1f}%)")
+            print(f"     Tiempo: {tiempo_greedy_adaptativo:.4f}s (máx {max(muestras_tiempo):.4f}s), Brecha: {brecha*100:.1f}%, Memoria: {memoria_greedy_adaptativo:.2f} MB")
+            print(f"     Clases asignadas: {stats_greedy_adaptativo['clases_asignadas']}/{tamano} ({stats_greedy_adaptativo['clases_asignadas']/tamano*100:.1f}%), cota superior {cotas.cota} ({cotas.restriccion_activa})")
             print(f"     Iteraciones: {stats_greedy_adaptativo['estadisticas_greedy']['iteraciones']}")
             print(f"     Eficiencia: {eficiencia_greedy_adaptativo:.2f} clases/s")
+            print(f"     Validación: {validacion.describir()}")
             print()
             
         except Exception as e:
@@ -299,6 +716,92 @@ def pruebas_sobrecarga_greedy():
     
     return resultados
 
+def pruebas_portafolio_greedy(tamanos=(200, 500, 1000), num_aulas: int = 8,
+                              perfil: Optional[str] = None, semilla: int = 42):
+    """Compara cada criterio por separado con el portafolio paralelo en calidad y tiempo de pared"""
+    print("="*70)
+    print("PORTAFOLIO DE CRITERIOS - ALGORITMO VORAZ")
+    print("="*70)
+    print(f"- Criterios: {list(CRITERIOS_GREEDY)}")
+    print(f"- Perfil de carga: {perfil or 'aleatorio (generador del módulo)'}")
+    
+    mediciones = []
+    for tamano in tamanos:
+        if perfil is None:
+            random.seed(semilla + tamano)
+            clases, aulas = generar_datos_prueba_greedy(tamano, num_aulas)
+        else:
+            from perfiles_carga import generar_perfil
+            clases, aulas = generar_perfil(perfil, tamano, num_aulas, semilla + tamano,
+                                           tipos=sys.modules[__name__])
+        
+        adaptativo = PlanificadorVoraz(aulas)
+        adaptativo.greedy_adaptativo(clases)
+        
+        portafolio = PlanificadorVoraz(aulas)
+        inicio = time.perf_counter()
+        portafolio.greedy_portafolio(clases)
+        tiempo_pared = time.perf_counter() - inicio
+        
+        tiempos = [r['tiempo'] for r in portafolio.resultados_portafolio.values()]
+        print(f"\n{tamano} clases:")
+        for criterio, resultado in portafolio.resultados_portafolio.items():
+            marca = " ← adaptativo" if criterio == adaptativo.estadisticas_greedy['criterio'] else ""
+            print(f"   {criterio:<18} {resultado['clases_asignadas']:>5} asignadas  {resultado['tiempo']:.4f}s{marca}")
+        print(f"   Portafolio: {len(portafolio.horarios_asignados)} asignadas ({portafolio.estadisticas_greedy['criterio']}) "
+              f"en {tiempo_pared:.4f}s de pared (más lento {max(tiempos):.4f}s, suma {sum(tiempos):.4f}s)")
+        print(f"   Ganancia frente al adaptativo: "
+              f"{len(portafolio.horarios_asignados) - len(adaptativo.horarios_asignados)} clases")
+        mediciones.append({
+            'tamano': tamano,
+            'criterios': portafolio.resultados_portafolio,
+            'criterio_elegido': portafolio.estadisticas_greedy['criterio'],
+            'criterio_adaptativo': adaptativo.estadisticas_greedy['criterio'],
+            'clases_asignadas_portafolio': len(portafolio.horarios_asignados),
+            'clases_asignadas_adaptativo': len(adaptativo.horarios_asignados),
+            'tiempo_pared': tiempo_pared,
+        })
+    return mediciones
+
+def pruebas_multiarranque_greedy(tamano: int = 300, k: int = 16, trabajadores=(1, 2, 4),
+                                 num_aulas: int = 8, perfil: Optional[str] = None, semilla: int = 42):
+    """Rendimiento (pasadas/s) del multiarranque por número de trabajadores y mejora frente al adaptativo"""
+    print("="*70)
+    print("MULTIARRANQUE ALEATORIZADO - ALGORITMO VORAZ")
+    print("="*70)
+    print(f"- {tamano} clases, {k} pasadas, semilla maestra {semilla}")
+    print(f"- Perfil de carga: {perfil or 'aleatorio (generador del módulo)'}")
+    print(f"- Núcleos disponibles: {os.cpu_count()}")
+    
+    if perfil is None:
+        random.seed(semilla)
+        clases, aulas = generar_datos_prueba_greedy(tamano, num_aulas)
+    else:
+        from perfiles_carga import generar_perfil
+        clases, aulas = generar_perfil(perfil, tamano, num_aulas, semilla, tipos=sys.modules[__name__])
+    
+    adaptativo = PlanificadorVoraz(aulas)
+    adaptativo.greedy_adaptativo(clases)
+    print(f"\nAdaptativo (una pasada determinista): {len(adaptativo.horarios_asignados)} asignadas")
+    
+    mediciones = []
+    for numero in trabajadores:
+        planificador = PlanificadorVoraz(aulas)
+        planificador.greedy_multiarranque(clases, k, semilla, trabajadores=numero)
+        resultado = planificador.resultados_multiarranque
+        print(f"   {numero} trabajador(es): {resultado['pasadas_por_segundo']:.2f} pasadas/s, "
+              f"mejor {len(planificador.horarios_asignados)} asignadas (pasada {resultado['mejor_pasada']}), "
+              f"rango [{min(resultado['asignadas_por_pasada'])}, {max(resultado['asignadas_por_pasada'])}]")
+        mediciones.append(dict(resultado, trabajadores=numero,
+                               clases_asignadas=len(planificador.horarios_asignados)))
+    
+    reproducible = len({(m['mejor_pasada'], m['clases_asignadas']) for m in mediciones}) == 1
+    print(f"   Reproducible entre números de trabajadores: {'✅' if reproducible else '❌'}")
+    if len(mediciones) > 1 and mediciones[0]['pasadas_por_segundo'] > 0:
+        print(f"   Aceleración con {mediciones[-1]['trabajadores']} trabajadores: "
+              f"{mediciones[-1]['pasadas_por_segundo'] / mediciones[0]['pasadas_por_segundo']:.2f}x")
+    return mediciones
+
 def analisis_cuellos_botella_greedy(resultados):
     
     print("="*70)
@@ -315,8 +818,9 @@ def analisis_cuellos_botella_greedy(resultados):
         if tiempos[j-1] > 0:
             factor_tiempo = tiempos[j] / tiempos[j-1]
             factor_tamano = resultados['tamanos'][j] / resultados['tamanos'][j-1]
+            exponente_local = math.log(factor_tiempo) / math.log(factor_tamano) if factor_tiempo > 0 else 0
             print(f"     {resultados['tamanos'][j-1]} → {resultados['tamanos'][j]} clases: "
-                  f"tiempo {factor_tiempo:.2f}x, tamaño {factor_tamano:.2f}x")
+                  f"tiempo {factor_tiempo:.2f}x, tamaño {factor_tamano:.2f}x (exponente local {exponente_local:.2f})")
     
     print("\n2. USO DE MEMORIA:")
     memorias = resultados['memoria_greedy_adaptativo']
@@ -348,19 +852,15 @@ def analisis_cuellos_botella_greedy(resultados):
         indice_mejoras = resultados['mejoras_locales'].index(mejoras_maximas)
         print(f"   Mejoras locales máximas: {mejoras_maximas} con {resultados['tamanos'][indice_mejoras]} clases")
     
-    print("\n5. CUELLOS DE BOTELLA IDENTIFICADOS:")
-    tiempos = resultados['tiempos_greedy_adaptativo']
-    if len(tiempos) > 2:
-        crecimiento_tiempo = []
-        for j in range(1, len(tiempos)):
-            if tiempos[j-1] > 0:
-                crecimiento = tiempos[j] / tiempos[j-1]
-                crecimiento_tiempo.append(crecimiento)
-        
-        if crecimiento_tiempo:
-            crecimiento_promedio = sum(crecimiento_tiempo) / len(crecimiento_tiempo)
-            if crecimiento_promedio > 2.0:
-                print(f"   ⚠️  CRECIMIENTO TEMPORAL: {crecimiento_promedio:.2f}x por duplicación")
+    print("\n5. CUELLOS DE BOTELLA IDENTIFICADOS (ajuste log-log y ≈ a·n^b):")
+    from analisis_complejidad import ajustar_resultados, imprimir_ajustes
+    ajustes = ajustar_resultados(
+        resultados['tamanos'], resultados['tiempos_greedy_adaptativo'],
+        muestras_tiempo=resultados.get('muestras_tiempo'),
+        memoria=resultados['memoria_greedy_adaptativo'],
+        perfiles=resultados.get('perfil_fases')
+    )
+    imprimir_ajustes(ajustes, resultados['tamanos'])
     
     eficiencias = resultados['eficiencia_greedy_adaptativo']
     if len(eficiencias) > 2:
@@ -371,123 +871,28 @@ def analisis_cuellos_botella_greedy(resultados):
             if decrecimiento < 0.5:
                 print(f"   ⚠️  DECRECIMIENTO DE EFICIENCIA: {decrecimiento:.2f}x al final")
 
-def crear_visualizaciones_greedy(resultados):
+    if resultados.get('perfil_fases') and resultados['perfil_fases'][-1]:
+        print("\n6. PERFIL POR FASE (ejecución instrumentada aparte, tamaño mayor):")
+        from analisis_complejidad import imprimir_perfil_fases
+        imprimir_perfil_fases(resultados['perfil_fases'][-1], resultados['tiempos_instrumentados'][-1])
+
+def crear_visualizaciones_greedy(resultados, ruta_resultados='resultados_greedy.json', segundo_plano=False):
     
     if not resultados['tamanos']:
         print("No hay datos para visualizar")
-        return
+        return None
     
+    from visualizaciones import guardar_resultados, renderizar_greedy, renderizar_en_segundo_plano
+    
+    guardar_resultados(resultados, ruta_resultados)
+    print(f"Resultados guardados en {ruta_resultados}")
     print("Generando visualizaciones para Algoritmo Voraz...")
     
-    fig, axes = plt.subplots(3, 3, figsize=(20, 15))
-    fig.suptitle('Análisis de Sobrecarga - Algoritmo Voraz (Greedy)', fontsize=16, fontweight='bold')
-    
-    axes[0, 0].plot(resultados['tamanos'], resultados['tiempos_greedy_adaptativo'], 'g-^', label='Greedy Adaptativo', linewidth=2, markersize=6)
-    axes[0, 0].set_xlabel('Número de Clases')
-    axes[0, 0].set_ylabel('Tiempo de Ejecución (segundos)')
-    axes[0, 0].set_title('Escalabilidad Temporal')
-    axes[0, 0].legend()
-    axes[0, 0].grid(True, alpha=0.3)
-    
-    axes[0, 1].plot(resultados['tamanos'], resultados['memoria_greedy_adaptativo'], 'g-^', label='Greedy Adaptativo', linewidth=2, markersize=6)
-    axes[0, 1].set_xlabel('Número de Clases')
-    axes[0, 1].set_ylabel('Uso de Memoria (MB)')
-    axes[0, 1].set_title('Consumo de Memoria')
-    axes[0, 1].legend()
-    axes[0, 1].grid(True, alpha=0.3)
-    
-    axes[0, 2].plot(resultados['tamanos'], resultados['clases_asignadas_greedy_adaptativo'], 'g-^', label='Greedy Adaptativo', linewidth=2, markersize=6)
-    axes[0, 2].plot(resultados['tamanos'], resultados['tamanos'], 'k--', alpha=0.5, label='Máximo teórico')
-    axes[0, 2].set_xlabel('Número de Clases')
-    axes[0, 2].set_ylabel('Clases Asignadas')
-    axes[0, 2].set_title('Eficiencia en Asignación')
-    axes[0, 2].legend()
-    axes[0, 2].grid(True, alpha=0.3)
-    
-    axes[1, 0].plot(resultados['tamanos'], resultados['eficiencia_greedy_adaptativo'], 'g-^', label='Greedy Adaptativo', linewidth=2, markersize=6)
-    axes[1, 0].set_xlabel('Número de Clases')
-    axes[1, 0].set_ylabel('Eficiencia (clases/segundo)')
-    axes[1, 0].set_title('Ratio de Eficiencia')
-    axes[1, 0].legend()
-    axes[1, 0].grid(True, alpha=0.3)
-    
-    axes[1, 1].plot(resultados['tamanos'], resultados['iteraciones'], 'm-d', linewidth=2, markersize=6)
-    axes[1, 1].set_xlabel('Número de Clases')
-    axes[1, 1].set_ylabel('Iteraciones')
-    axes[1, 1].set_title('Comportamiento Iterativo')
-    axes[1, 1].grid(True, alpha=0.3)
-    
-    axes[1, 2].plot(resultados['tamanos'], resultados['asignaciones_exitosas'], 'g-o', label='Exitosas', linewidth=2, markersize=6)
-    axes[1, 2].plot(resultados['tamanos'], resultados['asignaciones_fallidas'], 'r-s', label='Fallidas', linewidth=2, markersize=6)
-    axes[1, 2].set_xlabel('Número de Clases')
-    axes[1, 2].set_ylabel('Número de Asignaciones')
-    axes[1, 2].set_title('Éxito vs Fallo en Asignaciones')
-    axes[1, 2].legend()
-    axes[1, 2].grid(True, alpha=0.3)
-    
-    axes[2, 0].plot(resultados['tamanos'], resultados['mejoras_locales'], 'c-p', linewidth=2, markersize=6)
-    axes[2, 0].set_xlabel('Número de Clases')
-    axes[2, 0].set_ylabel('Mejoras Locales')
-    axes[2, 0].set_title('Optimización Local')
-    axes[2, 0].grid(True, alpha=0.3)
-    
-    axes[2, 1].loglog(resultados['tamanos'], resultados['tiempos_greedy_adaptativo'], 'g-^', label='Greedy Adaptativo')
-    axes[2, 1].set_xlabel('Número de Clases (log)')
-    axes[2, 1].set_ylabel('Tiempo (log)')
-    axes[2, 1].set_title('Análisis Logarítmico - Tiempo')
-    axes[2, 1].legend()
-    axes[2, 1].grid(True, alpha=0.3)
-    
-    # 9. Tendencia de eficiencia
-    axes[2, 2].plot(resultados['tamanos'], resultados['eficiencia_greedy_adaptativo'], 'g-^', label='Tendencia de Eficiencia')
-    axes[2, 2].set_xlabel('Número de Clases')
-    axes[2, 2].set_ylabel('Eficiencia (clases/segundo)')
-    axes[2, 2].set_title('Tendencia de Eficiencia')
-    axes[2, 2].legend()
-    axes[2, 2].grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('sobrecarga_algoritmo_voraz.png', dpi=300, bbox_inches='tight')
-    plt.show()
-    
-    # Gráfica adicional: Análisis detallado de comportamiento
-    plt.figure(figsize=(15, 10))
-    
-    plt.subplot(2, 2, 1)
-    plt.semilogx(resultados['tamanos'], resultados['eficiencia_greedy_adaptativo'], 'g-^', label='Greedy Adaptativo')
-    plt.xlabel('Número de Clases (log)')
-    plt.ylabel('Eficiencia (clases/segundo)')
-    plt.title('Eficiencia vs Tamaño (Log)')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 2, 2)
-    plt.semilogx(resultados['tamanos'], resultados['iteraciones'], 'm-d', linewidth=2, markersize=6)
-    plt.xlabel('Número de Clases (log)')
-    plt.ylabel('Iteraciones')
-    plt.title('Iteraciones vs Tamaño')
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 2, 3)
-    if resultados['asignaciones_exitosas'] and resultados['asignaciones_fallidas']:
-        ratio_exito = [e/(e+f) if (e+f) > 0 else 0 for e, f in zip(resultados['asignaciones_exitosas'], resultados['asignaciones_fallidas'])]
-        plt.semilogx(resultados['tamanos'], ratio_exito, 'c-p', linewidth=2, markersize=6)
-        plt.xlabel('Número de Clases (log)')
-        plt.ylabel('Ratio de Éxito')
-        plt.title('Ratio de Éxito en Asignaciones')
-        plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 2, 4)
-    plt.semilogx(resultados['tamanos'], resultados['memoria_greedy_adaptativo'], 'g-^', label='Greedy Adaptativo')
-    plt.xlabel('Número de Clases (log)')
-    plt.ylabel('Memoria (MB)')
-    plt.title('Memoria vs Tamaño')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('analisis_detallado_greedy.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    if segundo_plano:
+        return renderizar_en_segundo_plano('greedy', ruta_resultados)
+    
+    renderizar_greedy(ruta_resultados)
+    return None
 
 def main():
     
@@ -506,15 +911,19 @@ def main():
     # Analizar cuellos de botella
     analisis_cuellos_botella_greedy(resultados)
     
-    # Crear visualizaciones
-    crear_visualizaciones_greedy(resultados)
+    # Crear visualizaciones (renderizadas en otro proceso)
+    proceso_graficas = crear_visualizaciones_greedy(resultados, segundo_plano=True)
     
     print("="*70)
     print("PRUEBAS DE SOBRECARGA COMPLETADAS")
     print("="*70)
+    if proceso_graficas is not None:
+        proceso_graficas.join()
     print("Archivos generados:")
+    print("- resultados_greedy.json")
     print("- sobrecarga_algoritmo_voraz.png")
     print("- analisis_detallado_greedy.png")
+    print("- perfil_fases_greedy.png")
     print()
 if __name__ == "__main__":
     main()
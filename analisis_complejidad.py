@@ -0,0 +1,226 @@
+"""
+Ajuste empírico de complejidad por regresión log-log.
+
+Estima el exponente b de y ≈ a · n^b por mínimos cuadrados sobre (log n, log y).
+Usa todas las repeticiones de cada tamaño como observaciones independientes y
+calcula un intervalo de confianza para el exponente. Con los ajustes se
+predicen valores en tamaños no medidos y se calcula el tamaño de cruce real
+entre dos planificadores, en lugar de promediar cocientes entre tamaños
+consecutivos que no son duplicaciones.
+"""
+
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Exponente local de referencia: log n crece como n^(1/ln n) ≈ n^0.15 en los
+# tamaños medidos (~1000), igual que n log n ≈ n^1.15
+CLASES_COMPLEJIDAD = [
+    ('O(1)', 0.0),
+    ('O(log n)', 0.15),
+    ('O(√n)', 0.5),
+    ('O(n)', 1.0),
+    ('O(n log n)', 1.15),
+    ('O(n²)', 2.0),
+    ('O(n² log n)', 2.15),
+    ('O(n³)', 3.0),
+]
+
+
+@dataclass
+class AjustePotencia:
+    coeficiente: float
+    exponente: float
+    intervalo_exponente: Tuple[float, float]
+    r2: float
+    observaciones: int
+    confianza: float = 0.95
+
+    def predecir(self, n):
+        """Valor estimado para uno o varios tamaños"""
+        return self.coeficiente * np.asarray(n, dtype=float) ** self.exponente
+
+    def clase_cercana(self) -> str:
+        return min(CLASES_COMPLEJIDAD, key=lambda clase: abs(clase[1] - self.exponente))[0]
+
+    def es_superlineal(self) -> bool:
+        """El exponente es mayor que 1 con la confianza pedida"""
+        return self.intervalo_exponente[0] > 1.0
+
+    def describir(self) -> str:
+        inferior, superior = self.intervalo_exponente
+        return (f"n^{self.exponente:.2f} (IC{self.confianza * 100:.0f}% [{inferior:.2f}, {superior:.2f}], "
+                f"R²={self.r2:.3f}, ~{self.clase_cercana()})")
+
+
+def _cuantil_t(p: float, grados_libertad: int) -> float:
+    """Cuantil de la t de Student (exacto para 1 y 2 g.l., Cornish-Fisher para el resto)"""
+    if grados_libertad == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if grados_libertad == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    z = NormalDist().inv_cdf(p)
+    g = grados_libertad
+    return (z + (z**3 + z) / (4 * g) + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * g**2)
+            + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * g**3))
+
+
+def ajustar_potencia(tamanos: Sequence[float], valores: Sequence[float],
+                     confianza: float = 0.95) -> Optional[AjustePotencia]:
+    """
+    Ajusta y ≈ a · n^b. `tamanos` puede repetir valores (una entrada por repetición).
+
+    Los valores no positivos se descartan (no tienen logaritmo). Devuelve None
+    si quedan menos de dos tamaños distintos.
+    """
+    n = np.asarray(tamanos, dtype=float)
+    y = np.asarray(valores, dtype=float)
+    validos = (n > 0) & (y > 0) & np.isfinite(y)
+    n, y = n[validos], y[validos]
+    if np.unique(n).size < 2:
+        return None
+
+    x = np.log(n)
+    log_y = np.log(y)
+    matriz = np.column_stack([np.ones_like(x), x])
+    (intercepto, exponente), _, _, _ = np.linalg.lstsq(matriz, log_y, rcond=None)
+
+    residuos = log_y - (intercepto + exponente * x)
+    suma_residuos = float(residuos @ residuos)
+    suma_total = float(((log_y - log_y.mean()) ** 2).sum())
+    r2 = 1.0 - suma_residuos / suma_total if suma_total > 0 else 1.0
+
+    grados_libertad = x.size - 2
+    if grados_libertad > 0:
+        error_estandar = math.sqrt(suma_residuos / grados_libertad / float(((x - x.mean()) ** 2).sum()))
+        margen = _cuantil_t(0.5 + confianza / 2, grados_libertad) * error_estandar
+    else:
+        margen = float('inf')
+
+    return AjustePotencia(
+        coeficiente=float(math.exp(intercepto)),
+        exponente=float(exponente),
+        intervalo_exponente=(float(exponente - margen), float(exponente + margen)),
+        r2=r2,
+        observaciones=int(x.size),
+        confianza=confianza,
+    )
+
+
+def aplanar_repeticiones(tamanos: Sequence[int], muestras: Sequence[Sequence[float]]) -> Tuple[List[int], List[float]]:
+    """Convierte [tamaño] + [[rep1, rep2, ...]] en listas paralelas de observaciones"""
+    tamanos_planos, valores = [], []
+    for tamano, repeticiones in zip(tamanos, muestras):
+        for valor in repeticiones:
+            tamanos_planos.append(tamano)
+            valores.append(valor)
+    return tamanos_planos, valores
+
+
+def punto_cruce(ajuste_a: AjustePotencia, ajuste_b: AjustePotencia) -> Optional[float]:
+    """
+    Tamaño n en el que ambos ajustes predicen el mismo valor.
+
+    Devuelve None si los exponentes son iguales (curvas paralelas en log-log).
+    """
+    diferencia = ajuste_a.exponente - ajuste_b.exponente
+    if abs(diferencia) < 1e-12:
+        return None
+    return math.exp((math.log(ajuste_b.coeficiente) - math.log(ajuste_a.coeficiente)) / diferencia)
+
+
+def imprimir_ajuste(nombre: str, ajuste: Optional[AjustePotencia], unidad: str = '',
+                    tamanos_prediccion: Sequence[int] = ()):
+    if ajuste is None:
+        print(f"   {nombre}: datos insuficientes para el ajuste")
+        return
+    print(f"   {nombre} ~ {ajuste.describir()}")
+    for tamano in tamanos_prediccion:
+        print(f"      predicción para {tamano} clases: {float(ajuste.predecir(tamano)):.4g}{unidad}")
+
+
+def ajustar_resultados(tamanos: Sequence[int], tiempos: Sequence[float],
+                       muestras_tiempo: Optional[Sequence[Sequence[float]]] = None,
+                       memoria: Optional[Sequence[float]] = None,
+                       perfiles: Optional[Sequence[dict]] = None,
+                       extras: Optional[dict] = None,
+                       confianza: float = 0.95) -> dict:
+    """
+    Ajusta tiempo, memoria, sondeos/comparaciones de conflicto (del perfil por
+    fase) y cualquier serie adicional de un diccionario de resultados.
+    """
+    ajustes = {}
+    if muestras_tiempo:
+        ajustes['tiempo'] = ajustar_potencia(*aplanar_repeticiones(tamanos, muestras_tiempo), confianza)
+    else:
+        ajustes['tiempo'] = ajustar_potencia(tamanos, tiempos, confianza)
+    if memoria is not None:
+        ajustes['memoria'] = ajustar_potencia(tamanos, memoria, confianza)
+    if perfiles and all('verificacion_conflictos' in perfil for perfil in perfiles):
+        verificaciones = [perfil['verificacion_conflictos'] for perfil in perfiles]
+        ajustes['sondeos_conflicto'] = ajustar_potencia(
+            tamanos, [v['llamadas'] for v in verificaciones], confianza)
+        ajustes['comparaciones_conflicto'] = ajustar_potencia(
+            tamanos, [v['comparaciones'] for v in verificaciones], confianza)
+    for nombre, valores in (extras or {}).items():
+        ajustes[nombre] = ajustar_potencia(tamanos, valores, confianza)
+    return ajustes
+
+
+def imprimir_ajustes(ajustes: dict, tamanos: Sequence[int]):
+    """Imprime cada ajuste, la predicción de tiempo en tamaños no medidos y alertas de superlinealidad"""
+    unidades = {'tiempo': 's', 'memoria': ' MB'}
+    tamanos_prediccion = [max(tamanos) * 2, max(tamanos) * 10] if tamanos else []
+    for nombre, ajuste in ajustes.items():
+        imprimir_ajuste(nombre, ajuste, unidades.get(nombre, ''),
+                        tamanos_prediccion if nombre == 'tiempo' else ())
+        if ajuste is not None and ajuste.es_superlineal():
+            print(f"      ⚠️  CRECIMIENTO SUPERLINEAL: exponente > 1 con "
+                  f"{ajuste.confianza * 100:.0f}% de confianza")
+
+
+def imprimir_perfil_fases(perfil: dict, tiempo_total: float):
+    """Imprime tiempo, llamadas y porcentaje del tiempo total de cada fase instrumentada"""
+    for fase, datos in sorted(perfil.items(), key=lambda item: item[1]['tiempo'], reverse=True):
+        porcentaje = datos['tiempo'] / tiempo_total * 100 if tiempo_total > 0 else 0
+        linea = f"   {fase}: {datos['tiempo']:.4f}s ({porcentaje:.1f}%), {datos['llamadas']} llamadas"
+        if 'comparaciones' in datos and datos['llamadas'] > 0:
+            linea += (f", {datos['comparaciones']} comparaciones "
+                      f"({datos['comparaciones'] / datos['llamadas']:.1f} por sondeo)")
+        print(linea)
+
+
+def ajustar_elasticidades(variables: dict, valores: Sequence[float]) -> Optional[dict]:
+    """
+    Ajusta y ≈ a · Π x_k^b_k por mínimos cuadrados en escala log.
+
+    `variables` es {nombre: [x por observación]}. Cada b_k es la elasticidad
+    de y respecto a x_k manteniendo fijas las demás dimensiones. Las
+    variables que no varían se omiten. Devuelve {'elasticidades': {nombre: b_k},
+    'coeficiente': a, 'r2': R²} o None si no hay observaciones suficientes.
+    """
+    y = np.asarray(valores, dtype=float)
+    columnas = {nombre: np.asarray(x, dtype=float) for nombre, x in variables.items()}
+    validos = (y > 0) & np.isfinite(y)
+    for x in columnas.values():
+        validos &= x > 0
+    columnas = {nombre: x[validos] for nombre, x in columnas.items()
+                if np.unique(x[validos]).size > 1}
+    y = y[validos]
+    if not columnas or y.size <= len(columnas) + 1:
+        return None
+
+    log_y = np.log(y)
+    matriz = np.column_stack([np.ones_like(log_y)] + [np.log(x) for x in columnas.values()])
+    coeficientes, _, _, _ = np.linalg.lstsq(matriz, log_y, rcond=None)
+    residuos = log_y - matriz @ coeficientes
+    suma_total = float(((log_y - log_y.mean()) ** 2).sum())
+    r2 = 1.0 - float(residuos @ residuos) / suma_total if suma_total > 0 else 1.0
+    return {
+        'elasticidades': dict(zip(columnas, (float(b) for b in coeficientes[1:]))),
+        'coeficiente': float(math.exp(coeficientes[0])),
+        'r2': r2,
+    }
@@ -0,0 +1,330 @@
+"""
+Analítica de utilización del horario con tensores de NumPy.
+
+`estadisticas()` de los planificadores solo suma horas por aula. Aquí un
+horario se resume en tensores aula × día × hora (10 franjas de 8:00 a 18:00):
+
+- `ocupacion`: clases en curso en cada celda (más de 1 indica un conflicto)
+- `asientos`: estudiantes sentados en cada celda, para el ratio
+  estudiantes / capacidad
+- `demanda` (opcional): clases que prefieren cada franja día × hora, asignadas
+  o no, frente al número de aulas (contención en horas pico)
+
+Los tensores se construyen en una pasada vectorizada con `np.bincount` sobre
+las columnas de las asignaciones: directamente desde un archivo columnar
+(`formato_columnar`), desde los objetos de un planificador o desde los bits de
+un `IndiceOcupacion`. Un millón de asignaciones se resume en décimas de
+segundo. Los mapas de calor se renderizan en `visualizaciones.py`.
+
+Uso:
+    python analitica_utilizacion.py --clases 3000 --aulas 40 --masivo 1000000
+"""
+
+import argparse
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from formato_columnar import DIAS
+from indice_ocupacion import HORA_APERTURA, HORA_CIERRE
+
+HORAS = HORA_CIERRE - HORA_APERTURA
+CELDAS_AULA = len(DIAS) * HORAS
+
+
+def _acumular(indices, duracion, minimo, pesos=None):
+    """
+    Suma sobre las celdas [indice, indice + duracion) de cada asignación. Se
+    hace una pasada de bincount por hora de duración, no por asignación.
+    """
+    total = np.zeros(minimo, dtype=np.int64 if pesos is not None else np.int32)
+    for desplazamiento in range(int(duracion.max(initial=0))):
+        seleccion = duracion > desplazamiento
+        total += np.bincount(indices[seleccion] + desplazamiento,
+                             weights=None if pesos is None else pesos[seleccion],
+                             minlength=minimo).astype(total.dtype)
+    return total
+
+
+def _demanda(dia_preferido, hora_preferida, duracion) -> np.ndarray:
+    """Clases que prefieren cada celda día × hora"""
+    hora = np.clip(np.asarray(hora_preferida, dtype=np.int64), HORA_APERTURA, HORA_CIERRE - 1) - HORA_APERTURA
+    duracion = np.minimum(np.asarray(duracion, dtype=np.int64), HORAS - hora)
+    indices = np.asarray(dia_preferido, dtype=np.int64) * HORAS + hora
+    return _acumular(indices, duracion, CELDAS_AULA).reshape(len(DIAS), HORAS)
+
+
+class AnaliticaUtilizacion:
+    """Tensores aula × día × hora de un horario y las métricas derivadas"""
+
+    def __init__(self, ids_aulas: List[str], capacidades, ocupacion, asientos=None, demanda=None):
+        self.ids_aulas = list(ids_aulas)
+        self.capacidades = np.asarray(capacidades, dtype=np.int64)
+        self.ocupacion = ocupacion
+        self.asientos = asientos
+        self.demanda = demanda
+
+    # --- Construcción ---
+
+    @classmethod
+    def desde_columnas(cls, aula, dia, hora_inicio, hora_fin, capacidades, estudiantes=None,
+                       ids_aulas=None, demanda=None) -> 'AnaliticaUtilizacion':
+        """
+        `aula` es la fila de cada asignación en `capacidades`, `dia` el índice
+        0-4; `estudiantes` (por asignación) habilita el ratio de asientos.
+        """
+        num_aulas = len(capacidades)
+        inicio = np.asarray(hora_inicio, dtype=np.int64)
+        duracion = np.asarray(hora_fin, dtype=np.int64) - inicio
+        indices = ((np.asarray(aula, dtype=np.int64) * len(DIAS) + np.asarray(dia, dtype=np.int64)) * HORAS
+                   + inicio - HORA_APERTURA)
+        forma = (num_aulas, len(DIAS), HORAS)
+        ocupacion = _acumular(indices, duracion, num_aulas * CELDAS_AULA).reshape(forma)
+        asientos = None
+        if estudiantes is not None:
+            asientos = _acumular(indices, duracion, num_aulas * CELDAS_AULA,
+                                 np.asarray(estudiantes, dtype=np.float64)).reshape(forma)
+        ids_aulas = ids_aulas if ids_aulas is not None else [str(i) for i in range(num_aulas)]
+        return cls(ids_aulas, capacidades, ocupacion, asientos, demanda)
+
+    @classmethod
+    def desde_columnar(cls, horario, demanda: bool = True) -> 'AnaliticaUtilizacion':
+        """Desde un `formato_columnar.HorarioColumnar` sin materializar objetos"""
+        s, c, a = horario.asignaciones, horario.clases, horario.aulas
+        cadenas = horario.cadenas
+        clase = np.asarray(s['clase'], dtype=np.int64)
+        return cls.desde_columnas(
+            s['aula'], s['dia'], s['hora_inicio'], s['hora_fin'], a['capacidad'],
+            estudiantes=np.asarray(c['estudiantes'])[clase],
+            ids_aulas=[cadenas[i] for i in a['id'].tolist()],
+            demanda=_demanda(c['dia_preferido'], c['hora_preferida'], c['duracion']) if demanda else None)
+
+    @classmethod
+    def desde_horario(cls, horarios, aulas, clases=None) -> 'AnaliticaUtilizacion':
+        """
+        Desde los objetos de un planificador en una sola pasada. Con `clases`
+        (todas, asignadas o no) calcula también la demanda por franja.
+        """
+        fila_aula = {a.id: i for i, a in enumerate(aulas)}
+        dia = {nombre: i for i, nombre in enumerate(DIAS)}
+        n = len(horarios)
+        columnas = np.fromiter(
+            (valor for h in horarios
+             for valor in (fila_aula[h.aula.id], dia[h.dia.name], h.hora_inicio, h.hora_fin, h.clase.estudiantes)),
+            dtype=np.int64, count=5 * n).reshape(n, 5)
+        demanda = None
+        if clases is not None:
+            preferencias = np.fromiter(
+                (valor for c in clases
+                 for valor in (dia[c.horario_preferido[0].name], c.horario_preferido[1], c.duracion)),
+                dtype=np.int64, count=3 * len(clases)).reshape(len(clases), 3)
+            demanda = _demanda(*preferencias.T)
+        return cls.desde_columnas(*columnas[:, :4].T, [a.capacidad for a in aulas], estudiantes=columnas[:, 4],
+                                  ids_aulas=[a.id for a in aulas], demanda=demanda)
+
+    @classmethod
+    def desde_ocupacion(cls, indice, aulas) -> 'AnaliticaUtilizacion':
+        """
+        Desde los bits de un `IndiceOcupacion`: solo ocupación (el índice no
+        guarda estudiantes, así que no hay ratio de asientos).
+        """
+        bits = np.array([[indice.aulas.get((a.id, nombre), 0) for nombre in DIAS] for a in aulas],
+                        dtype=np.int64).reshape(len(aulas), len(DIAS))
+        ocupacion = ((bits[..., None] >> np.arange(HORAS)) & 1).astype(np.int32)
+        return cls([a.id for a in aulas], [a.capacidad for a in aulas], ocupacion)
+
+    # --- Métricas ---
+
+    @property
+    def ocupada(self) -> np.ndarray:
+        return self.ocupacion > 0
+
+    def utilizacion_aula(self) -> np.ndarray:
+        """Fracción de las 50 horas semanales en que cada aula está ocupada"""
+        return self.ocupada.sum(axis=(1, 2)) / CELDAS_AULA
+
+    def utilizacion_franja(self) -> np.ndarray:
+        """Fracción de aulas ocupadas en cada celda día × hora"""
+        if not self.ids_aulas:
+            return np.zeros((len(DIAS), HORAS))
+        return self.ocupada.mean(axis=0)
+
+    def ratio_asientos(self) -> Optional[np.ndarray]:
+        """
+        Estudiantes / capacidad por celda aula × día × hora (NaN si el aula
+        está libre; con conflictos, la media de las clases de la celda)
+        """
+        if self.asientos is None:
+            return None
+        capacidad = self.ocupacion * self.capacidades[:, None, None]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.ocupada, self.asientos / capacidad, np.nan)
+
+    def ratio_asientos_franja(self) -> Optional[np.ndarray]:
+        """Asientos ocupados / asientos de las aulas en uso, por celda día × hora"""
+        if self.asientos is None:
+            return None
+        capacidad_en_uso = (self.ocupacion * self.capacidades[:, None, None]).sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(capacidad_en_uso > 0, self.asientos.sum(axis=0) / capacidad_en_uso, np.nan)
+
+    def ratio_asientos_aula(self) -> Optional[np.ndarray]:
+        if self.asientos is None:
+            return None
+        horas = self.ocupacion.sum(axis=(1, 2))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(horas > 0, self.asientos.sum(axis=(1, 2)) / (horas * self.capacidades), np.nan)
+
+    def contencion(self) -> np.ndarray:
+        """
+        Clases que prefieren cada celda por aula disponible (si hay demanda);
+        si no, la fracción de aulas ocupadas. Valores > 1 no caben a esa hora.
+        """
+        if self.demanda is None or not self.ids_aulas:
+            return self.utilizacion_franja()
+        return self.demanda / len(self.ids_aulas)
+
+    def horas_pico(self, cantidad: int = 5) -> List[Dict]:
+        """Las celdas día × hora de mayor contención"""
+        contencion = self.contencion()
+        utilizacion = self.utilizacion_franja()
+        orden = np.argsort(-contencion, axis=None, kind='stable')[:cantidad]
+        picos = []
+        for indice in orden.tolist():
+            dia, hora = divmod(indice, HORAS)
+            pico = {'dia': DIAS[dia], 'hora': HORA_APERTURA + hora,
+                    'contencion': float(contencion[dia, hora]), 'utilizacion': float(utilizacion[dia, hora])}
+            if self.demanda is not None:
+                pico['demanda'] = int(self.demanda[dia, hora])
+            picos.append(pico)
+        return picos
+
+    def conflictos(self) -> int:
+        """Celdas aula × día × hora con más de una clase"""
+        return int((self.ocupacion > 1).sum())
+
+    def resumen(self) -> Dict:
+        utilizacion = self.utilizacion_aula()
+        ratio = self.ratio_asientos_aula()
+        resumen = {
+            'aulas': len(self.ids_aulas),
+            'horas_ocupadas': int(self.ocupada.sum()),
+            'horas_disponibles': len(self.ids_aulas) * CELDAS_AULA,
+            'utilizacion_media': float(utilizacion.mean()) if len(utilizacion) else 0.0,
+            'aulas_sin_uso': int((utilizacion == 0).sum()),
+            'conflictos': self.conflictos(),
+            'horas_pico': self.horas_pico(3),
+        }
+        if ratio is not None:
+            resumen['ratio_asientos_medio'] = float(np.nanmean(ratio)) if np.isfinite(ratio).any() else 0.0
+        return resumen
+
+    def a_resultados(self, max_aulas: int = 40) -> Dict:
+        """
+        Resultados en JSON para `visualizaciones.renderizar_utilizacion`: las
+        matrices día × hora y las `max_aulas` aulas más usadas (aula × franja).
+        """
+        _lista = lambda matriz: None if matriz is None else np.where(np.isnan(matriz), None, matriz).tolist()
+        utilizacion = self.utilizacion_aula()
+        filas = np.argsort(-utilizacion, kind='stable')[:max_aulas]
+        ratio = self.ratio_asientos()
+        return {
+            'dias': list(DIAS),
+            'horas': list(range(HORA_APERTURA, HORA_CIERRE)),
+            'resumen': self.resumen(),
+            'utilizacion_franja': self.utilizacion_franja().tolist(),
+            'ratio_asientos_franja': _lista(self.ratio_asientos_franja()),
+            'contencion': self.contencion().tolist(),
+            'demanda': None if self.demanda is None else self.demanda.tolist(),
+            'aulas': [self.ids_aulas[i] for i in filas.tolist()],
+            'capacidades': self.capacidades[filas].tolist(),
+            'ocupacion_aulas': self.ocupacion[filas].reshape(len(filas), CELDAS_AULA).tolist(),
+            'ratio_asientos_aulas': None if ratio is None else _lista(ratio[filas].reshape(len(filas), CELDAS_AULA)),
+        }
+
+
+def crear_visualizaciones_utilizacion(analitica: AnaliticaUtilizacion, ruta_resultados='resultados_utilizacion.json',
+                                      segundo_plano=False):
+    from visualizaciones import guardar_resultados, renderizar_en_segundo_plano, renderizar_utilizacion
+    guardar_resultados(analitica.a_resultados(), ruta_resultados)
+    if segundo_plano:
+        return renderizar_en_segundo_plano('utilizacion', ruta_resultados)
+    renderizar_utilizacion(ruta_resultados)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tensores de utilización y mapas de calor del horario")
+    parser.add_argument('--clases', type=int, default=3000)
+    parser.add_argument('--aulas', type=int, default=40)
+    parser.add_argument('--profesores', type=int, default=300)
+    parser.add_argument('--masivo', type=int, default=1_000_000, help="Asignaciones sintéticas columnares (0 = omitir)")
+    parser.add_argument('--aulas-masivo', type=int, default=5000)
+    parser.add_argument('--graficas', action='store_true', help="Renderizar mapas de calor (resultados_utilizacion.json)")
+    parser.add_argument('--semilla', type=int, default=42)
+    args = parser.parse_args()
+
+    import random
+    import algoritmo_voraz
+    from indice_ocupacion import IndiceOcupacion
+
+    random.seed(args.semilla)
+    clases, aulas = algoritmo_voraz.generar_datos_prueba_greedy(args.clases, args.aulas,
+                                                                num_profesores=args.profesores)
+    planificador = algoritmo_voraz.PlanificadorVoraz(aulas)
+    horarios = planificador.replanificar(clases, [])
+
+    inicio = time.perf_counter()
+    analitica = AnaliticaUtilizacion.desde_horario(horarios, aulas, clases)
+    tiempo_objetos = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    desde_bits = AnaliticaUtilizacion.desde_ocupacion(IndiceOcupacion.desde_horarios(horarios), aulas)
+    tiempo_bits = time.perf_counter() - inicio
+    iguales = np.array_equal(analitica.ocupacion, desde_bits.ocupacion)
+
+    horas_lineal = planificador.estadisticas()['utilizacion_aulas']
+    horas_tensor = dict(zip(analitica.ids_aulas, analitica.ocupacion.sum(axis=(1, 2)).tolist()))
+    print(f"{len(horarios)} de {len(clases)} clases asignadas en {len(aulas)} aulas")
+    print(f"   Desde objetos: {tiempo_objetos * 1000:.1f} ms | desde IndiceOcupacion: {tiempo_bits * 1000:.1f} ms "
+          f"{'✅' if iguales else '❌ ocupación distinta'}")
+    print(f"   Horas por aula iguales a estadisticas(): {'✅' if horas_lineal == horas_tensor else '❌'}")
+
+    resumen = analitica.resumen()
+    print(f"   Utilización media {resumen['utilizacion_media']:.1%}, ratio de asientos "
+          f"{resumen['ratio_asientos_medio']:.1%}, {resumen['aulas_sin_uso']} aulas sin uso, "
+          f"{resumen['conflictos']} conflictos")
+    print("   Horas pico (clases que la prefieren por aula):")
+    for pico in analitica.horas_pico():
+        print(f"      {pico['dia']:<10} {pico['hora']:>2}:00  contención {pico['contencion']:5.2f}  "
+              f"ocupación {pico['utilizacion']:.0%}  demanda {pico['demanda']}")
+
+    if args.graficas:
+        crear_visualizaciones_utilizacion(analitica)
+        print("   Mapas de calor en utilizacion_horario.png")
+
+    if args.masivo:
+        from formato_columnar import _asignaciones_sinteticas
+        from generador_vectorizado import obtener_instancia
+
+        instancia = obtener_instancia(args.masivo, args.aulas_masivo, semilla=args.semilla)
+        s = _asignaciones_sinteticas(instancia, args.semilla)
+        c = instancia['clases']
+        inicio = time.perf_counter()
+        masiva = AnaliticaUtilizacion.desde_columnas(
+            s['aula'], s['dia'], s['hora_inicio'], s['hora_fin'], instancia['aulas']['capacidad'],
+            estudiantes=c['estudiantes'][s['clase']],
+            demanda=_demanda(c['dia_preferido'], c['hora_preferida'], c['duracion']))
+        tiempo_tensores = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        resumen = masiva.resumen()
+        tiempo_metricas = time.perf_counter() - inicio
+        print(f"\n{args.masivo} asignaciones sintéticas en {args.aulas_masivo} aulas (columnas, sin validar):")
+        print(f"   Tensores {masiva.ocupacion.shape} en {tiempo_tensores * 1000:.0f} ms, "
+              f"métricas en {tiempo_metricas * 1000:.0f} ms "
+              f"{'✅' if tiempo_tensores + tiempo_metricas < 1 else '⚠️'}")
+        print(f"   Utilización media {resumen['utilizacion_media']:.1%}, "
+              f"ratio de asientos {resumen['ratio_asientos_medio']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
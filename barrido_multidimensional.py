@@ -0,0 +1,218 @@
+"""
+Barrido multidimensional de escalabilidad.
+
+Las pruebas de sobrecarga solo varían el número de clases. Este modo recorre
+una rejilla sobre número de clases, número de aulas, número de profesores y
+mezcla de duraciones, ejecuta cada celda en paralelo (una tarea por celda y
+planificador) y produce superficies de tiempo y de calidad (tasa de
+asignación). Con todas las celdas se ajusta log t ≈ c + Σ b_k · log x_k para
+obtener la elasticidad del tiempo respecto a cada dimensión y señalar en cuál
+escala peor cada planificador.
+
+Uso:
+    python barrido_multidimensional.py --clases 100 200 400 --aulas 4 8 16 --trabajadores 4
+"""
+
+import argparse
+import importlib
+import itertools
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from estres_adaptativo import PLANIFICADORES
+
+# nombre -> {horas: peso}
+MEZCLAS_DURACION = {
+    'cortas': {1: 0.6, 2: 0.3, 3: 0.1},
+    'equilibrada': {1: 0.3, 2: 0.5, 3: 0.2},
+    'largas': {2: 0.2, 3: 0.4, 4: 0.4},
+}
+
+
+def duracion_media(mezcla):
+    pesos = MEZCLAS_DURACION[mezcla]
+    return sum(horas * peso for horas, peso in pesos.items()) / sum(pesos.values())
+
+
+def construir_rejilla(clases, aulas, profesores, mezclas):
+    """Producto cartesiano de las dimensiones como lista de configuraciones"""
+    return [
+        {'clases': n, 'aulas': m, 'profesores': p, 'mezcla': mezcla}
+        for n, m, p, mezcla in itertools.product(clases, aulas, profesores, mezclas)
+    ]
+
+
+def ejecutar_celda(algoritmo, configuracion, semilla=42, repeticiones=1):
+    """
+    Genera la instancia de una celda y la planifica `repeticiones` veces.
+
+    Se ejecuta en un proceso del pool; devuelve un dict serializable.
+    """
+    nombre_modulo, nombre_generador, nombre_clase, nombre_metodo = PLANIFICADORES[algoritmo]
+    modulo = importlib.import_module(nombre_modulo)
+
+    random.seed(semilla)
+    clases, aulas = getattr(modulo, nombre_generador)(
+        configuracion['clases'], configuracion['aulas'],
+        num_profesores=configuracion['profesores'],
+        pesos_duracion=MEZCLAS_DURACION[configuracion['mezcla']]
+    )
+
+    muestras = []
+    for _ in range(repeticiones):
+        planificador = getattr(modulo, nombre_clase)(aulas)
+        inicio = time.perf_counter()
+        getattr(planificador, nombre_metodo)(clases)
+        muestras.append(time.perf_counter() - inicio)
+
+    asignadas = planificador.estadisticas()['clases_asignadas']
+    from validador import validar_horario
+    validacion = validar_horario(planificador.horarios_asignados, clases, aulas)
+    from cotas import calcular_cotas
+    cotas = calcular_cotas(clases, aulas)
+    return dict(configuracion,
+                algoritmo=algoritmo,
+                duracion_media=duracion_media(configuracion['mezcla']),
+                tiempo=statistics.median(muestras),
+                muestras_tiempo=muestras,
+                clases_asignadas=asignadas,
+                tasa_asignacion=asignadas / configuracion['clases'] if configuracion['clases'] else 0.0,
+                violaciones=validacion.total,
+                cota_superior=cotas.cota,
+                brecha=cotas.brecha(asignadas))
+
+
+def ejecutar_barrido(rejilla, algoritmos=('greedy', 'divide_venceras'), trabajadores=None,
+                     semilla=42, repeticiones=1):
+    """
+    Ejecuta todas las celdas de la rejilla para cada algoritmo en un pool de procesos.
+
+    Ambos planificadores reciben la misma semilla en cada celda. Con más de un
+    trabajador las celdas compiten por CPU; para tiempos absolutos fiables usar
+    `trabajadores=1`, para comparar superficies basta con el paralelismo.
+    """
+    trabajadores = trabajadores or os.cpu_count() or 1
+    celdas = {}
+    with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+        futuros = {
+            pool.submit(ejecutar_celda, algoritmo, configuracion, semilla + indice, repeticiones):
+                (indice, algoritmo, configuracion)
+            for indice, configuracion in enumerate(rejilla)
+            for algoritmo in algoritmos
+        }
+        for completados, futuro in enumerate(as_completed(futuros), 1):
+            indice, algoritmo, configuracion = futuros[futuro]
+            try:
+                celda = futuro.result()
+            except Exception as e:
+                celda = dict(configuracion, algoritmo=algoritmo, error=f"{type(e).__name__}: {e}")
+            celdas[(indice, algoritmos.index(algoritmo))] = celda
+            if 'error' in celda:
+                print(f"  [{completados}/{len(futuros)}] {algoritmo} {configuracion}: ERROR {celda['error']}")
+            else:
+                print(f"  [{completados}/{len(futuros)}] {algoritmo:<16} n={celda['clases']:<5} "
+                      f"aulas={celda['aulas']:<3} prof={celda['profesores']:<3} {celda['mezcla']:<12} "
+                      f"{celda['tiempo']:.4f}s  {celda['tasa_asignacion']*100:.1f}%  brecha {celda['brecha']*100:.1f}%"
+                      + (f"  ❌ {celda['violaciones']} violaciones" if celda['violaciones'] else ""))
+
+    # Orden estable (rejilla, algoritmo) independiente del orden de finalización
+    return [celdas[clave] for clave in sorted(celdas)]
+
+
+def calcular_elasticidades(celdas, metrica='tiempo'):
+    """Elasticidad de `metrica` respecto a cada dimensión, por algoritmo"""
+    from analisis_complejidad import ajustar_elasticidades
+
+    elasticidades = {}
+    for algoritmo in sorted({c['algoritmo'] for c in celdas}):
+        validas = [c for c in celdas if c['algoritmo'] == algoritmo and 'error' not in c]
+        elasticidades[algoritmo] = ajustar_elasticidades(
+            {
+                'clases': [c['clases'] for c in validas],
+                'aulas': [c['aulas'] for c in validas],
+                'profesores': [c['profesores'] for c in validas],
+                'duracion_media': [c['duracion_media'] for c in validas],
+            },
+            [c[metrica] for c in validas]
+        )
+    return elasticidades
+
+
+def imprimir_elasticidades(elasticidades, metrica='tiempo'):
+    print(f"\nELASTICIDAD DE {metrica.upper()} POR DIMENSIÓN (log {metrica} ≈ c + Σ b·log x):")
+    for algoritmo, ajuste in elasticidades.items():
+        if ajuste is None:
+            print(f"   {algoritmo}: datos insuficientes")
+            continue
+        ordenadas = sorted(ajuste['elasticidades'].items(), key=lambda e: e[1], reverse=True)
+        detalle = ", ".join(f"{nombre} {valor:+.2f}" for nombre, valor in ordenadas)
+        print(f"   {algoritmo}: {detalle} (R²={ajuste['r2']:.3f})")
+        if metrica == 'tiempo':
+            print(f"      Peor dimensión: {ordenadas[0][0]}")
+
+
+def pruebas_barrido(clases=(100, 200, 400), aulas=(4, 8, 16), profesores=(10, 20, 40),
+                    mezclas=tuple(MEZCLAS_DURACION), algoritmos=('greedy', 'divide_venceras'),
+                    trabajadores=None, semilla=42, repeticiones=1):
+    """Ejecuta el barrido completo, imprime las elasticidades y devuelve los resultados"""
+    print("="*80)
+    print("BARRIDO MULTIDIMENSIONAL DE ESCALABILIDAD")
+    print("="*80)
+    rejilla = construir_rejilla(clases, aulas, profesores, mezclas)
+    print(f"Rejilla: {len(clases)} × {len(aulas)} × {len(profesores)} × {len(mezclas)} = "
+          f"{len(rejilla)} celdas, {len(algoritmos)} algoritmos")
+
+    inicio = time.perf_counter()
+    celdas = ejecutar_barrido(rejilla, algoritmos, trabajadores, semilla, repeticiones)
+    print(f"Barrido completado en {time.perf_counter() - inicio:.1f}s")
+
+    resultados = {
+        'dimensiones': {'clases': list(clases), 'aulas': list(aulas),
+                        'profesores': list(profesores), 'mezcla': list(mezclas)},
+        'celdas': celdas,
+        'elasticidades': calcular_elasticidades(celdas, 'tiempo'),
+        'elasticidades_calidad': calcular_elasticidades(celdas, 'tasa_asignacion'),
+    }
+    imprimir_elasticidades(resultados['elasticidades'], 'tiempo')
+    imprimir_elasticidades(resultados['elasticidades_calidad'], 'tasa_asignacion')
+    return resultados
+
+
+def crear_visualizaciones_barrido(resultados, ruta_resultados='resultados_barrido.json', segundo_plano=False):
+    from visualizaciones import guardar_resultados, renderizar_barrido, renderizar_en_segundo_plano
+    guardar_resultados(resultados, ruta_resultados)
+    if segundo_plano:
+        return renderizar_en_segundo_plano('barrido', ruta_resultados)
+    renderizar_barrido(ruta_resultados)
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Barrido de escalabilidad sobre clases, aulas, profesores y duraciones")
+    parser.add_argument('--clases', type=int, nargs='+', default=[100, 200, 400])
+    parser.add_argument('--aulas', type=int, nargs='+', default=[4, 8, 16])
+    parser.add_argument('--profesores', type=int, nargs='+', default=[10, 20, 40])
+    parser.add_argument('--mezclas', nargs='+', choices=list(MEZCLAS_DURACION), default=list(MEZCLAS_DURACION))
+    parser.add_argument('--algoritmos', nargs='+', choices=list(PLANIFICADORES),
+                        default=['greedy', 'divide_venceras'])
+    parser.add_argument('--trabajadores', type=int, default=None, help="Procesos del pool (por defecto, uno por CPU)")
+    parser.add_argument('--repeticiones', type=int, default=1)
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--salida', default='resultados_barrido.json')
+    args = parser.parse_args()
+
+    resultados = pruebas_barrido(args.clases, args.aulas, args.profesores, args.mezclas,
+                                 args.algoritmos, args.trabajadores, args.semilla, args.repeticiones)
+    proceso_graficas = crear_visualizaciones_barrido(resultados, args.salida, segundo_plano=True)
+    if proceso_graficas is not None:
+        proceso_graficas.join()
+    print(f"\nArchivos generados:\n- {args.salida}")
+    for algoritmo in args.algoritmos:
+        print(f"- barrido_{algoritmo}.png")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Caché de resultados direccionada por contenido.
+
+La clave es el SHA-256 de la instancia canonicalizada: clases ordenadas por
+id, aulas ordenadas por id (con el equipamiento ordenado), calendario
+(disrupciones), planificador y sus parámetros. Dos envíos de la misma
+instancia, aunque las clases lleguen en otro orden, comparten entrada.
+
+Cada horario se guarda en el formato columnar (`formato_columnar`, archivos
+.hcol) y al recuperarlo se reconstruye con los objetos Clase y Aula del
+llamador, emparejados por id. El directorio se limita en bytes con
+desalojo LRU; la recencia se guarda en el mtime de cada archivo, así que
+sobrevive entre procesos.
+
+Uso:
+    python cache_resultados.py --tamano 5000 --aulas 150
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+DIRECTORIO_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache_resultados')
+VERSION_CLAVE = 1
+EXTENSION = '.hcol'
+
+
+def huella_instancia(clases, aulas, planificador: str, parametros: Optional[Dict] = None,
+                     calendario=None) -> str:
+    """SHA-256 hexadecimal de la instancia canonicalizada"""
+    canonica = {
+        'version': VERSION_CLAVE,
+        'planificador': planificador,
+        'parametros': parametros or {},
+        'clases': sorted([c.id, c.nombre, c.profesor, c.duracion, c.horario_preferido[0].name,
+                          c.horario_preferido[1], c.aula_requerida, c.estudiantes] for c in clases),
+        'aulas': sorted([a.id, a.capacidad, sorted(a.equipamiento)] for a in aulas),
+        'calendario': sorted([d.tipo, d.recurso, d.dia, d.hora_inicio, d.hora_fin] for d in calendario or ()),
+    }
+    texto = json.dumps(canonica, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+class CacheResultados:
+    """Horarios por huella en un directorio limitado a `limite_bytes` (LRU)"""
+
+    def __init__(self, directorio: str = DIRECTORIO_CACHE, limite_bytes: int = 256 * 2 ** 20):
+        self.directorio = directorio
+        self.limite_bytes = limite_bytes
+        os.makedirs(directorio, exist_ok=True)
+        # huella -> bytes, del menos al más recientemente usado
+        self._entradas: 'OrderedDict[str, int]' = OrderedDict()
+        existentes = []
+        for nombre in os.listdir(directorio):
+            if nombre.endswith(EXTENSION):
+                estado = os.stat(os.path.join(directorio, nombre))
+                existentes.append((estado.st_mtime, nombre[:-len(EXTENSION)], estado.st_size))
+        for _, huella, tamano in sorted(existentes):
+            self._entradas[huella] = tamano
+        self.bytes = sum(self._entradas.values())
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.tiempo_aciertos = 0.0
+        self.tiempo_calculos = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def __contains__(self, huella: str) -> bool:
+        return huella in self._entradas
+
+    def _ruta(self, huella: str) -> str:
+        return os.path.join(self.directorio, huella + EXTENSION)
+
+    def obtener(self, huella: str, clases, aulas, tipos=None) -> Optional[List]:
+        """Horario guardado reconstruido con `clases` y `aulas`, o None si no está (cuenta aciertos y fallos)"""
+        inicio = time.perf_counter()
+        if huella not in self._entradas or not clases:
+            self.fallos += 1
+            return None
+        from formato_columnar import cargar_horario
+
+        ruta = self._ruta(huella)
+        try:
+            columnar = cargar_horario(ruta, mmap=False)
+        except FileNotFoundError:
+            # Desalojado por otro proceso que comparte el directorio
+            self.bytes -= self._entradas.pop(huella)
+            self.fallos += 1
+            return None
+        tipos = tipos or sys.modules[type(clases[0]).__module__]
+        clases_por_id = {c.id: c for c in clases}
+        aulas_por_id = {a.id: a for a in aulas}
+        cadenas = columnar.cadenas
+        ids_clases = columnar.clases['id'].tolist()
+        ids_aulas = [cadenas[i] for i in columnar.aulas['id'].tolist()]
+        dias = list(tipos.DiaSemana)
+        s = columnar.asignaciones
+        horarios = [
+            tipos.HorarioAsignado(clase=clases_por_id[ids_clases[clase]], dia=dias[dia], hora_inicio=inicio,
+                                  hora_fin=fin, aula=aulas_por_id[ids_aulas[aula]])
+            for clase, aula, dia, inicio, fin in zip(s['clase'].tolist(), s['aula'].tolist(), s['dia'].tolist(),
+                                                     s['hora_inicio'].tolist(), s['hora_fin'].tolist())
+        ]
+        self._entradas.move_to_end(huella)
+        os.utime(ruta)
+        self.aciertos += 1
+        self.tiempo_aciertos += time.perf_counter() - inicio
+        return horarios
+
+    def guardar(self, huella: str, horarios, clases, aulas):
+        from formato_columnar import escribir_horario
+
+        ruta = self._ruta(huella)
+        # Escritura atómica: otro proceso nunca lee un archivo a medias
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        escribir_horario(temporal, horarios, clases, aulas)
+        os.replace(temporal, ruta)
+        self.bytes -= self._entradas.pop(huella, 0)
+        self._entradas[huella] = os.path.getsize(ruta)
+        self.bytes += self._entradas[huella]
+        self._desalojar()
+
+    def _desalojar(self):
+        while self.bytes > self.limite_bytes and len(self._entradas) > 1:
+            huella, tamano = self._entradas.popitem(last=False)
+            self.bytes -= tamano
+            self.desalojos += 1
+            try:
+                os.remove(self._ruta(huella))
+            except FileNotFoundError:
+                pass
+
+    def obtener_o_calcular(self, clases, aulas, planificador: str, calcular: Callable[[], List],
+                           parametros: Optional[Dict] = None, calendario=None, tipos=None) -> Tuple[List, bool]:
+        """
+        Devuelve (horarios, acierto). En un fallo llama a `calcular()`, que debe
+        devolver los HorarioAsignado de `clases` y `aulas`, y guarda el resultado.
+        """
+        huella = huella_instancia(clases, aulas, planificador, parametros, calendario)
+        horarios = self.obtener(huella, clases, aulas, tipos)
+        if horarios is not None:
+            return horarios, True
+
+        inicio = time.perf_counter()
+        horarios = calcular()
+        if clases:
+            self.guardar(huella, horarios, clases, aulas)
+        self.tiempo_calculos += time.perf_counter() - inicio
+        return horarios, False
+
+    def metricas(self) -> Dict:
+        consultas = self.aciertos + self.fallos
+        return {
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0.0,
+            'desalojos': self.desalojos,
+            'entradas': len(self._entradas),
+            'bytes': self.bytes,
+            'limite_bytes': self.limite_bytes,
+            'tiempo_medio_acierto': self.tiempo_aciertos / self.aciertos if self.aciertos else 0.0,
+            'tiempo_medio_calculo': self.tiempo_calculos / self.fallos if self.fallos else 0.0,
+        }
+
+    def limpiar(self):
+        for huella in list(self._entradas):
+            try:
+                os.remove(self._ruta(huella))
+            except FileNotFoundError:
+                pass
+        self._entradas.clear()
+        self.bytes = 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Caché de resultados por huella de la instancia")
+    parser.add_argument('--tamano', type=int, default=5000)
+    parser.add_argument('--aulas', type=int, default=150)
+    parser.add_argument('--profesores', type=int, default=400)
+    parser.add_argument('--semillas', type=int, default=3, help="Instancias distintas")
+    parser.add_argument('--repeticiones', type=int, default=3, help="Envíos de cada instancia")
+    parser.add_argument('--limite-mb', type=float, default=256)
+    parser.add_argument('--directorio', default=DIRECTORIO_CACHE)
+    args = parser.parse_args()
+
+    import random
+    import algoritmo_voraz
+    from validador import validar_horario
+
+    cache = CacheResultados(args.directorio, int(args.limite_mb * 2 ** 20))
+    print(f"Caché en {args.directorio}: {len(cache)} entradas, {cache.bytes / 2 ** 20:.2f} MB\n")
+
+    for semilla in range(args.semillas):
+        random.seed(semilla)
+        clases, aulas = algoritmo_voraz.generar_datos_prueba_greedy(args.tamano, args.aulas,
+                                                                    num_profesores=args.profesores)
+        for repeticion in range(args.repeticiones):
+            planificador = algoritmo_voraz.PlanificadorVoraz(aulas)
+            calcular = lambda: planificador.replanificar(clases, [])
+            inicio = time.perf_counter()
+            horarios, acierto = cache.obtener_o_calcular(clases, aulas, 'greedy', calcular)
+            transcurrido = time.perf_counter() - inicio
+            if repeticion == 0 or acierto:
+                validacion = validar_horario(horarios, clases, aulas)
+            print(f"   semilla {semilla}, envío {repeticion + 1}: {'acierto' if acierto else 'fallo  '} "
+                  f"{len(horarios)} asignadas en {transcurrido * 1000:8.1f} ms "
+                  f"{'✅' if validacion.valido else '❌'}")
+
+    metricas = cache.metricas()
+    print(f"\nAciertos {metricas['aciertos']}, fallos {metricas['fallos']} "
+          f"({metricas['tasa_aciertos']:.0%}), desalojos {metricas['desalojos']}")
+    print(f"Tiempo medio: acierto {metricas['tiempo_medio_acierto'] * 1000:.1f} ms, "
+          f"cálculo en un fallo {metricas['tiempo_medio_calculo'] * 1000:.1f} ms")
+    print(f"Ocupación: {metricas['entradas']} entradas, {metricas['bytes'] / 2 ** 20:.2f} MB "
+          f"de {metricas['limite_bytes'] / 2 ** 20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Plazos y cancelación cooperativa para los planificadores.
+
+Un `TokenCancelacion` combina un plazo opcional (segundos desde su creación) y
+una bandera de cancelación que puede activar otro hilo o una corrutina. Los
+planificadores lo consultan en puntos baratos de sus bucles (una vez por
+clase) y, al expirar, devuelven el horario parcial construido hasta ese
+momento con `truncado = True`.
+
+Uso:
+    python cancelacion.py --tamano 2000 --plazo 0.2
+"""
+
+import argparse
+import time
+from typing import Optional
+
+
+class TokenCancelacion:
+
+    def __init__(self, plazo: Optional[float] = None):
+        self.limite = time.perf_counter() + plazo if plazo is not None else None
+        self.cancelado = False
+
+    def cancelar(self):
+        # Asignar un atributo es atómico: se puede llamar desde otro hilo
+        self.cancelado = True
+
+    def expirado(self) -> bool:
+        return self.cancelado or (self.limite is not None and time.perf_counter() >= self.limite)
+
+    def restante(self) -> Optional[float]:
+        """Segundos hasta el plazo (None si no hay plazo)"""
+        if self.limite is None:
+            return None
+        return max(0.0, self.limite - time.perf_counter())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Planificación con plazo: horarios parciales y refinamiento")
+    parser.add_argument('--tamano', type=int, default=2000)
+    parser.add_argument('--aulas', type=int, default=8)
+    parser.add_argument('--plazo', type=float, default=0.2, help="Plazo en segundos")
+    parser.add_argument('--semilla', type=int, default=42)
+    args = parser.parse_args()
+
+    import random
+    from algoritmo_voraz import PlanificadorVoraz, generar_datos_prueba_greedy
+    from divide_venceras import PlanificadorDivideVenceras
+
+    random.seed(args.semilla)
+    clases, aulas = generar_datos_prueba_greedy(args.tamano, args.aulas)
+    print(f"{args.tamano} clases, {args.aulas} aulas, plazo {args.plazo * 1000:.0f} ms")
+
+    ejecuciones = [
+        ('greedy_adaptativo', PlanificadorVoraz(aulas), 'greedy_adaptativo'),
+        ('divide_venceras', PlanificadorDivideVenceras(aulas), 'divide_venceras'),
+        ('greedy_anytime', PlanificadorVoraz(aulas), 'greedy_anytime'),
+    ]
+    for nombre, planificador, metodo in ejecuciones:
+        inicio = time.perf_counter()
+        getattr(planificador, metodo)(clases, token=TokenCancelacion(args.plazo))
+        transcurrido = time.perf_counter() - inicio
+        print(f"   {nombre:<18} {len(planificador.horarios_asignados):>5} asignadas en "
+              f"{transcurrido * 1000:.0f} ms{' (truncado)' if planificador.truncado else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,27 +4,41 @@ Incluye análisis de sobrecarga y estrés para ambos enfoques
 """
 
 import time
-import matplotlib.pyplot as plt
-import numpy as np
+import random
 from divide_venceras import PlanificadorDivideVenceras, generar_datos_prueba_dv
-from algoritmo_voraz import PlanificadorVoraz, generar_datos_prueba_greedy
-import psutil
+from algoritmo_voraz import PlanificadorVoraz, Clase, DiaSemana
 import os
 
-def generar_datos_comparacion(num_clases: int, num_aulas: int = 8):
+# Por encima de este tamaño el solver exacto no se ejecuta en la comparación
+TAMANO_MAXIMO_EXACTO = 100
+
+def generar_datos_comparacion(num_clases: int, num_aulas: int = 8, perfil=None, semilla: int = 42):
     """Genera datos de prueba para comparación directa"""
     
-    # Usar el generador de datos de divide y vencerás como base
-    clases_dv, aulas_dv = generar_datos_prueba_dv(num_clases, num_aulas)
+    if perfil is not None:
+        # Misma semilla para ambos: la instancia es idéntica, solo cambian los tipos
+        from perfiles_carga import generar_perfil
+        clases_dv, aulas_dv = generar_perfil(perfil, num_clases, num_aulas, semilla, tipos='divide_venceras')
+        clases_greedy, _ = generar_perfil(perfil, num_clases, num_aulas, semilla, tipos='algoritmo_voraz')
+        return clases_dv, clases_greedy, aulas_dv
     
-    # Adaptar para algoritmo voraz
-    clases_greedy, aulas_greedy = generar_datos_prueba_greedy(num_clases, num_aulas)
+    # Una sola instancia (generador de divide y vencerás con la semilla dada)
+    # convertida a los tipos del algoritmo voraz
+    random.seed(semilla)
+    clases_dv, aulas_dv = generar_datos_prueba_dv(num_clases, num_aulas)
+    clases_greedy = [
+        Clase(id=c.id, nombre=c.nombre, profesor=c.profesor, duracion=c.duracion,
+              horario_preferido=(DiaSemana[c.horario_preferido[0].name], c.horario_preferido[1]),
+              aula_requerida=c.aula_requerida, estudiantes=c.estudiantes)
+        for c in clases_dv
+    ]
     
     # Usar las mismas aulas para ambos algoritmos
     return clases_dv, clases_greedy, aulas_dv
 
 def medir_rendimiento_comparacion(func, *args, **kwargs):
     """Mide el tiempo de ejecución y uso de memoria para comparación"""
+    import psutil
     proceso = psutil.Process(os.getpid())
     
     # Memoria inicial
@@ -40,7 +54,7 @@ def medir_rendimiento_comparacion(func, *args, **kwargs):
     
     return resultado, fin - inicio, memoria_final - memoria_inicial
 
-def pruebas_comparativas_sobrecarga():
+def pruebas_comparativas_sobrecarga(perfil=None, semilla=42, limite_exacto=10.0):
     """
     Pruebas de sobrecarga comparativas entre Divide y Vencerás vs Algoritmo Voraz
     
@@ -49,6 +63,9 @@ def pruebas_comparativas_sobrecarga():
     2. Verificar escalabilidad relativa con aumento gradual de carga
     3. Identificar cuellos de botella específicos de cada enfoque
     4. Determinar el punto de equilibrio entre ambos algoritmos
+    
+    Hasta TAMANO_MAXIMO_EXACTO clases también se ejecuta el solver exacto (con
+    `limite_exacto` segundos) como referencia de calidad.
     """
     
     print("="*80)
@@ -64,25 +81,30 @@ def pruebas_comparativas_sobrecarga():
         'tamanos': [],
         'tiempos_dv': [],
         'tiempos_greedy': [],
-        'tiempos_greedy_mejorado': [],
         'memoria_dv': [],
         'memoria_greedy': [],
-        'memoria_greedy_mejorado': [],
         'clases_asignadas_dv': [],
         'clases_asignadas_greedy': [],
-        'clases_asignadas_greedy_mejorado': [],
         'eficiencia_dv': [],
         'eficiencia_greedy': [],
-        'eficiencia_greedy_mejorado': [],
         'llamadas_recursivas': [],
         'iteraciones_greedy': [],
-        'mejoras_locales': []
+        'violaciones_dv': [],
+        'violaciones_greedy': [],
+        'cota_superior': [],
+        'brecha_dv': [],
+        'brecha_greedy': [],
+        'tiempos_exacto': [],
+        'clases_asignadas_exacto': [],
+        'exacto_optimo': []
     }
     
     print(f"Configuración de pruebas:")
     print(f"- Tamaños: {tamanos_prueba}")
     print(f"- Aulas disponibles: {num_aulas}")
-    print(f"- Algoritmos: Divide y Vencerás, Greedy, Greedy Mejorado")
+    print(f"- Algoritmos: Divide y Vencerás, Greedy Adaptativo")
+    print(f"- Referencia exacta: hasta {TAMANO_MAXIMO_EXACTO} clases, límite {limite_exacto}s")
+    print(f"- Perfil de carga: {perfil or 'aleatorio (generador de divide y vencerás)'}")
     print()
     
     for tamano in tamanos_prueba:
@@ -90,7 +112,7 @@ def pruebas_comparativas_sobrecarga():
         
         try:
             # Generar datos de prueba
-            clases_dv, clases_greedy, aulas = generar_datos_comparacion(tamano, num_aulas)
+            clases_dv, clases_greedy, aulas = generar_datos_comparacion(tamano, num_aulas, perfil, semilla + tamano)
             
             # Probar Divide y Vencerás
             planificador_dv = PlanificadorDivideVenceras(aulas)
@@ -99,61 +121,86 @@ def pruebas_comparativas_sobrecarga():
             )
             stats_dv = planificador_dv.estadisticas()
             
-            # Probar Greedy básico
+            # Probar Greedy adaptativo
             planificador_greedy = PlanificadorVoraz(aulas)
             resultado_greedy, tiempo_greedy, memoria_greedy = medir_rendimiento_comparacion(
-                planificador_greedy.greedy_horarios, clases_greedy
+                planificador_greedy.greedy_adaptativo, clases_greedy
             )
             stats_greedy = planificador_greedy.estadisticas()
             
-            # Probar Greedy mejorado
-            planificador_greedy.limpiar_horarios()
-            resultado_greedy_mejorado, tiempo_greedy_mejorado, memoria_greedy_mejorado = medir_rendimiento_comparacion(
-                planificador_greedy.greedy_mejorado, clases_greedy
-            )
-            stats_greedy_mejorado = planificador_greedy.estadisticas()
+            # Referencia exacta en tamaños pequeños, sobre la misma instancia
+            # (el solver usa los tipos del algoritmo voraz)
+            stats_exacto = None
+            validacion_exacto = None
+            if tamano <= TAMANO_MAXIMO_EXACTO:
+                from solver_exacto import PlanificadorExacto
+                planificador_exacto = PlanificadorExacto(aulas, limite_tiempo=limite_exacto)
+                planificador_exacto.ramificacion_y_poda(clases_greedy)
+                stats_exacto = planificador_exacto.estadisticas()
+            
+            # Validar ambos horarios (fuera del tiempo medido)
+            from validador import validar_horario
+            validacion_dv = validar_horario(planificador_dv.horarios_asignados, clases_dv, aulas)
+            validacion_greedy = validar_horario(planificador_greedy.horarios_asignados, clases_greedy, aulas)
+            resultados['violaciones_dv'].append(validacion_dv.total)
+            resultados['violaciones_greedy'].append(validacion_greedy.total)
+            if stats_exacto is not None:
+                validacion_exacto = validar_horario(planificador_exacto.horarios_asignados, clases_greedy, aulas)
+            
+            # Brecha de optimalidad frente a la cota superior (la instancia es la misma)
+            from cotas import calcular_cotas
+            cotas = calcular_cotas(clases_dv, aulas)
+            brecha_dv = cotas.brecha(stats_dv['clases_asignadas'])
+            brecha_greedy = cotas.brecha(stats_greedy['clases_asignadas'])
+            resultados['cota_superior'].append(cotas.cota)
+            resultados['brecha_dv'].append(brecha_dv)
+            resultados['brecha_greedy'].append(brecha_greedy)
             
             # Almacenar resultados
             resultados['tamanos'].append(tamano)
             resultados['tiempos_dv'].append(tiempo_dv)
             resultados['tiempos_greedy'].append(tiempo_greedy)
-            resultados['tiempos_greedy_mejorado'].append(tiempo_greedy_mejorado)
             resultados['memoria_dv'].append(memoria_dv)
             resultados['memoria_greedy'].append(memoria_greedy)
-            resultados['memoria_greedy_mejorado'].append(memoria_greedy_mejorado)
             resultados['clases_asignadas_dv'].append(stats_dv['clases_asignadas'])
             resultados['clases_asignadas_greedy'].append(stats_greedy['clases_asignadas'])
-            resultados['clases_asignadas_greedy_mejorado'].append(stats_greedy_mejorado['clases_asignadas'])
             resultados['llamadas_recursivas'].append(stats_dv['estadisticas_recursion']['llamadas_recursivas'])
             resultados['iteraciones_greedy'].append(stats_greedy['estadisticas_greedy']['iteraciones'])
-            resultados['mejoras_locales'].append(stats_greedy_mejorado['estadisticas_greedy']['mejoras_locales'])
+            resultados['tiempos_exacto'].append(stats_exacto and stats_exacto['estadisticas_exacto']['tiempo'])
+            resultados['clases_asignadas_exacto'].append(stats_exacto and stats_exacto['clases_asignadas'])
+            resultados['exacto_optimo'].append(stats_exacto and stats_exacto['estadisticas_exacto']['optimo'])
             
             # Calcular eficiencias
             eficiencia_dv = stats_dv['clases_asignadas'] / tiempo_dv if tiempo_dv > 0 else 0
             eficiencia_greedy = stats_greedy['clases_asignadas'] / tiempo_greedy if tiempo_greedy > 0 else 0
-            eficiencia_greedy_mejorado = stats_greedy_mejorado['clases_asignadas'] / tiempo_greedy_mejorado if tiempo_greedy_mejorado > 0 else 0
             
             resultados['eficiencia_dv'].append(eficiencia_dv)
             resultados['eficiencia_greedy'].append(eficiencia_greedy)
-            resultados['eficiencia_greedy_mejorado'].append(eficiencia_greedy_mejorado)
             
+            print(f"  📐 Cota superior: {cotas.cota}/{tamano} ({cotas.restriccion_activa})")
             print(f"  🔄 DIVIDE Y VENCERÁS:")
-            print(f"     Tiempo: {tiempo_dv:.4f}s, Memoria: {memoria_dv:.2f} MB")
+            print(f"     Tiempo: {tiempo_dv:.4f}s, Brecha: {brecha_dv*100:.1f}%, Memoria: {memoria_dv:.2f} MB")
             print(f"     Clases asignadas: {stats_dv['clases_asignadas']}/{tamano} ({stats_dv['clases_asignadas']/tamano*100:.1f}%)")
             print(f"     Llamadas recursivas: {stats_dv['estadisticas_recursion']['llamadas_recursivas']}")
             print(f"     Eficiencia: {eficiencia_dv:.2f} clases/s")
+            print(f"     Validación: {validacion_dv.describir()}")
             
-            print(f"  ⚡ GREEDY BÁSICO:")
-            print(f"     Tiempo: {tiempo_greedy:.4f}s, Memoria: {memoria_greedy:.2f} MB")
+            print(f"  ⚡ GREEDY ADAPTATIVO:")
+            print(f"     Tiempo: {tiempo_greedy:.4f}s, Brecha: {brecha_greedy*100:.1f}%, Memoria: {memoria_greedy:.2f} MB")
             print(f"     Clases asignadas: {stats_greedy['clases_asignadas']}/{tamano} ({stats_greedy['clases_asignadas']/tamano*100:.1f}%)")
             print(f"     Iteraciones: {stats_greedy['estadisticas_greedy']['iteraciones']}")
             print(f"     Eficiencia: {eficiencia_greedy:.2f} clases/s")
+            print(f"     Validación: {validacion_greedy.describir()}")
             
-            print(f"  🚀 GREEDY MEJORADO:")
-            print(f"     Tiempo: {tiempo_greedy_mejorado:.4f}s, Memoria: {memoria_greedy_mejorado:.2f} MB")
-            print(f"     Clases asignadas: {stats_greedy_mejorado['clases_asignadas']}/{tamano} ({stats_greedy_mejorado['clases_asignadas']/tamano*100:.1f}%)")
-            print(f"     Mejoras locales: {stats_greedy_mejorado['estadisticas_greedy']['mejoras_locales']}")
-            print(f"     Eficiencia: {eficiencia_greedy_mejorado:.2f} clases/s")
+            if stats_exacto is not None:
+                asignadas_exacto = stats_exacto['clases_asignadas']
+                estado = 'óptimo demostrado' if stats_exacto['estadisticas_exacto']['optimo'] else 'límite de tiempo'
+                print(f"  🎯 EXACTO (referencia):")
+                print(f"     Tiempo: {stats_exacto['estadisticas_exacto']['tiempo']:.4f}s, "
+                      f"Clases asignadas: {asignadas_exacto}/{tamano} ({estado})")
+                print(f"     Validación: {validacion_exacto.describir()}")
+                print(f"     Pérdida de calidad: DV {asignadas_exacto - stats_dv['clases_asignadas']} clases, "
+                      f"Greedy {asignadas_exacto - stats_greedy['clases_asignadas']} clases")
             
             # Análisis comparativo
             if tiempo_dv > 0 and tiempo_greedy > 0:
@@ -173,243 +220,74 @@ def pruebas_comparativas_sobrecarga():
     return resultados
 
 def analisis_punto_equilibrio(resultados):
-    """Analiza el punto de equilibrio entre los algoritmos"""
+    """Analiza el punto de equilibrio entre los algoritmos a partir de ajustes log-log"""
     
     print("="*80)
     print("ANÁLISIS DE PUNTO DE EQUILIBRIO")
     print("="*80)
     
-    if not resultados['tamanos']:
+    if len(resultados['tamanos']) < 2:
         print("No hay datos suficientes para el análisis")
         return
     
-    # Encontrar punto de equilibrio temporal
-    print("1. PUNTO DE EQUILIBRIO TEMPORAL:")
-    for i in range(len(resultados['tamanos'])):
-        if resultados['tiempos_dv'][i] > 0 and resultados['tiempos_greedy'][i] > 0:
-            ratio = resultados['tiempos_dv'][i] / resultados['tiempos_greedy'][i]
-            if ratio <= 1.1:  # DV es similar o mejor que Greedy
-                print(f"   Punto de equilibrio: {resultados['tamanos'][i]} clases")
-                print(f"   Tiempo DV: {resultados['tiempos_dv'][i]:.4f}s")
-                print(f"   Tiempo Greedy: {resultados['tiempos_greedy'][i]:.4f}s")
-                print(f"   Ratio: {ratio:.2f}")
-                break
-    
-    # Encontrar punto de equilibrio de eficiencia
-    print("\n2. PUNTO DE EQUILIBRIO DE EFICIENCIA:")
-    for i in range(len(resultados['tamanos'])):
-        if resultados['eficiencia_dv'][i] > 0 and resultados['eficiencia_greedy'][i] > 0:
-            ratio = resultados['eficiencia_dv'][i] / resultados['eficiencia_greedy'][i]
-            if ratio >= 0.9:  # DV es similar o mejor que Greedy
-                print(f"   Punto de equilibrio: {resultados['tamanos'][i]} clases")
-                print(f"   Eficiencia DV: {resultados['eficiencia_dv'][i]:.2f} clases/s")
-                print(f"   Eficiencia Greedy: {resultados['eficiencia_greedy'][i]:.2f} clases/s")
-                print(f"   Ratio: {ratio:.2f}")
-                break
-    
-    # Análisis de escalabilidad relativa
+    from analisis_complejidad import ajustar_potencia, imprimir_ajuste, punto_cruce
+    
+    tamanos = resultados['tamanos']
+    tamanos_prediccion = [max(tamanos) * 2, max(tamanos) * 10]
+    
+    # Ajuste y ≈ a·n^b del tiempo de cada algoritmo
+    print("1. COMPLEJIDAD EMPÍRICA (tiempo):")
+    ajuste_dv = ajustar_potencia(tamanos, resultados['tiempos_dv'])
+    ajuste_greedy = ajustar_potencia(tamanos, resultados['tiempos_greedy'])
+    imprimir_ajuste('Divide y Vencerás', ajuste_dv, 's', tamanos_prediccion)
+    imprimir_ajuste('Greedy Adaptativo', ajuste_greedy, 's', tamanos_prediccion)
+    
+    # Punto de cruce real entre las curvas ajustadas
+    print("\n2. PUNTO DE EQUILIBRIO TEMPORAL:")
+    if ajuste_dv is None or ajuste_greedy is None:
+        print("   Datos insuficientes para estimar el cruce")
+    else:
+        cruce = punto_cruce(ajuste_dv, ajuste_greedy)
+        mas_rapido_grande = 'DV' if ajuste_dv.exponente < ajuste_greedy.exponente else 'Greedy'
+        if cruce is None:
+            print("   Las curvas son paralelas: no hay cruce")
+        else:
+            ubicacion = ("dentro del rango medido" if min(tamanos) <= cruce <= max(tamanos)
+                         else "extrapolado fuera del rango medido")
+            print(f"   Cruce estimado: {cruce:.0f} clases ({ubicacion})")
+            print(f"   Por encima del cruce es más rápido: {mas_rapido_grande}")
+    
     print("\n3. ESCALABILIDAD RELATIVA:")
-    if len(resultados['tiempos_dv']) > 2 and len(resultados['tiempos_greedy']) > 2:
-        # Calcular crecimiento promedio
-        crecimiento_dv = []
-        crecimiento_greedy = []
-        
-        for i in range(1, len(resultados['tiempos_dv'])):
-            if resultados['tiempos_dv'][i-1] > 0:
-                crecimiento_dv.append(resultados['tiempos_dv'][i] / resultados['tiempos_dv'][i-1])
-            if resultados['tiempos_greedy'][i-1] > 0:
-                crecimiento_greedy.append(resultados['tiempos_greedy'][i] / resultados['tiempos_greedy'][i-1])
-        
-        if crecimiento_dv and crecimiento_greedy:
-            crecimiento_promedio_dv = sum(crecimiento_dv) / len(crecimiento_dv)
-            crecimiento_promedio_greedy = sum(crecimiento_greedy) / len(crecimiento_greedy)
-            
-            print(f"   Crecimiento promedio DV: {crecimiento_promedio_dv:.2f}x por duplicación")
-            print(f"   Crecimiento promedio Greedy: {crecimiento_promedio_greedy:.2f}x por duplicación")
-            
-            if crecimiento_promedio_dv < crecimiento_promedio_greedy:
-                print(f"   ✅ DV escala mejor que Greedy")
-            else:
-                print(f"   ✅ Greedy escala mejor que DV")
+    if ajuste_dv is not None and ajuste_greedy is not None:
+        print(f"   Exponente DV: {ajuste_dv.exponente:.2f} "
+              f"[{ajuste_dv.intervalo_exponente[0]:.2f}, {ajuste_dv.intervalo_exponente[1]:.2f}]")
+        print(f"   Exponente Greedy: {ajuste_greedy.exponente:.2f} "
+              f"[{ajuste_greedy.intervalo_exponente[0]:.2f}, {ajuste_greedy.intervalo_exponente[1]:.2f}]")
+        if ajuste_dv.intervalo_exponente[1] < ajuste_greedy.intervalo_exponente[0]:
+            print(f"   ✅ DV escala mejor que Greedy")
+        elif ajuste_greedy.intervalo_exponente[1] < ajuste_dv.intervalo_exponente[0]:
+            print(f"   ✅ Greedy escala mejor que DV")
+        else:
+            print(f"   Los intervalos se solapan: no hay diferencia significativa de escalabilidad")
 
-def crear_visualizaciones_comparativas(resultados):
-    """Crea visualizaciones comparativas entre ambos algoritmos"""
+def crear_visualizaciones_comparativas(resultados, ruta_resultados='resultados_comparacion.json', segundo_plano=False):
+    """Guarda los resultados y delega el renderizado comparativo a visualizaciones.py"""
     
     if not resultados['tamanos']:
         print("No hay datos para visualizar")
-        return
+        return None
     
+    from visualizaciones import guardar_resultados, renderizar_comparativas, renderizar_en_segundo_plano
+    
+    guardar_resultados(resultados, ruta_resultados)
+    print(f"Resultados guardados en {ruta_resultados}")
     print("Generando visualizaciones comparativas...")
     
-    # Crear figura principal con múltiples subplots
-    fig, axes = plt.subplots(3, 3, figsize=(20, 15))
-    fig.suptitle('Comparación de Sobrecarga: Divide y Vencerás vs Algoritmo Voraz', fontsize=16, fontweight='bold')
-    
-    # 1. Tiempo de ejecución - Comparación directa
-    axes[0, 0].plot(resultados['tamanos'], resultados['tiempos_dv'], 'b-o', label='Divide y Vencerás', linewidth=2, markersize=6)
-    axes[0, 0].plot(resultados['tamanos'], resultados['tiempos_greedy'], 'r-s', label='Greedy Básico', linewidth=2, markersize=6)
-    axes[0, 0].plot(resultados['tamanos'], resultados['tiempos_greedy_mejorado'], 'g-^', label='Greedy Mejorado', linewidth=2, markersize=6)
-    axes[0, 0].set_xlabel('Número de Clases')
-    axes[0, 0].set_ylabel('Tiempo de Ejecución (segundos)')
-    axes[0, 0].set_title('Comparación Temporal')
-    axes[0, 0].legend()
-    axes[0, 0].grid(True, alpha=0.3)
-    
-    # 2. Uso de memoria - Comparación directa
-    axes[0, 1].plot(resultados['tamanos'], resultados['memoria_dv'], 'b-o', label='Divide y Vencerás', linewidth=2, markersize=6)
-    axes[0, 1].plot(resultados['tamanos'], resultados['memoria_greedy'], 'r-s', label='Greedy Básico', linewidth=2, markersize=6)
-    axes[0, 1].plot(resultados['tamanos'], resultados['memoria_greedy_mejorado'], 'g-^', label='Greedy Mejorado', linewidth=2, markersize=6)
-    axes[0, 1].set_xlabel('Número de Clases')
-    axes[0, 1].set_ylabel('Uso de Memoria (MB)')
-    axes[0, 1].set_title('Comparación de Memoria')
-    axes[0, 1].legend()
-    axes[0, 1].grid(True, alpha=0.3)
-    
-    # 3. Clases asignadas - Comparación directa
-    axes[0, 2].plot(resultados['tamanos'], resultados['clases_asignadas_dv'], 'b-o', label='Divide y Vencerás', linewidth=2, markersize=6)
-    axes[0, 2].plot(resultados['tamanos'], resultados['clases_asignadas_greedy'], 'r-s', label='Greedy Básico', linewidth=2, markersize=6)
-    axes[0, 2].plot(resultados['tamanos'], resultados['clases_asignadas_greedy_mejorado'], 'g-^', label='Greedy Mejorado', linewidth=2, markersize=6)
-    axes[0, 2].plot(resultados['tamanos'], resultados['tamanos'], 'k--', alpha=0.5, label='Máximo teórico')
-    axes[0, 2].set_xlabel('Número de Clases')
-    axes[0, 2].set_ylabel('Clases Asignadas')
-    axes[0, 2].set_title('Comparación de Eficiencia')
-    axes[0, 2].legend()
-    axes[0, 2].grid(True, alpha=0.3)
-    
-    # 4. Eficiencia (clases por segundo) - Comparación directa
-    axes[1, 0].plot(resultados['tamanos'], resultados['eficiencia_dv'], 'b-o', label='Divide y Vencerás', linewidth=2, markersize=6)
-    axes[1, 0].plot(resultados['tamanos'], resultados['eficiencia_greedy'], 'r-s', label='Greedy Básico', linewidth=2, markersize=6)
-    axes[1, 0].plot(resultados['tamanos'], resultados['eficiencia_greedy_mejorado'], 'g-^', label='Greedy Mejorado', linewidth=2, markersize=6)
-    axes[1, 0].set_xlabel('Número de Clases')
-    axes[1, 0].set_ylabel('Eficiencia (clases/segundo)')
-    axes[1, 0].set_title('Comparación de Eficiencia')
-    axes[1, 0].legend()
-    axes[1, 0].grid(True, alpha=0.3)
-    
-    # 5. Ratio de tiempo (DV/Greedy)
-    ratios_tiempo = [t_dv/t_g if t_g > 0 else 0 for t_dv, t_g in zip(resultados['tiempos_dv'], resultados['tiempos_greedy'])]
-    axes[1, 1].plot(resultados['tamanos'], ratios_tiempo, 'purple', marker='d', linewidth=2, markersize=6)
-    axes[1, 1].axhline(y=1, color='k', linestyle='--', alpha=0.5, label='Línea de equilibrio')
-    axes[1, 1].set_xlabel('Número de Clases')
-    axes[1, 1].set_ylabel('Ratio de Tiempo (DV/Greedy)')
-    axes[1, 1].set_title('Ventaja Temporal Relativa')
-    axes[1, 1].legend()
-    axes[1, 1].grid(True, alpha=0.3)
-    
-    # 6. Ratio de eficiencia (DV/Greedy)
-    ratios_eficiencia = [e_dv/e_g if e_g > 0 else 0 for e_dv, e_g in zip(resultados['eficiencia_dv'], resultados['eficiencia_greedy'])]
-    axes[1, 2].plot(resultados['tamanos'], ratios_eficiencia, 'orange', marker='o', linewidth=2, markersize=6)
-    axes[1, 2].axhline(y=1, color='k', linestyle='--', alpha=0.5, label='Línea de equilibrio')
-    axes[1, 2].set_xlabel('Número de Clases')
-    axes[1, 2].set_ylabel('Ratio de Eficiencia (DV/Greedy)')
-    axes[1, 2].set_title('Ventaja de Eficiencia Relativa')
-    axes[1, 2].legend()
-    axes[1, 2].grid(True, alpha=0.3)
-    
-    # 7. Comportamiento recursivo vs iterativo
-    axes[2, 0].plot(resultados['tamanos'], resultados['llamadas_recursivas'], 'b-o', label='Llamadas Recursivas (DV)', linewidth=2, markersize=6)
-    axes[2, 0].plot(resultados['tamanos'], resultados['iteraciones_greedy'], 'r-s', label='Iteraciones (Greedy)', linewidth=2, markersize=6)
-    axes[2, 0].set_xlabel('Número de Clases')
-    axes[2, 0].set_ylabel('Operaciones')
-    axes[2, 0].set_title('Comportamiento Recursivo vs Iterativo')
-    axes[2, 0].legend()
-    axes[2, 0].grid(True, alpha=0.3)
-    
-    # 8. Análisis logarítmico - Tiempo
-    axes[2, 1].loglog(resultados['tamanos'], resultados['tiempos_dv'], 'b-o', label='Divide y Vencerás')
-    axes[2, 1].loglog(resultados['tamanos'], resultados['tiempos_greedy'], 'r-s', label='Greedy Básico')
-    axes[2, 1].loglog(resultados['tamanos'], resultados['tiempos_greedy_mejorado'], 'g-^', label='Greedy Mejorado')
-    axes[2, 1].set_xlabel('Número de Clases (log)')
-    axes[2, 1].set_ylabel('Tiempo (log)')
-    axes[2, 1].set_title('Análisis Logarítmico - Tiempo')
-    axes[2, 1].legend()
-    axes[2, 1].grid(True, alpha=0.3)
-    
-    # 9. Mejoras locales del Greedy
-    axes[2, 2].plot(resultados['tamanos'], resultados['mejoras_locales'], 'g-^', linewidth=2, markersize=6)
-    axes[2, 2].set_xlabel('Número de Clases')
-    axes[2, 2].set_ylabel('Mejoras Locales')
-    axes[2, 2].set_title('Optimización Local (Greedy Mejorado)')
-    axes[2, 2].grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('comparacion_sobrecarga_algoritmos.png', dpi=300, bbox_inches='tight')
-    plt.show()
-    
-    # Gráfica adicional: Análisis de puntos de equilibrio
-    plt.figure(figsize=(15, 10))
-    
-    plt.subplot(2, 3, 1)
-    plt.semilogx(resultados['tamanos'], ratios_tiempo, 'purple', marker='d', linewidth=2, markersize=6)
-    plt.axhline(y=1, color='k', linestyle='--', alpha=0.5, label='Equilibrio')
-    plt.xlabel('Número de Clases (log)')
-    plt.ylabel('Ratio de Tiempo (DV/Greedy)')
-    plt.title('Punto de Equilibrio Temporal')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 3, 2)
-    plt.semilogx(resultados['tamanos'], ratios_eficiencia, 'orange', marker='o', linewidth=2, markersize=6)
-    plt.axhline(y=1, color='k', linestyle='--', alpha=0.5, label='Equilibrio')
-    plt.xlabel('Número de Clases (log)')
-    plt.ylabel('Ratio de Eficiencia (DV/Greedy)')
-    plt.title('Punto de Equilibrio de Eficiencia')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 3, 3)
-    plt.semilogx(resultados['tamanos'], resultados['eficiencia_dv'], 'b-o', label='Divide y Vencerás')
-    plt.semilogx(resultados['tamanos'], resultados['eficiencia_greedy'], 'r-s', label='Greedy Básico')
-    plt.semilogx(resultados['tamanos'], resultados['eficiencia_greedy_mejorado'], 'g-^', label='Greedy Mejorado')
-    plt.xlabel('Número de Clases (log)')
-    plt.ylabel('Eficiencia (clases/segundo)')
-    plt.title('Eficiencia vs Tamaño (Log)')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 3, 4)
-    plt.semilogx(resultados['tamanos'], resultados['memoria_dv'], 'b-o', label='Divide y Vencerás')
-    plt.semilogx(resultados['tamanos'], resultados['memoria_greedy'], 'r-s', label='Greedy Básico')
-    plt.semilogx(resultados['tamanos'], resultados['memoria_greedy_mejorado'], 'g-^', label='Greedy Mejorado')
-    plt.xlabel('Número de Clases (log)')
-    plt.ylabel('Memoria (MB)')
-    plt.title('Memoria vs Tamaño (Log)')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 3, 5)
-    plt.semilogx(resultados['tamanos'], resultados['llamadas_recursivas'], 'b-o', label='Llamadas Recursivas')
-    plt.semilogx(resultados['tamanos'], resultados['iteraciones_greedy'], 'r-s', label='Iteraciones Greedy')
-    plt.xlabel('Número de Clases (log)')
-    plt.ylabel('Operaciones')
-    plt.title('Comportamiento vs Tamaño (Log)')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 3, 6)
-    # Comparación de escalabilidad
-    if len(resultados['tiempos_dv']) > 1 and len(resultados['tiempos_greedy']) > 1:
-        escalabilidad_dv = []
-        escalabilidad_greedy = []
-        
-        for i in range(1, len(resultados['tiempos_dv'])):
-            if resultados['tiempos_dv'][i-1] > 0:
-                escalabilidad_dv.append(resultados['tiempos_dv'][i] / resultados['tiempos_dv'][i-1])
-            if resultados['tiempos_greedy'][i-1] > 0:
-                escalabilidad_greedy.append(resultados['tiempos_greedy'][i] / resultados['tiempos_greedy'][i-1])
-        
-        if escalabilidad_dv and escalabilidad_greedy:
-            plt.plot(resultados['tamanos'][1:], escalabilidad_dv, 'b-o', label='DV', linewidth=2, markersize=6)
-            plt.plot(resultados['tamanos'][1:], escalabilidad_greedy, 'r-s', label='Greedy', linewidth=2, markersize=6)
-            plt.xlabel('Número de Clases')
-            plt.ylabel('Factor de Crecimiento')
-            plt.title('Escalabilidad Relativa')
-            plt.legend()
-            plt.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('analisis_equilibrio_algoritmos.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    if segundo_plano:
+        return renderizar_en_segundo_plano('comparacion', ruta_resultados)
+    
+    renderizar_comparativas(ruta_resultados)
+    return None
 
 def main():
     """Función principal para ejecutar las pruebas comparativas"""
@@ -429,22 +307,21 @@ def main():
     # Analizar puntos de equilibrio
     analisis_punto_equilibrio(resultados)
     
-    # Crear visualizaciones comparativas
-    crear_visualizaciones_comparativas(resultados)
+    # Crear visualizaciones comparativas (renderizadas en otro proceso)
+    proceso_graficas = crear_visualizaciones_comparativas(resultados, segundo_plano=True)
     
     print("="*80)
     print("PRUEBAS COMPARATIVAS COMPLETADAS")
     print("="*80)
+    if proceso_graficas is not None:
+        proceso_graficas.join()
     print("Archivos generados:")
+    print("- resultados_comparacion.json")
     print("- comparacion_sobrecarga_algoritmos.png")
     print("- analisis_equilibrio_algoritmos.png")
     print()
-    print("CONCLUSIONES PRINCIPALES:")
-    print("- Divide y Vencerás es más eficiente para problemas medianos y grandes")
-    print("- Algoritmo Voraz es más rápido para problemas pequeños")
-    print("- Greedy Mejorado ofrece el mejor balance general")
-    print("- El punto de equilibrio está alrededor de 100-200 clases")
-    print("- La escalabilidad de DV es más predecible que la de Greedy")
+    print("El punto de equilibrio y los exponentes de escalabilidad se estiman con los")
+    print("datos medidos (ver ANÁLISIS DE PUNTO DE EQUILIBRIO).")
 
 if __name__ == "__main__":
     main()
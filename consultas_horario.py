@@ -0,0 +1,196 @@
+"""
+Índices de consulta sobre un horario producido.
+
+`HorarioIndexado` amplía el `HorarioReparable` de la reparación local, que ya
+agrupa las asignaciones por clase, (aula, día) y (profesor, día) y guarda la
+ocupación en bits, con índices por día y por (día, hora) y las aulas
+ordenadas por capacidad. Cada consulta ("qué tiene el aula X el martes", "la
+semana de la Dra. López", "qué aulas de 60 plazas están libres el jueves de
+10 a 12") cuesta O(1) u O(log n) más el tamaño de la respuesta, en vez de
+recorrer `horarios_asignados`. `agregar`, `quitar` y `mover` actualizan los
+índices de forma incremental.
+
+Los planificadores devuelven la vista con `horario()`: es el mismo objeto que
+usa `reparar`, así que las ediciones y las reparaciones se ven en ambos, se
+anotan en el diario del planificador (las instantáneas las deshacen) y las
+franjas bloqueadas por disrupciones cuentan como ocupadas. Mientras el
+planificador solo añada asignaciones, la vista se extiende con las nuevas en
+lugar de reconstruirse.
+
+Uso:
+    python consultas_horario.py --tamano 5000 --aulas 150
+"""
+
+import argparse
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from indice_ocupacion import DIA_COMPLETO, HORA_APERTURA, mascara, ventanas
+from reparacion import HorarioReparable, horario_reparable
+
+
+def _horas(bits: int) -> List[int]:
+    horas = []
+    while bits:
+        bit = bits & -bits
+        horas.append(HORA_APERTURA + bit.bit_length() - 1)
+        bits ^= bit
+    return horas
+
+
+class HorarioIndexado(HorarioReparable):
+
+    def __init__(self, horarios, aulas, tipos, diario=None, disrupciones=None):
+        self._por_dia: Dict[str, set] = {}
+        self._por_franja: Dict[Tuple[str, int], set] = {}
+        # Aulas ordenadas por capacidad para buscar por capacidad mínima con bisect
+        self._aulas_por_capacidad = sorted(aulas, key=lambda a: a.capacidad)
+        self._capacidades = [a.capacidad for a in self._aulas_por_capacidad]
+        super().__init__(horarios, aulas, tipos, diario, disrupciones)
+        self.dias = self._orden_dias
+
+    def __len__(self) -> int:
+        return len(self._asignaciones)
+
+    def __contains__(self, id_clase: int) -> bool:
+        return id_clase in self._asignaciones
+
+    def _alta(self, h):
+        super()._alta(h)
+        id_clase, dia = h.clase.id, h.dia.name
+        self._por_dia.setdefault(dia, set()).add(id_clase)
+        for hora in range(h.hora_inicio, h.hora_fin):
+            self._por_franja.setdefault((dia, hora), set()).add(id_clase)
+
+    def _baja(self, h):
+        super()._baja(h)
+        id_clase, dia = h.clase.id, h.dia.name
+        self._por_dia[dia].discard(id_clase)
+        for hora in range(h.hora_inicio, h.hora_fin):
+            self._por_franja[(dia, hora)].discard(id_clase)
+
+    # --- Consultas ---
+
+    def _ordenadas(self, grupos) -> List:
+        return sorted((self._asignaciones[i] for grupo in grupos if grupo for i in grupo),
+                      key=lambda h: (self.dias.index(h.dia.name), h.hora_inicio, h.aula.id))
+
+    def de_clase(self, id_clase: int):
+        return self._asignaciones.get(id_clase)
+
+    def de_aula(self, id_aula: str, dia: Optional[str] = None) -> List:
+        """Asignaciones del aula (en un día o en toda la semana) por día y hora"""
+        dias = [dia] if dia else self.dias
+        return self._ordenadas(self._por_aula.get((id_aula, d)) for d in dias)
+
+    def de_profesor(self, profesor: str, dia: Optional[str] = None) -> List:
+        dias = [dia] if dia else self.dias
+        return self._ordenadas(self._por_profesor.get((profesor, d)) for d in dias)
+
+    def del_dia(self, dia: str) -> List:
+        return self._ordenadas([self._por_dia.get(dia)])
+
+    def en_curso(self, dia: str, hora: int) -> List:
+        """Clases que se están impartiendo el `dia` a la `hora`"""
+        return self._ordenadas([self._por_franja.get((dia, hora))])
+
+    def aula_libre(self, id_aula: str, dia: str, hora_inicio: int, duracion: int = 1) -> bool:
+        return not self.ocupacion.aulas.get((id_aula, dia), 0) & mascara(hora_inicio, duracion)
+
+    def profesor_libre(self, profesor: str, dia: str, hora_inicio: int, duracion: int = 1) -> bool:
+        return not self.ocupacion.profesores.get((profesor, dia), 0) & mascara(hora_inicio, duracion)
+
+    def inicios_libres_aula(self, id_aula: str, dia: str, duracion: int = 1) -> List[int]:
+        """Horas en las que puede empezar una clase de `duracion` horas en el aula"""
+        return _horas(ventanas(~self.ocupacion.aulas.get((id_aula, dia), 0) & DIA_COMPLETO, duracion))
+
+    def inicios_libres_profesor(self, profesor: str, dia: str, duracion: int = 1) -> List[int]:
+        return _horas(ventanas(~self.ocupacion.profesores.get((profesor, dia), 0) & DIA_COMPLETO, duracion))
+
+    def aulas_libres(self, dia: str, hora_inicio: int, duracion: int = 1, capacidad_minima: int = 0) -> List:
+        """Aulas libres en la franja con al menos `capacidad_minima` plazas, de menor a mayor capacidad"""
+        bits = mascara(hora_inicio, duracion)
+        inicio = bisect_left(self._capacidades, capacidad_minima)
+        return [aula for aula in self._aulas_por_capacidad[inicio:]
+                if not self.ocupacion.aulas.get((aula.id, dia), 0) & bits]
+
+    def primera_franja_libre(self, clase) -> Optional[Tuple[str, int, str]]:
+        """(día, hora, id de aula) donde cabría `clase` ahora mismo, o None"""
+        validas = self._aulas_por_capacidad[bisect_left(self._capacidades, clase.estudiantes):]
+        colocacion = self.ocupacion.primera_libre(clase, list(self.tipos.DiaSemana), validas)
+        if colocacion is None:
+            return None
+        dia, hora, aula = colocacion
+        return dia.name, hora, aula.id
+
+
+def horario_de(planificador, tipos=None) -> HorarioIndexado:
+    """
+    Vista indexada del horario de un planificador: su `HorarioReparable`
+    guardado (`reparacion.horario_reparable`), que se extiende con las
+    asignaciones añadidas y se reconstruye si la lista se sustituye.
+    """
+    return horario_reparable(planificador, tipos, HorarioIndexado)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Consultas indexadas frente a filtrado lineal del horario")
+    parser.add_argument('--tamano', type=int, default=5000)
+    parser.add_argument('--aulas', type=int, default=150)
+    parser.add_argument('--profesores', type=int, default=400)
+    parser.add_argument('--consultas', type=int, default=2000)
+    parser.add_argument('--semilla', type=int, default=42)
+    args = parser.parse_args()
+
+    import random
+    import time
+    import algoritmo_voraz
+
+    random.seed(args.semilla)
+    clases, aulas = algoritmo_voraz.generar_datos_prueba_greedy(args.tamano, args.aulas,
+                                                                num_profesores=args.profesores)
+    planificador = algoritmo_voraz.PlanificadorVoraz(aulas)
+    planificador.replanificar(clases, [])
+    horarios = planificador.horarios_asignados
+
+    inicio = time.perf_counter()
+    vista = planificador.horario()
+    print(f"{len(vista)} asignaciones indexadas en {(time.perf_counter() - inicio) * 1000:.1f} ms\n")
+
+    dias = vista.dias
+    profesores = sorted({c.profesor for c in clases})
+    consultas = [(random.choice(aulas).id, random.choice(profesores), random.choice(dias))
+                 for _ in range(args.consultas)]
+
+    inicio = time.perf_counter()
+    lineal = [(len([h for h in horarios if h.aula.id == aula and h.dia.name == dia]),
+               len([h for h in horarios if h.clase.profesor == profesor]))
+              for aula, profesor, dia in consultas]
+    tiempo_lineal = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    indexado = [(len(vista.de_aula(aula, dia)), len(vista.de_profesor(profesor)))
+                for aula, profesor, dia in consultas]
+    tiempo_indexado = time.perf_counter() - inicio
+
+    print(f"{args.consultas} pares de consultas (aula en un día, semana de un profesor):")
+    print(f"   Filtrado lineal: {tiempo_lineal / args.consultas * 1e6:8.1f} µs por par")
+    print(f"   Indexado:        {tiempo_indexado / args.consultas * 1e6:8.1f} µs por par "
+          f"({tiempo_lineal / tiempo_indexado:.0f}x) {'✅' if lineal == indexado else '❌ resultados distintos'}")
+
+    aula = aulas[0]
+    print(f"\n{aula.id} el martes: " + ", ".join(f"{h.hora_inicio}-{h.hora_fin} {h.clase.nombre}"
+                                                for h in vista.de_aula(aula.id, 'MARTES')))
+    print(f"Inicios libres de 2 h en {aula.id} el martes: {vista.inicios_libres_aula(aula.id, 'MARTES', 2)}")
+    libres = vista.aulas_libres('JUEVES', 10, 2, capacidad_minima=60)
+    print(f"Aulas de ≥60 plazas libres el jueves 10-12: {len(libres)}")
+
+    h = horarios[0]
+    destino = vista.primera_franja_libre(h.clase)
+    if destino and vista.mover(h.clase.id, *destino):
+        print(f"Clase {h.clase.id} movida a {destino}: índices actualizados "
+              f"({'✅' if vista.de_clase(h.clase.id) in vista.de_aula(destino[2], destino[0]) else '❌'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Cotas superiores rápidas del número de clases asignables y brecha de optimalidad.
+
+Cada cota relaja el problema de otra forma y vale para cualquier planificador;
+la cota reportada es la mínima. Todas cuestan O(n log n) o menos:
+
+- factibles: clases que caben en alguna aula (capacidad) y en la ventana diaria.
+- capacidad por banda: ordenando las aulas por capacidad, las clases que solo
+  caben en las k aulas más grandes compiten por 50·k horas-aula. Para cada k,
+  como mucho caben las más cortas de esa banda que sumen ≤ 50·k horas, más
+  todas las de fuera de la banda.
+- profesor: cada profesor tiene 50 horas semanales; de sus clases caben como
+  mucho las más cortas que sumen ≤ 50 horas.
+- emparejamiento por franja: en cada una de las 50 franjas horarias las
+  clases simultáneas forman un emparejamiento profesor-aula (un profesor y un
+  aula por clase). Con M el emparejamiento máximo, las horas de clase totales
+  son ≤ 50·M.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from indice_ocupacion import HORA_APERTURA, HORA_CIERRE
+
+HORAS_DIA = HORA_CIERRE - HORA_APERTURA
+DIAS = 5
+HORAS_SEMANA = DIAS * HORAS_DIA
+
+
+def _max_mas_cortas(duraciones_ordenadas, presupuesto):
+    """Cuántas de las duraciones (ya ordenadas ascendentemente) caben en `presupuesto` horas"""
+    return int(np.searchsorted(np.cumsum(duraciones_ordenadas), presupuesto, side='right'))
+
+
+@dataclass
+class CotasSuperiores:
+    total: int
+    factibles: int
+    capacidad_por_banda: int
+    profesor: int
+    emparejamiento: int
+
+    @property
+    def cota(self) -> int:
+        return min(self.factibles, self.capacidad_por_banda, self.profesor, self.emparejamiento)
+
+    @property
+    def restriccion_activa(self) -> str:
+        cotas = {'factibles': self.factibles, 'capacidad_por_banda': self.capacidad_por_banda,
+                 'profesor': self.profesor, 'emparejamiento': self.emparejamiento}
+        return min(cotas, key=cotas.get)
+
+    def brecha(self, asignadas: int) -> float:
+        """Fracción de la cota que el planificador no alcanzó (0 = óptimo demostrado)"""
+        return (self.cota - asignadas) / self.cota if self.cota > 0 else 0.0
+
+    def describir(self, asignadas: Optional[int] = None) -> str:
+        texto = f"cota superior {self.cota}/{self.total} ({self.restriccion_activa})"
+        if asignadas is not None:
+            texto += f", brecha {self.brecha(asignadas) * 100:.1f}%"
+        return texto
+
+
+def calcular_cotas_tablas(clases, aulas) -> CotasSuperiores:
+    """Cotas a partir de columnas: clases {'duracion', 'estudiantes', 'profesor'}, aulas {'capacidad'}"""
+    duracion = np.asarray(clases['duracion'], dtype=np.int64)
+    estudiantes = np.asarray(clases['estudiantes'], dtype=np.int64)
+    profesor = np.asarray(clases['profesor'], dtype=np.int64)
+    capacidades = np.sort(np.asarray(aulas['capacidad'], dtype=np.int64))[::-1]
+    total = len(duracion)
+    if total == 0 or len(capacidades) == 0:
+        return CotasSuperiores(total, 0, 0, 0, 0)
+
+    # Número de aulas (las más grandes) en las que cabe cada clase
+    aulas_validas = np.searchsorted(-capacidades, -estudiantes, side='right')
+    factible = (aulas_validas > 0) & (duracion >= 1) & (duracion <= HORAS_DIA)
+    duracion, aulas_validas, profesor = duracion[factible], aulas_validas[factible], profesor[factible]
+    factibles = len(duracion)
+
+    # Capacidad por banda: histograma de duraciones acumulado por número de
+    # aulas válidas; las duraciones están acotadas por HORAS_DIA, así que cada
+    # banda se resuelve en O(HORAS_DIA)
+    bandas, indice_banda = np.unique(aulas_validas, return_inverse=True)
+    conteos = np.zeros((len(bandas), HORAS_DIA + 1), dtype=np.int64)
+    np.add.at(conteos, (indice_banda, duracion), 1)
+    conteos = np.cumsum(conteos, axis=0)
+    cota_banda = factibles
+    for k, conteo in zip(bandas, conteos):
+        restante, caben = HORAS_SEMANA * int(k), 0
+        for d in range(1, HORAS_DIA + 1):
+            tomadas = min(int(conteo[d]), restante // d)
+            caben += tomadas
+            restante -= tomadas * d
+        cota_banda = min(cota_banda, caben + factibles - int(conteo.sum()))
+
+    # Profesor: las más cortas de cada profesor que suman ≤ 50 horas
+    orden = np.lexsort((duracion, profesor))
+    prof_ordenado, dur_ordenada = profesor[orden], duracion[orden]
+    acumulada = np.cumsum(dur_ordenada)
+    inicio_grupo = np.r_[0, np.nonzero(np.diff(prof_ordenado))[0] + 1]
+    base = np.repeat(np.r_[0, acumulada][inicio_grupo], np.diff(np.r_[inicio_grupo, len(orden)]))
+    cota_profesor = int(np.count_nonzero(acumulada - base <= HORAS_SEMANA))
+
+    # Emparejamiento profesor-aula por franja: cada profesor usa aulas con
+    # capacidad ≥ su clase factible más pequeña (grafo umbral, el voraz es óptimo)
+    requisito = np.full(int(profesor.max()) + 1 if factibles else 0, np.iinfo(np.int64).max)
+    np.minimum.at(requisito, profesor, estudiantes[factible])
+    requisito = np.sort(requisito[requisito < np.iinfo(np.int64).max])
+    emparejados = 0
+    for capacidad in capacidades[::-1]:
+        if emparejados < len(requisito) and requisito[emparejados] <= capacidad:
+            emparejados += 1
+    cota_emparejamiento = _max_mas_cortas(np.sort(duracion), HORAS_SEMANA * emparejados)
+
+    return CotasSuperiores(total, factibles, int(cota_banda), cota_profesor, cota_emparejamiento)
+
+
+def calcular_cotas(clases, aulas) -> CotasSuperiores:
+    """Cotas para listas de `Clase` y `Aula` de cualquiera de los planificadores"""
+    from formato_columnar import tablas_desde_horario
+    tablas, _, _ = tablas_desde_horario([], clases, aulas)
+    return calcular_cotas_tablas(tablas['clases'], tablas['aulas'])
@@ -1,12 +1,12 @@
 import time
+import math
 import random
-import matplotlib.pyplot as plt
-import numpy as np
 from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional
 from enum import Enum
-import psutil
 import os
+import sys
+from transacciones import PlanificadorTransaccional
 
 class DiaSemana(Enum):
     LUNES = "Lunes"
@@ -39,9 +39,19 @@ class HorarioAsignado:
     hora_fin: int
     aula: Aula
 
-class PlanificadorDivideVenceras:
+FASES_DV = ('division', 'verificacion_conflictos', 'construccion_objetos')
+
+def _perfil_fases_vacio() -> Dict:
+    perfil = {fase: {'tiempo': 0.0, 'llamadas': 0} for fase in FASES_DV}
+    perfil['verificacion_conflictos']['comparaciones'] = 0
+    return perfil
+
+class PlanificadorDivideVenceras(PlanificadorTransaccional):
     
-    def __init__(self, aulas: List[Aula]):
+    ATRIBUTOS_INSTANTANEA = ('estadisticas_recursion', 'perfil_fases', 'resultados_replanificacion',
+                             'resultados_reparacion', 'truncado', 'token', 'disrupciones')
+    
+    def __init__(self, aulas: List[Aula], instrumentar: bool = False):
         self.aulas = aulas
         self.horarios_asignados: List[HorarioAsignado] = []
         self.estadisticas_recursion = {
@@ -49,29 +59,58 @@ class PlanificadorDivideVenceras:
             'niveles_maximos': 0,
             'divisiones_realizadas': 0
         }
-    
-    def _verificar_conflicto(self, clase: Clase, dia: DiaSemana, 
-                           hora_inicio: int, aula: Aula) -> bool:
+        self.instrumentar = instrumentar
+        self.perfil_fases = _perfil_fases_vacio()
+        # Plazo/cancelación opcional (TokenCancelacion) y si cortó la ejecución
+        self.token = None
+        self.truncado = False
+        self.resultados_replanificacion: Dict = {}
+        self.resultados_reparacion: Dict = {}
+        # Franjas no disponibles aplicadas con `reparar`; `replanificar` las respeta
+        self.disrupciones: List = []
+    
+    def _acumular_fase(self, fase: str, inicio: float):
+        datos = self.perfil_fases[fase]
+        datos['tiempo'] += time.perf_counter() - inicio
+        datos['llamadas'] += 1
+    
+    def _indice_conflicto(self, clase: Clase, dia: DiaSemana, 
+                          hora_inicio: int, aula: Aula) -> int:
         hora_fin = hora_inicio + clase.duracion
         
-        for horario in self.horarios_asignados:
+        for i, horario in enumerate(self.horarios_asignados):
             if (horario.aula.id == aula.id and 
                 horario.dia == dia and
                 not (hora_fin <= horario.hora_inicio or hora_inicio >= horario.hora_fin)):
-                return True
+                return i
             
             if (horario.clase.profesor == clase.profesor and
                 horario.dia == dia and
                 not (hora_fin <= horario.hora_inicio or hora_inicio >= horario.hora_fin)):
-                return True
+                return i
         
-        return False
+        return -1
+    
+    def _verificar_conflicto(self, clase: Clase, dia: DiaSemana, 
+                           hora_inicio: int, aula: Aula) -> bool:
+        if not self.instrumentar:
+            return self._indice_conflicto(clase, dia, hora_inicio, aula) >= 0
+        
+        inicio = time.perf_counter()
+        indice = self._indice_conflicto(clase, dia, hora_inicio, aula)
+        self._acumular_fase('verificacion_conflictos', inicio)
+        self.perfil_fases['verificacion_conflictos']['comparaciones'] += (
+            indice + 1 if indice >= 0 else len(self.horarios_asignados)
+        )
+        return indice >= 0
     
     def _asignar_horario(self, clase: Clase, dia: DiaSemana, 
                         hora_inicio: int, aula: Aula) -> bool:
         if self._verificar_conflicto(clase, dia, hora_inicio, aula):
             return False
         
+        if self.instrumentar:
+            inicio = time.perf_counter()
         horario = HorarioAsignado(
             clase=clase,
             dia=dia,
@@ -79,11 +118,24 @@ class PlanificadorDivideVenceras:
             hora_fin=hora_inicio + clase.duracion,
             aula=aula
         )
+        if self.instrumentar:
+            self._acumular_fase('construccion_objetos', inicio)
         
         self.horarios_asignados.append(horario)
         return True
 
-    def divide_venceras(self, clases: List[Clase], nivel_recursion: int = 0) -> List[HorarioAsignado]:    
+    def _expirado(self) -> bool:
+        if self.token is not None and self.token.expirado():
+            self.truncado = True
+            return True
+        return False
+
+    def divide_venceras(self, clases: List[Clase], nivel_recursion: int = 0,
+                        token=None) -> List[HorarioAsignado]:
+        """Con `token`, al expirar deja de colocar clases y devuelve el horario parcial"""
+        self.token = token
+        if nivel_recursion == 0:
+            self.truncado = False
         self.estadisticas_recursion['llamadas_recursivas'] += 1
         self.estadisticas_recursion['niveles_maximos'] = max(
             self.estadisticas_recursion['niveles_maximos'], nivel_recursion
@@ -93,6 +145,8 @@ class PlanificadorDivideVenceras:
             return []
         
         if len(clases) == 1:
+            if self._expirado():
+                return []
             clase = clases[0]
             for dia in DiaSemana:
                 for hora in range(8, 18 - clase.duracion + 1):
@@ -102,11 +156,15 @@ class PlanificadorDivideVenceras:
                             return [self.horarios_asignados[-1]]
             return []
         
+        if self.instrumentar:
+            inicio = time.perf_counter()
         clases_ordenadas = sorted(clases, key=lambda c: c.duracion, reverse=True)
         mitad = len(clases_ordenadas) // 2
         
         clases_largas = clases_ordenadas[:mitad]
         clases_cortas = clases_ordenadas[mitad:]
+        if self.instrumentar:
+            self._acumular_fase('division', inicio)
         
         self.estadisticas_recursion['divisiones_realizadas'] += 1
         
@@ -115,6 +173,36 @@ class PlanificadorDivideVenceras:
         
         return resultado_largas + resultado_cortas
     
+    def replanificar(self, clases: List[Clase], horario_previo, token=None) -> List[HorarioAsignado]:
+        """
+        Arranque en caliente desde `horario_previo` (lista de HorarioAsignado o
+        ruta a un .hcol): conserva las asignaciones que siguen siendo válidas y
+        coloca solo las clases nuevas o invalidadas, de mayor a menor duración
+        como en la primera división. Usa un índice de ocupación en bits, así que
+        el coste depende de las clases a colocar y no del tamaño del horario.
+        No usa las franjas de las disrupciones aplicadas con `reparar`.
+        Devuelve el horario completo.
+        """
+        from indice_ocupacion import cargar_horario_previo, colocar, conservar_validas
+        
+        tipos = sys.modules[__name__]
+        if isinstance(horario_previo, (str, os.PathLike)):
+            horario_previo = cargar_horario_previo(horario_previo, tipos)
+        conservados, pendientes, indice, descartes = conservar_validas(horario_previo, clases, self.aulas, tipos,
+                                                                        self.disrupciones)
+        
+        nuevos, self.truncado = colocar(indice, sorted(pendientes, key=lambda c: c.duracion, reverse=True),
+                                        self.aulas, tipos, token=token)
+        
+        self.horarios_asignados = conservados + nuevos
+        self.resultados_replanificacion = {
+            'conservadas': len(conservados),
+            'pendientes': len(pendientes),
+            'colocadas': len(nuevos),
+            'descartes': descartes,
+        }
+        return self.horarios_asignados
+    
     def _divide_venceras_recursivo(self, clases: List[Clase], nivel_recursion: int) -> List[HorarioAsignado]:
         self.estadisticas_recursion['llamadas_recursivas'] += 1
         self.estadisticas_recursion['niveles_maximos'] = max(
@@ -125,6 +213,8 @@ class PlanificadorDivideVenceras:
             return []
         
         if len(clases) == 1:
+            if self._expirado():
+                return []
             clase = clases[0]
             for dia in DiaSemana:
                 for hora in range(8, 18 - clase.duracion + 1):
@@ -134,9 +224,13 @@ class PlanificadorDivideVenceras:
                             return [self.horarios_asignados[-1]]
             return []
         
+        if self.instrumentar:
+            inicio = time.perf_counter()
         mitad = len(clases) // 2
         primera_mitad = clases[:mitad]
         segunda_mitad = clases[mitad:]
+        if self.instrumentar:
+            self._acumular_fase('division', inicio)
         
         self.estadisticas_recursion['divisiones_realizadas'] += 1
         
@@ -152,13 +246,19 @@ class PlanificadorDivideVenceras:
             'niveles_maximos': 0,
             'divisiones_realizadas': 0
         }
+        self.perfil_fases = _perfil_fases_vacio()
+        self.disrupciones = []
+        self.token = None
+        self.truncado = False
 
     def estadisticas(self) -> Dict:
         if not self.horarios_asignados:
             return {
                 "clases_asignadas": 0,
                 "utilizacion_aulas": {},
-                "estadisticas_recursion": self.estadisticas_recursion
+                "estadisticas_recursion": self.estadisticas_recursion,
+                "perfil_fases": self.perfil_fases,
+                "truncado": self.truncado
             }
         
         clases_asignadas = len(self.horarios_asignados)
@@ -175,11 +275,17 @@ class PlanificadorDivideVenceras:
             "clases_asignadas": clases_asignadas,
             "total_horas": total_horas,
             "utilizacion_aulas": utilizacion_aulas,
-            "estadisticas_recursion": self.estadisticas_recursion
+            "estadisticas_recursion": self.estadisticas_recursion,
+            "perfil_fases": self.perfil_fases,
+            "truncado": self.truncado
         }
 
-def generar_datos_prueba_dv(num_clases: int, num_aulas: int = 5) -> Tuple[List[Clase], List[Aula]]:
-    
+def generar_datos_prueba_dv(num_clases: int, num_aulas: int = 5, num_profesores: Optional[int] = None,
+                            pesos_duracion: Optional[Dict[int, float]] = None) -> Tuple[List[Clase], List[Aula]]:
+    """
+    Genera una instancia aleatoria. `num_profesores` recorta o amplía el grupo de
+    profesores y `pesos_duracion` ({horas: peso}) sustituye la mezcla de duraciones.
+    """
     aulas = []
     for i in range(num_aulas):
         aula = Aula(
@@ -204,10 +310,17 @@ def generar_datos_prueba_dv(num_clases: int, num_aulas: int = 5) -> Tuple[List[C
         "Dra. Pérez", "Dr. Sánchez", "Dra. Ramírez", "Dr. Torres", "Dra. Flores",
         "Dr. Morales", "Dra. Jiménez", "Dr. Ruiz", "Dra. Díaz", "Dr. Herrera"
     ]
+    if num_profesores is not None:
+        profesores = profesores[:num_profesores] + [
+            f"Prof. {i+1}" for i in range(len(profesores), num_profesores)
+        ]
+    
+    duraciones, pesos = ([1, 2, 3, 4], [0.2, 0.4, 0.3, 0.1]) if pesos_duracion is None else (
+        list(pesos_duracion), list(pesos_duracion.values()))
     
     clases = []
     for i in range(num_clases):
-        duracion = random.choices([1, 2, 3, 4], weights=[0.2, 0.4, 0.3, 0.1])[0]
+        duracion = random.choices(duraciones, weights=pesos)[0]
         
         clase = Clase(
             id=i+1,
@@ -223,6 +336,7 @@ def generar_datos_prueba_dv(num_clases: int, num_aulas: int = 5) -> Tuple[List[C
     return clases, aulas
 
 def medir_rendimiento_dv(func, *args, **kwargs):
+    import psutil
     proceso = psutil.Process(os.getpid())
     
     memoria_inicial = proceso.memory_info().rss / 1024 / 1024  # MB
@@ -237,7 +351,9 @@ def medir_rendimiento_dv(func, *args, **kwargs):
     
     return resultado, fin - inicio, memoria_final - memoria_inicial
 
-def pruebas_sobrecarga_divide_venceras():
+def pruebas_sobrecarga_divide_venceras(instrumentar: bool = True, repeticiones: int = 3,
+                                       perfil: Optional[str] = None, semilla: int = 42):
+    import statistics
     
     print("="*70)
     print("PRUEBAS DE SOBRECARGA - ALGORITMO DIVIDE Y VENCERÁS")
@@ -254,29 +370,71 @@ def pruebas_sobrecarga_divide_venceras():
         'llamadas_recursivas': [],
         'niveles_maximos': [],
         'divisiones_realizadas': [],
-        'eficiencia': []
+        'eficiencia': [],
+        'perfil_fases': [],
+        'tiempos_instrumentados': [],
+        'muestras_tiempo': [],
+        'violaciones': [],
+        'cota_superior': [],
+        'brecha': [],
+        'perfil_carga': perfil
     }
     
     print(f"Configuración de pruebas:")
     print(f"- Tamaños: {tamanos_prueba}")
     print(f"- Aulas disponibles: {num_aulas}")
     print(f"- Horarios: 8:00-18:00, lunes a viernes")
+    print(f"- Perfil de carga: {perfil or 'aleatorio (generador del módulo)'}")
+    print(f"- Repeticiones por tamaño: {repeticiones} (se reporta la mediana)")
     print()
     
     for tamano in tamanos_prueba:
         print(f"Probando con {tamano} clases...")
         
         try:
-            clases, aulas = generar_datos_prueba_dv(tamano, num_aulas)
-            
-            planificador = PlanificadorDivideVenceras(aulas)
+            if perfil is None:
+                clases, aulas = generar_datos_prueba_dv(tamano, num_aulas)
+            else:
+                from perfiles_carga import generar_perfil
+                clases, aulas = generar_perfil(perfil, tamano, num_aulas, semilla + tamano,
+                                               tipos=sys.modules[__name__])
             
-            resultado, tiempo, memoria = medir_rendimiento_dv(
-                planificador.divide_venceras, clases
-            )
+            # Las repeticiones medidas corren sin instrumentar; el perfil por
+            # fase sale de una ejecución aparte que no entra en los tiempos
+            muestras_tiempo = []
+            muestras_memoria = []
+            for _ in range(repeticiones):
+                planificador = PlanificadorDivideVenceras(aulas)
+                resultado, tiempo_repeticion, memoria_repeticion = medir_rendimiento_dv(
+                    planificador.divide_venceras, clases
+                )
+                muestras_tiempo.append(tiempo_repeticion)
+                muestras_memoria.append(memoria_repeticion)
+            tiempo = statistics.median(muestras_tiempo)
+            memoria = max(muestras_memoria)
             
             stats = planificador.estadisticas()
             
+            perfil_fases, tiempo_instrumentado = {}, 0.0
+            if instrumentar:
+                instrumentado = PlanificadorDivideVenceras(aulas, instrumentar=True)
+                inicio_instrumentado = time.perf_counter()
+                instrumentado.divide_venceras(clases)
+                tiempo_instrumentado = time.perf_counter() - inicio_instrumentado
+                perfil_fases = instrumentado.perfil_fases
+            
+            # Validación del horario producido (fuera del tiempo medido)
+            from validador import validar_horario
+            validacion = validar_horario(planificador.horarios_asignados, clases, aulas)
+            resultados['violaciones'].append(validacion.total)
+            
+            # Brecha de optimalidad frente a la cota superior de la instancia
+            from cotas import calcular_cotas
+            cotas = calcular_cotas(clases, aulas)
+            brecha = cotas.brecha(stats['clases_asignadas'])
+            resultados['cota_superior'].append(cotas.cota)
+            resultados['brecha'].append(brecha)
+            
             resultados['tamanos'].append(tamano)
             resultados['tiempos'].append(tiempo)
             resultados['memoria'].append(memoria)
@@ -284,17 +442,21 @@ def pruebas_sobrecarga_divide_venceras():
             resultados['llamadas_recursivas'].append(stats['estadisticas_recursion']['llamadas_recursivas'])
             resultados['niveles_maximos'].append(stats['estadisticas_recursion']['niveles_maximos'])
             resultados['divisiones_realizadas'].append(stats['estadisticas_recursion']['divisiones_realizadas'])
+            resultados['perfil_fases'].append(perfil_fases)
+            resultados['tiempos_instrumentados'].append(tiempo_instrumentado)
+            resultados['muestras_tiempo'].append(muestras_tiempo)
             
             eficiencia = stats['clases_asignadas'] / tiempo if tiempo > 0 else 0
             resultados['eficiencia'].append(eficiencia)
             
-            print(f"  ✅ Tiempo: {tiempo:.4f}s")
+            print(f"  ✅ Tiempo: {tiempo:.4f}s (máx {max(muestras_tiempo):.4f}s), brecha: {brecha*100:.1f}%")
             print(f"  📊 Memoria: {memoria:.2f} MB")
-            print(f"  🎯 Clases asignadas: {stats['clases_asignadas']}/{tamano} ({stats['clases_asignadas']/tamano*100:.1f}%)")
+            print(f"  🎯 Clases asignadas: {stats['clases_asignadas']}/{tamano} ({stats['clases_asignadas']/tamano*100:.1f}%), cota superior {cotas.cota} ({cotas.restriccion_activa})")
             print(f"  🔄 Llamadas recursivas: {stats['estadisticas_recursion']['llamadas_recursivas']}")
             print(f"  📈 Niveles máximos: {stats['estadisticas_recursion']['niveles_maximos']}")
             print(f"  ✂️  Divisiones: {stats['estadisticas_recursion']['divisiones_realizadas']}")
             print(f"  ⚡ Eficiencia: {eficiencia:.2f} clases/s")
+            print(f"  🔍 Validación: {validacion.describir()}")
             print()
             
         except Exception as e:
@@ -324,8 +486,9 @@ def analisis_cuellos_botella_dv(resultados):
         if tiempo_anterior > 0:
             factor_tiempo = tiempo_actual / tiempo_anterior
             factor_tamano = tamano_actual / tamano_anterior
+            exponente_local = math.log(factor_tiempo) / math.log(factor_tamano) if factor_tiempo > 0 else 0
             print(f"   {tamano_anterior} → {tamano_actual} clases: "
-                  f"tiempo {factor_tiempo:.2f}x, tamaño {factor_tamano:.2f}x")
+                  f"tiempo {factor_tiempo:.2f}x, tamaño {factor_tamano:.2f}x (exponente local {exponente_local:.2f})")
     
     print("\n2. USO DE MEMORIA:")
     memoria_maxima = max(resultados['memoria'])
@@ -346,137 +509,40 @@ def analisis_cuellos_botella_dv(resultados):
     indice_eficiencia = resultados['eficiencia'].index(eficiencia_maxima)
     print(f"   Eficiencia máxima: {eficiencia_maxima:.2f} clases/s con {resultados['tamanos'][indice_eficiencia]} clases")
     
-    print("\n5. CUELLOS DE BOTELLA IDENTIFICADOS:")
-    
-    if len(resultados['tiempos']) > 2:
-        crecimiento_tiempo = []
-        for i in range(1, len(resultados['tiempos'])):
-            if resultados['tiempos'][i-1] > 0:
-                crecimiento = resultados['tiempos'][i] / resultados['tiempos'][i-1]
-                crecimiento_tiempo.append(crecimiento)
-        
-        if crecimiento_tiempo:
-            crecimiento_promedio = sum(crecimiento_tiempo) / len(crecimiento_tiempo)
-            if crecimiento_promedio > 2.0:
-                print(f"     CRECIMIENTO TEMPORAL: El tiempo crece {crecimiento_promedio:.2f}x por duplicación de datos")
-    
-    if len(resultados['memoria']) > 2:
-        crecimiento_memoria = []
-        for i in range(1, len(resultados['memoria'])):
-            if resultados['memoria'][i-1] > 0:
-                crecimiento = resultados['memoria'][i] / resultados['memoria'][i-1]
-                crecimiento_memoria.append(crecimiento)
-        
-        if crecimiento_memoria:
-            crecimiento_promedio = sum(crecimiento_memoria) / len(crecimiento_memoria)
-            if crecimiento_promedio > 1.5:
-                print(f"     CRECIMIENTO DE MEMORIA: La memoria crece {crecimiento_promedio:.2f}x por duplicación de datos")
-    
-    if len(resultados['llamadas_recursivas']) > 2:
-        crecimiento_recursion = []
-        for i in range(1, len(resultados['llamadas_recursivas'])):
-            if resultados['llamadas_recursivas'][i-1] > 0:
-                crecimiento = resultados['llamadas_recursivas'][i] / resultados['llamadas_recursivas'][i-1]
-                crecimiento_recursion.append(crecimiento)
-        
-        if crecimiento_recursion:
-            crecimiento_promedio = sum(crecimiento_recursion) / len(crecimiento_recursion)
-            if crecimiento_promedio > 2.5:
-                print(f"     CRECIMIENTO DE RECURSIÓN: Las llamadas recursivas crecen {crecimiento_promedio:.2f}x por duplicación de datos")
+    print("\n5. CUELLOS DE BOTELLA IDENTIFICADOS (ajuste log-log y ≈ a·n^b):")
+    from analisis_complejidad import ajustar_resultados, imprimir_ajustes
+    ajustes = ajustar_resultados(
+        resultados['tamanos'], resultados['tiempos'],
+        muestras_tiempo=resultados.get('muestras_tiempo'),
+        memoria=resultados['memoria'],
+        perfiles=resultados.get('perfil_fases'),
+        extras={'llamadas_recursivas': resultados['llamadas_recursivas']}
+    )
+    imprimir_ajustes(ajustes, resultados['tamanos'])
+    
+    if resultados.get('perfil_fases') and resultados['perfil_fases'][-1]:
+        print("\n6. PERFIL POR FASE (ejecución instrumentada aparte, tamaño mayor):")
+        from analisis_complejidad import imprimir_perfil_fases
+        imprimir_perfil_fases(resultados['perfil_fases'][-1], resultados['tiempos_instrumentados'][-1])
 
-def crear_visualizaciones_dv(resultados):
-    """Crea visualizaciones específicas para el algoritmo divide y vencerás"""
+def crear_visualizaciones_dv(resultados, ruta_resultados='resultados_dv.json', segundo_plano=False):
+    """Guarda los resultados y delega el renderizado a visualizaciones.py"""
     
     if not resultados['tamanos']:
         print("No hay datos para visualizar")
-        return
+        return None
     
+    from visualizaciones import guardar_resultados, renderizar_dv, renderizar_en_segundo_plano
+    
+    guardar_resultados(resultados, ruta_resultados)
+    print(f"Resultados guardados en {ruta_resultados}")
     print("Generando visualizaciones para Divide y Vencerás...")
     
-    fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-    fig.suptitle('Análisis de Sobrecarga - Algoritmo Divide y Vencerás', fontsize=16, fontweight='bold')
-    
-    axes[0, 0].plot(resultados['tamanos'], resultados['tiempos'], 'b-o', linewidth=2, markersize=6)
-    axes[0, 0].set_xlabel('Número de Clases')
-    axes[0, 0].set_ylabel('Tiempo de Ejecución (segundos)')
-    axes[0, 0].set_title('Escalabilidad Temporal')
-    axes[0, 0].grid(True, alpha=0.3)
-    
-    axes[0, 1].plot(resultados['tamanos'], resultados['memoria'], 'r-s', linewidth=2, markersize=6)
-    axes[0, 1].set_xlabel('Número de Clases')
-    axes[0, 1].set_ylabel('Uso de Memoria (MB)')
-    axes[0, 1].set_title('Consumo de Memoria')
-    axes[0, 1].grid(True, alpha=0.3)
-    
-    axes[0, 2].plot(resultados['tamanos'], resultados['clases_asignadas'], 'g-^', linewidth=2, markersize=6)
-    axes[0, 2].plot(resultados['tamanos'], resultados['tamanos'], 'k--', alpha=0.5, label='Máximo teórico')
-    axes[0, 2].set_xlabel('Número de Clases')
-    axes[0, 2].set_ylabel('Clases Asignadas')
-    axes[0, 2].set_title('Eficiencia en Asignación')
-    axes[0, 2].legend()
-    axes[0, 2].grid(True, alpha=0.3)
-    
-    axes[1, 0].plot(resultados['tamanos'], resultados['llamadas_recursivas'], 'm-d', linewidth=2, markersize=6)
-    axes[1, 0].set_xlabel('Número de Clases')
-    axes[1, 0].set_ylabel('Llamadas Recursivas')
-    axes[1, 0].set_title('Comportamiento Recursivo')
-    axes[1, 0].grid(True, alpha=0.3)
-    
-    axes[1, 1].plot(resultados['tamanos'], resultados['niveles_maximos'], 'c-p', linewidth=2, markersize=6)
-    axes[1, 1].set_xlabel('Número de Clases')
-    axes[1, 1].set_ylabel('Niveles Máximos de Recursión')
-    axes[1, 1].set_title('Profundidad de Recursión')
-    axes[1, 1].grid(True, alpha=0.3)
-    
-    axes[1, 2].plot(resultados['tamanos'], resultados['eficiencia'], 'orange', marker='o', linewidth=2, markersize=6)
-    axes[1, 2].set_xlabel('Número de Clases')
-    axes[1, 2].set_ylabel('Eficiencia (clases/segundo)')
-    axes[1, 2].set_title('Ratio de Eficiencia')
-    axes[1, 2].grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('sobrecarga_divide_venceras.png', dpi=300, bbox_inches='tight')
-    plt.show()
-    
-    plt.figure(figsize=(12, 8))
-    
-    plt.subplot(2, 2, 1)
-    plt.loglog(resultados['tamanos'], resultados['tiempos'], 'b-o', label='Tiempo real')
-    tiempos_teoricos = [t * (n/resultados['tamanos'][0])**2 for n, t in zip(resultados['tamanos'], resultados['tiempos'])]
-    plt.loglog(resultados['tamanos'], tiempos_teoricos, 'r--', alpha=0.7, label='O(n²) teórico')
-    plt.xlabel('Número de Clases (log)')
-    plt.ylabel('Tiempo (log)')
-    plt.title('Análisis Logarítmico - Tiempo')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 2, 2)
-    plt.loglog(resultados['tamanos'], resultados['llamadas_recursivas'], 'g-s', label='Llamadas reales')
-    llamadas_teoricas = [l * (n/resultados['tamanos'][0]) * np.log2(n/resultados['tamanos'][0]) for n, l in zip(resultados['tamanos'], resultados['llamadas_recursivas'])]
-    plt.loglog(resultados['tamanos'], llamadas_teoricas, 'r--', alpha=0.7, label='O(n log n) teórico')
-    plt.xlabel('Número de Clases (log)')
-    plt.ylabel('Llamadas Recursivas (log)')
-    plt.title('Análisis Logarítmico - Recursión')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 2, 3)
-    plt.semilogx(resultados['tamanos'], resultados['eficiencia'], 'm-^', linewidth=2, markersize=6)
-    plt.xlabel('Número de Clases (log)')
-    plt.ylabel('Eficiencia (clases/segundo)')
-    plt.title('Eficiencia vs Tamaño')
-    plt.grid(True, alpha=0.3)
-    
-    plt.subplot(2, 2, 4)
-    plt.semilogx(resultados['tamanos'], resultados['memoria'], 'c-p', linewidth=2, markersize=6)
-    plt.xlabel('Número de Clases (log)')
-    plt.ylabel('Memoria (MB)')
-    plt.title('Memoria vs Tamaño')
-    plt.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig('analisis_logaritmico_dv.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    if segundo_plano:
+        return renderizar_en_segundo_plano('dv', ruta_resultados)
+    
+    renderizar_dv(ruta_resultados)
+    return None
 
 def main():
     """Función principal para ejecutar las pruebas de sobrecarga"""
@@ -493,14 +559,19 @@ def main():
     
     analisis_cuellos_botella_dv(resultados)
     
-    crear_visualizaciones_dv(resultados)
+    # Crear visualizaciones (renderizadas en otro proceso)
+    proceso_graficas = crear_visualizaciones_dv(resultados, segundo_plano=True)
     
     print("="*70)
     print("PRUEBAS DE SOBRECARGA COMPLETADAS")
     print("="*70)
+    if proceso_graficas is not None:
+        proceso_graficas.join()
     print("Archivos generados:")
+    print("- resultados_dv.json")
     print("- sobrecarga_divide_venceras.png")
     print("- analisis_logaritmico_dv.png")
+    print("- perfil_fases_dv.png")
     print()
 if __name__ == "__main__":
     main()
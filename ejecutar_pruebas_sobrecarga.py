@@ -18,8 +18,12 @@ def mostrar_menu():
     print("2. Ejecutar pruebas de Algoritmo Voraz")
     print("3. Ejecutar comparación directa entre algoritmos")
     print("4. Ejecutar todas las pruebas (completo)")
-    print("5. Mostrar información sobre las pruebas")
-    print("6. Salir")
+    print("5. Buscar punto de quiebre (estrés adaptativo)")
+    print("6. Perfilar un algoritmo (cProfile / muestreo de pila)")
+    print("7. Barrido multidimensional (clases, aulas, profesores, duraciones)")
+    print("8. Latencia de peor caso por perfil de carga")
+    print("9. Mostrar información sobre las pruebas")
+    print("10. Salir")
     print("\n" + "="*80)
 
 def mostrar_informacion():
@@ -38,6 +42,13 @@ def mostrar_informacion():
     2. Verificar cómo escala el rendimiento con el aumento gradual de la carga
        - Identificar patrones de crecimiento temporal y espacial
        - Determinar puntos de inflexión en el rendimiento
+       - Estrés adaptativo: crecimiento geométrico + bisección hasta superar
+         un presupuesto de tiempo/memoria (cada intento en un subproceso)
+       - Barrido multidimensional: rejilla sobre clases, aulas, profesores y
+         mezcla de duraciones con elasticidad del tiempo por dimensión
+       - Perfiles de carga adversariales (profesor saturado, crisis de
+         capacidad, laboratorios largos, aulas saturadas, cola infactible)
+         para medir la latencia de peor caso
     
     3. Identificar cuellos de botella en el procesamiento
        - Analizar uso de memoria y CPU
@@ -146,6 +157,104 @@ def ejecutar_comparacion():
     except Exception as e:
         print(f"❌ Error durante la comparación: {e}")
 
+def ejecutar_estres_adaptativo():
+    """Ejecuta la búsqueda adaptativa del punto de quiebre"""
+    print("\n" + "="*60)
+    print("EJECUTANDO ESTRÉS ADAPTATIVO")
+    print("="*60)
+    
+    try:
+        entrada = input("Presupuesto de tiempo por intento en segundos [5]: ").strip()
+        presupuesto_tiempo = float(entrada) if entrada else 5.0
+        entrada = input("Presupuesto de memoria en MB (vacío = sin límite): ").strip()
+        presupuesto_memoria = float(entrada) if entrada else None
+        
+        from estres_adaptativo import pruebas_estres_adaptativo
+        pruebas_estres_adaptativo(presupuesto_tiempo=presupuesto_tiempo,
+                                  presupuesto_memoria_mb=presupuesto_memoria)
+        print("\n✅ Estrés adaptativo completado exitosamente!")
+        
+    except ValueError as e:
+        print(f"❌ Valor inválido: {e}")
+    except ImportError as e:
+        print(f"❌ Error al importar módulo de estrés adaptativo: {e}")
+        print("Asegúrate de que el archivo estres_adaptativo.py esté presente")
+    except Exception as e:
+        print(f"❌ Error durante el estrés adaptativo: {e}")
+
+def ejecutar_perfilado():
+    """Perfila un algoritmo y tamaño elegidos con cProfile o con muestreo de pila"""
+    print("\n" + "="*60)
+    print("EJECUTANDO PERFILADO")
+    print("="*60)
+    
+    try:
+        from perfilado import PLANIFICADORES, perfilar_cprofile, perfilar_muestreo
+        
+        algoritmo = input(f"Algoritmo {list(PLANIFICADORES)} [greedy]: ").strip() or 'greedy'
+        entrada = input("Número de clases [500]: ").strip()
+        tamano = int(entrada) if entrada else 500
+        modo = input("Modo (cprofile/muestreo) [cprofile]: ").strip() or 'cprofile'
+        
+        if modo == 'muestreo':
+            perfilar_muestreo(algoritmo, tamano)
+        else:
+            perfilar_cprofile(algoritmo, tamano)
+        print("\n✅ Perfilado completado exitosamente!")
+        
+    except ValueError as e:
+        print(f"❌ Valor inválido: {e}")
+    except ImportError as e:
+        print(f"❌ Error al importar módulo de perfilado: {e}")
+        print("Asegúrate de que el archivo perfilado.py esté presente")
+    except Exception as e:
+        print(f"❌ Error durante el perfilado: {e}")
+
+def ejecutar_barrido():
+    """Ejecuta el barrido multidimensional con la rejilla por defecto"""
+    print("\n" + "="*60)
+    print("EJECUTANDO BARRIDO MULTIDIMENSIONAL")
+    print("="*60)
+    
+    try:
+        entrada = input("Procesos en paralelo (vacío = uno por CPU): ").strip()
+        trabajadores = int(entrada) if entrada else None
+        
+        from barrido_multidimensional import pruebas_barrido, crear_visualizaciones_barrido
+        resultados = pruebas_barrido(trabajadores=trabajadores)
+        crear_visualizaciones_barrido(resultados)
+        print("\n✅ Barrido completado exitosamente!")
+        
+    except ValueError as e:
+        print(f"❌ Valor inválido: {e}")
+    except ImportError as e:
+        print(f"❌ Error al importar módulo de barrido: {e}")
+        print("Asegúrate de que el archivo barrido_multidimensional.py esté presente")
+    except Exception as e:
+        print(f"❌ Error durante el barrido: {e}")
+
+def ejecutar_peor_caso():
+    """Mide la latencia de peor caso de ambos planificadores con los perfiles de carga"""
+    print("\n" + "="*60)
+    print("EJECUTANDO PERFILES DE CARGA (PEOR CASO)")
+    print("="*60)
+    
+    try:
+        entrada = input("Semilla [42]: ").strip()
+        semilla = int(entrada) if entrada else 42
+        
+        from perfiles_carga import pruebas_peor_caso
+        pruebas_peor_caso(semilla=semilla)
+        print("\n✅ Pruebas de peor caso completadas exitosamente!")
+        
+    except ValueError as e:
+        print(f"❌ Valor inválido: {e}")
+    except ImportError as e:
+        print(f"❌ Error al importar módulo de perfiles de carga: {e}")
+        print("Asegúrate de que el archivo perfiles_carga.py esté presente")
+    except Exception as e:
+        print(f"❌ Error durante las pruebas de peor caso: {e}")
+
 def ejecutar_todas_las_pruebas():
     """Ejecuta todas las pruebas de sobrecarga"""
     print("\n" + "="*60)
@@ -231,7 +340,7 @@ def main():
         mostrar_menu()
         
         try:
-            opcion = input("\nSelecciona una opción (1-6): ").strip()
+            opcion = input("\nSelecciona una opción (1-10): ").strip()
             
             if opcion == "1":
                 ejecutar_divide_venceras()
@@ -246,15 +355,27 @@ def main():
                 ejecutar_todas_las_pruebas()
                 
             elif opcion == "5":
-                mostrar_informacion()
+                ejecutar_estres_adaptativo()
                 
             elif opcion == "6":
+                ejecutar_perfilado()
+                
+            elif opcion == "7":
+                ejecutar_barrido()
+                
+            elif opcion == "8":
+                ejecutar_peor_caso()
+                
+            elif opcion == "9":
+                mostrar_informacion()
+                
+            elif opcion == "10":
                 print("\n¡Gracias por usar el sistema de pruebas de sobrecarga!")
                 print("Trabajo completado exitosamente.")
                 break
                 
             else:
-                print("❌ Opción inválida. Por favor, selecciona una opción del 1 al 6.")
+                print("❌ Opción inválida. Por favor, selecciona una opción del 1 al 10.")
                 
         except KeyboardInterrupt:
             print("\n\n⚠️  Operación cancelada por el usuario.")
@@ -0,0 +1,207 @@
+"""
+Evaluación por lotes de escenarios "¿y si...?" en un pool de procesos.
+
+Cada `Escenario` describe cambios sobre una instancia base: aulas añadidas o
+eliminadas, clases añadidas o eliminadas y cambios de calendario (aulas o
+profesores no disponibles, `reparacion.Disrupcion`). La instancia base se
+publica una vez en memoria compartida (`instancia_compartida`); cada tarea
+solo envía su delta, el trabajador lo aplica sobre su copia local y planifica
+con el planificador elegido. Si el planificador admite franjas bloqueadas, los
+cambios de calendario se bloquean antes de planificar; si no, se planifica
+como si el recurso estuviera disponible y se repara después el horario
+obtenido (columna `calendario`).
+
+El resultado es una tabla con clases asignadas, utilización y tiempo por
+escenario, con la diferencia respecto a la base.
+
+Uso:
+    python escenarios.py --tamano 800 --aulas 12 --planificador greedy
+"""
+
+import argparse
+import os
+import time
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Tuple
+
+from estres_adaptativo import PLANIFICADORES
+
+# Los planificadores de portafolio y multiarranque ya usan su propio pool
+PLANIFICADORES_ESCENARIO = ['greedy', 'divide_venceras', 'exacto']
+# Planifican todos los escenarios con `replanificar` desde un horario vacío: mismo
+# resultado que su método y no usa las franjas de `disrupciones`. Los demás reparan
+# tras planificar
+PLANIFICADORES_CON_BLOQUEOS = ['greedy']
+
+
+@dataclass
+class Escenario:
+    nombre: str
+    aulas_nuevas: List[Tuple[str, int]] = field(default_factory=list)  # (id, capacidad)
+    aulas_eliminadas: List[str] = field(default_factory=list)  # ids de aula
+    clases_nuevas: List = field(default_factory=list)  # objetos Clase
+    clases_eliminadas: List[int] = field(default_factory=list)  # ids de clase
+    disrupciones: List = field(default_factory=list)  # reparacion.Disrupcion
+
+    def describir(self) -> str:
+        partes = [("aulas +", self.aulas_nuevas), ("aulas -", self.aulas_eliminadas),
+                  ("clases +", self.clases_nuevas), ("clases -", self.clases_eliminadas),
+                  ("disrupciones ", self.disrupciones)]
+        return ", ".join(f"{texto}{len(cambios)}" for texto, cambios in partes if cambios) or "sin cambios"
+
+
+def _traducir(escenario: Escenario, aulas, profesores: Dict[str, int]) -> Escenario:
+    """Pasa ids de aula y nombres de profesor a los de la instancia compartida ("A{r}", "P{i}")"""
+    from algoritmo_voraz import Clase, DiaSemana
+
+    indice_aula = {aula.id: f"A{r}" for r, aula in enumerate(aulas)}
+    nombre_profesor = lambda profesor: f"P{profesores[profesor]}" if profesor in profesores else profesor
+
+    clases_nuevas = [Clase(id=c.id, nombre=c.nombre, profesor=nombre_profesor(c.profesor), duracion=c.duracion,
+                           horario_preferido=(DiaSemana[c.horario_preferido[0].name], c.horario_preferido[1]),
+                           aula_requerida="", estudiantes=c.estudiantes)
+                     for c in escenario.clases_nuevas]
+    disrupciones = [replace(d, recurso=indice_aula.get(d.recurso, d.recurso) if d.tipo == 'aula'
+                            else nombre_profesor(d.recurso))
+                    for d in escenario.disrupciones]
+    return replace(escenario, aulas_eliminadas=[indice_aula[a] for a in escenario.aulas_eliminadas],
+                   clases_nuevas=clases_nuevas, disrupciones=disrupciones)
+
+
+def _evaluar_escenario(escenario: Escenario, planificador: str) -> Dict:
+    """Trabajador: aplica el delta a la instancia compartida y planifica con su calendario"""
+    import importlib
+    import sys
+    from algoritmo_voraz import Aula, DiaSemana
+    from indice_ocupacion import HORA_APERTURA, HORA_CIERRE
+    from instancia_compartida import instancia_trabajador
+    from reparacion import HorarioReparable
+
+    clases, aulas = instancia_trabajador()
+    eliminadas = set(escenario.clases_eliminadas)
+    clases = [c for c in clases if c.id not in eliminadas] + escenario.clases_nuevas
+    aulas_fuera = set(escenario.aulas_eliminadas)
+    aulas = ([a for a in aulas if a.id not in aulas_fuera]
+             + [Aula(id=id_aula, capacidad=capacidad, equipamiento=[]) for id_aula, capacidad in escenario.aulas_nuevas])
+
+    nombre_modulo, _, nombre_clase, metodo = PLANIFICADORES[planificador]
+    modulo = importlib.import_module(nombre_modulo)
+    inicio = time.perf_counter()
+    instancia = getattr(modulo, nombre_clase)(aulas)
+    bloquea = planificador in PLANIFICADORES_CON_BLOQUEOS
+    if bloquea:
+        instancia.disrupciones = list(escenario.disrupciones)
+        if clases:
+            instancia.replanificar(clases, [])
+    elif clases:
+        getattr(instancia, metodo)(clases)
+    horarios = list(instancia.horarios_asignados)
+
+    calendario = ('bloqueado' if bloquea else 'reparado') if escenario.disrupciones else ''
+    sin_reubicar = 0
+    if calendario == 'reparado':
+        # Alternativa: el horario se obtuvo con los recursos disponibles y se repara
+        reparable = HorarioReparable(horarios, aulas, sys.modules[type(instancia).__module__])
+        for disrupcion in escenario.disrupciones:
+            sin_reubicar += len(reparable.reparar(disrupcion).sin_reubicar)
+        horarios = reparable.horarios()
+    tiempo = time.perf_counter() - inicio
+
+    horas_disponibles = len(aulas) * (HORA_CIERRE - HORA_APERTURA) * len(DiaSemana)
+    return {
+        'escenario': escenario.nombre,
+        'cambios': escenario.describir(),
+        'clases': len(clases),
+        'aulas': len(aulas),
+        'clases_asignadas': len(horarios),
+        'porcentaje_asignadas': len(horarios) / len(clases) * 100 if clases else 0.0,
+        'utilizacion': sum(h.hora_fin - h.hora_inicio for h in horarios) / horas_disponibles * 100
+                       if horas_disponibles else 0.0,
+        'calendario': calendario,
+        'sin_reubicar': sin_reubicar,
+        'tiempo': tiempo,
+    }
+
+
+def evaluar_escenarios(clases, aulas, escenarios: List[Escenario], planificador: str = 'greedy',
+                       trabajadores: Optional[int] = None) -> List[Dict]:
+    """
+    Evalúa la base y cada escenario en paralelo. Devuelve una fila por
+    escenario (la base primero) con `diferencia_asignadas` respecto a la base.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from instancia_compartida import InstanciaCompartida, inicializar_trabajador
+
+    if planificador not in PLANIFICADORES_ESCENARIO:
+        raise ValueError(f"Planificador desconocido: {planificador}. Opciones: {PLANIFICADORES_ESCENARIO}")
+    escenarios = [Escenario('base')] + list(escenarios)
+    trabajadores = trabajadores or min(len(escenarios), os.cpu_count() or 1)
+
+    with InstanciaCompartida(clases, aulas) as instancia:
+        deltas = [_traducir(escenario, aulas, instancia.profesores) for escenario in escenarios]
+        with ProcessPoolExecutor(max_workers=trabajadores, initializer=inicializar_trabajador,
+                                 initargs=(instancia.nombre,)) as pool:
+            futuros = [pool.submit(_evaluar_escenario, delta, planificador) for delta in deltas]
+            filas = [futuro.result() for futuro in futuros]
+
+    base = filas[0]['clases_asignadas']
+    for fila in filas:
+        fila['diferencia_asignadas'] = fila['clases_asignadas'] - base
+    return filas
+
+
+def imprimir_tabla(filas: List[Dict]):
+    print(f"{'Escenario':<30} {'Clases':>7} {'Aulas':>6} {'Asignadas':>10} {'Δ':>6} "
+          f"{'%':>7} {'Utiliz.':>8} {'Tiempo':>9} {'Calendario':>10}")
+    print("-" * 101)
+    for fila in filas:
+        print(f"{fila['escenario'][:30]:<30} {fila['clases']:>7} {fila['aulas']:>6} "
+              f"{fila['clases_asignadas']:>10} {fila['diferencia_asignadas']:>+6} "
+              f"{fila['porcentaje_asignadas']:>6.1f}% {fila['utilizacion']:>7.1f}% {fila['tiempo']:>8.3f}s "
+              f"{fila['calendario']:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluación por lotes de escenarios ¿y si...?")
+    parser.add_argument('--tamano', type=int, default=800)
+    parser.add_argument('--aulas', type=int, default=12)
+    parser.add_argument('--planificador', choices=PLANIFICADORES_ESCENARIO, default='greedy')
+    parser.add_argument('--trabajadores', type=int, default=None)
+    parser.add_argument('--semilla', type=int, default=42)
+    args = parser.parse_args()
+
+    import importlib
+    import random
+    from reparacion import Disrupcion
+
+    random.seed(args.semilla)
+    nombre_modulo, generador, _, _ = PLANIFICADORES[args.planificador]
+    modulo = importlib.import_module(nombre_modulo)
+    clases, aulas = getattr(modulo, generador)(args.tamano, args.aulas)
+    extra, _ = getattr(modulo, generador)(args.tamano // 10, 1)
+    siguiente_id = max(c.id for c in clases) + 1
+    for i, clase in enumerate(extra):
+        clase.id = siguiente_id + i
+
+    profesor = clases[0].profesor
+    grandes = sorted(aulas, key=lambda a: -a.capacidad)[:2]
+    escenarios = [
+        Escenario('Dos aulas de 80 plazas', aulas_nuevas=[('Nueva_1', 80), ('Nueva_2', 80)]),
+        Escenario('Sin las dos aulas mayores', aulas_eliminadas=[a.id for a in grandes]),
+        Escenario(f'{profesor} deja dos cursos',
+                  clases_eliminadas=[c.id for c in clases if c.profesor == profesor][:2]),
+        Escenario('10% más clases', clases_nuevas=extra),
+        Escenario('Viernes sin aulas mayores', disrupciones=[Disrupcion('aula', a.id, 'VIERNES') for a in grandes]),
+        Escenario(f'{profesor} sin lunes', disrupciones=[Disrupcion('profesor', profesor, 'LUNES')]),
+    ]
+
+    print(f"{len(clases)} clases, {len(aulas)} aulas, planificador {args.planificador}, "
+          f"{len(escenarios) + 1} escenarios\n")
+    inicio = time.perf_counter()
+    filas = evaluar_escenarios(clases, aulas, escenarios, args.planificador, args.trabajadores)
+    imprimir_tabla(filas)
+    print(f"\nTiempo total: {time.perf_counter() - inicio:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""
+Modo de estrés adaptativo: búsqueda del punto de quiebre de cada planificador.
+
+Aumenta el número de clases de forma geométrica hasta que un intento supera el
+presupuesto de tiempo o de memoria y luego refina por bisección entre el último
+tamaño aceptado y el primero rechazado. Cada intento se ejecuta en un
+subproceso con un timeout estricto y, con presupuesto de memoria, un límite
+duro de espacio de direcciones (RLIMIT_AS), de modo que un tamaño excesivo no
+bloquea la ejecución completa ni agota la memoria de la máquina.
+"""
+
+import argparse
+import importlib
+import math
+import multiprocessing as mp
+import os
+import random
+import signal
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# nombre -> (módulo, generador de datos, clase planificadora, método de planificación)
+PLANIFICADORES = {
+    'greedy': ('algoritmo_voraz', 'generar_datos_prueba_greedy',
+               'PlanificadorVoraz', 'greedy_adaptativo'),
+    'divide_venceras': ('divide_venceras', 'generar_datos_prueba_dv',
+                        'PlanificadorDivideVenceras', 'divide_venceras'),
+    'greedy_portafolio': ('algoritmo_voraz', 'generar_datos_prueba_greedy',
+                          'PlanificadorVoraz', 'greedy_portafolio'),
+    'greedy_multiarranque': ('algoritmo_voraz', 'generar_datos_prueba_greedy',
+                             'PlanificadorVoraz', 'greedy_multiarranque'),
+    'exacto': ('solver_exacto', 'generar_datos_prueba_exacto',
+               'PlanificadorExacto', 'ramificacion_y_poda'),
+}
+
+# El solver exacto solo tiene sentido en instancias pequeñas: no entra por defecto
+HEURISTICOS = ['greedy', 'divide_venceras']
+
+
+def _estado_proceso_mb(campo):
+    """Campo de /proc/self/status (VmRSS, VmHWM, VmSize) en MB, o None fuera de Linux"""
+    try:
+        with open('/proc/self/status') as estado:
+            for linea in estado:
+                if linea.startswith(campo + ':'):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _iniciar_medicion_memoria():
+    """
+    Memoria residente base tras reiniciar el pico del proceso (Linux), así la
+    generación de la instancia no cuenta; fuera de Linux arranca tracemalloc
+    (solo memoria de Python, y ralentiza la planificación) y devuelve None.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w') as reinicio:
+            reinicio.write('5')
+        return _estado_proceso_mb('VmRSS')
+    except OSError:
+        import tracemalloc
+        tracemalloc.start()
+        return None
+
+
+def _memoria_planificacion_mb(base):
+    """Pico de memoria durante la planificación sobre la base (MB)"""
+    if base is not None:
+        return max(0.0, _estado_proceso_mb('VmHWM') - base)
+    import tracemalloc
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return pico / 1024 / 1024
+
+
+def _limitar_memoria(presupuesto_mb):
+    """
+    Límite duro de espacio de direcciones: la memoria virtual actual más el
+    presupuesto. Superarlo lanza MemoryError en vez de agotar la máquina.
+    Devuelve el límite anterior (para levantarlo al reportar) o None.
+    """
+    if presupuesto_mb is None or resource is None:
+        return None
+    actual = _estado_proceso_mb('VmSize')
+    if actual is None:
+        import psutil
+        actual = psutil.Process(os.getpid()).memory_info().vms / 1024 / 1024
+    anterior = resource.getrlimit(resource.RLIMIT_AS)
+    limite = int((actual + presupuesto_mb) * 1024 * 1024)
+    if anterior[1] != resource.RLIM_INFINITY:
+        limite = min(limite, anterior[1])
+    resource.setrlimit(resource.RLIMIT_AS, (limite, anterior[1]))
+    return anterior
+
+
+def _ejecutar_intento(algoritmo, tamano, num_aulas, semilla, conexion, perfil=None,
+                      presupuesto_memoria_mb=None):
+    """Cuerpo del subproceso: genera la instancia, planifica y reporta métricas"""
+    if hasattr(os, 'setpgrp'):
+        # Grupo de procesos propio: al expirar se matan también los procesos
+        # que haya creado el planificador
+        os.setpgrp()
+    try:
+        nombre_modulo, nombre_generador, nombre_clase, nombre_metodo = PLANIFICADORES[algoritmo]
+        modulo = importlib.import_module(nombre_modulo)
+
+        if perfil is None:
+            random.seed(semilla)
+            clases, aulas = getattr(modulo, nombre_generador)(tamano, num_aulas)
+        else:
+            # Instancia vectorizada y cacheada en disco: los tamaños grandes no se regeneran
+            from generador_vectorizado import a_objetos, obtener_instancia
+            clases, aulas = a_objetos(obtener_instancia(tamano, num_aulas, perfil, semilla), tipos=modulo)
+        planificador = getattr(modulo, nombre_clase)(aulas)
+
+        base = _iniciar_medicion_memoria()
+        limite_anterior = _limitar_memoria(presupuesto_memoria_mb)
+        inicio = time.perf_counter()
+        try:
+            getattr(planificador, nombre_metodo)(clases)
+        except MemoryError:
+            # Levantar el límite para poder reportar
+            if limite_anterior is not None:
+                resource.setrlimit(resource.RLIMIT_AS, limite_anterior)
+            conexion.send({'error': 'memoria'})
+            return
+        tiempo = time.perf_counter() - inicio
+        memoria = _memoria_planificacion_mb(base)
+
+        conexion.send({
+            'tiempo': tiempo,
+            'memoria': memoria,
+            'clases_asignadas': planificador.estadisticas()['clases_asignadas'],
+        })
+    except Exception as e:
+        conexion.send({'error': f"{type(e).__name__}: {e}"})
+    finally:
+        conexion.close()
+
+
+def _matar_intento(proceso):
+    """Mata el subproceso de un intento y los procesos que haya creado"""
+    if hasattr(os, 'killpg'):
+        try:
+            os.killpg(proceso.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    else:
+        proceso.kill()
+    proceso.join()
+
+
+def intentar_tamano(algoritmo, tamano, presupuesto_tiempo, presupuesto_memoria_mb=None,
+                    num_aulas=8, semilla=42, holgura_arranque=5.0, perfil=None):
+    """
+    Ejecuta un intento aislado en un subproceso.
+
+    El presupuesto de tiempo se aplica al tiempo de planificación medido dentro
+    del subproceso; el timeout estricto añade `holgura_arranque` segundos para
+    cubrir el arranque del proceso y la generación de datos. Con `perfil` la
+    instancia sale del generador vectorizado (con caché en disco).
+
+    El presupuesto de memoria es un límite duro durante la planificación: un
+    intento que lo agota termina con motivo 'memoria'. La memoria reportada es
+    el pico de la planificación, sin la generación de la instancia.
+
+    El subproceso no es daemon (un proceso daemon no puede crear procesos
+    hijos), así que se mata explícitamente, junto con su grupo de procesos, si
+    sigue vivo.
+    """
+    receptor, emisor = mp.Pipe(duplex=False)
+    proceso = mp.Process(target=_ejecutar_intento,
+                         args=(algoritmo, tamano, num_aulas, semilla + tamano, emisor, perfil,
+                               presupuesto_memoria_mb))
+    inicio = time.perf_counter()
+    proceso.start()
+    emisor.close()
+
+    limite = presupuesto_tiempo + holgura_arranque
+    mensaje = None
+    expirado = False
+    try:
+        if receptor.poll(limite):
+            try:
+                mensaje = receptor.recv()
+            except EOFError:
+                mensaje = None
+        proceso.join(max(0.0, limite - (time.perf_counter() - inicio)))
+    finally:
+        if proceso.is_alive():
+            expirado = True
+            _matar_intento(proceso)
+        receptor.close()
+
+    intento = {'tamano': tamano, 'tiempo': None, 'memoria': None,
+               'clases_asignadas': None, 'dentro_presupuesto': False, 'motivo': None}
+
+    if mensaje is None:
+        intento['motivo'] = 'timeout' if expirado else f'salida {proceso.exitcode}'
+        return intento
+    if 'error' in mensaje:
+        intento['motivo'] = mensaje['error']
+        return intento
+
+    intento.update(mensaje)
+    if mensaje['tiempo'] > presupuesto_tiempo:
+        intento['motivo'] = 'tiempo'
+    elif presupuesto_memoria_mb is not None and mensaje['memoria'] > presupuesto_memoria_mb:
+        intento['motivo'] = 'memoria'
+    else:
+        intento['dentro_presupuesto'] = True
+    return intento
+
+
+def buscar_punto_quiebre(algoritmo, presupuesto_tiempo=5.0, presupuesto_memoria_mb=None,
+                         tamano_inicial=10, factor=2.0, tamano_maximo=1_000_000,
+                         tolerancia=0.05, num_aulas=8, semilla=42, verbose=True, perfil=None):
+    """
+    Busca el mayor número de clases que el planificador resuelve dentro del presupuesto.
+
+    Fase geométrica: multiplica el tamaño por `factor` hasta el primer fallo.
+    Fase de bisección: reduce el intervalo [mayor aceptado, menor rechazado]
+    hasta que su ancho relativo es menor que `tolerancia`.
+    """
+    if algoritmo not in PLANIFICADORES:
+        raise ValueError(f"Algoritmo desconocido: {algoritmo}. Opciones: {list(PLANIFICADORES)}")
+
+    intentos = []
+    mayor_aceptado = None
+    menor_rechazado = None
+
+    def probar(tamano):
+        intento = intentar_tamano(algoritmo, tamano, presupuesto_tiempo, presupuesto_memoria_mb,
+                                  num_aulas, semilla, perfil=perfil)
+        intentos.append(intento)
+        if verbose:
+            estado = '✅' if intento['dentro_presupuesto'] else f"❌ ({intento['motivo']})"
+            tiempo = f"{intento['tiempo']:.4f}s" if intento['tiempo'] is not None else '-'
+            print(f"  {algoritmo}: {tamano} clases → {tiempo} {estado}")
+        return intento['dentro_presupuesto']
+
+    tamano = tamano_inicial
+    while tamano <= tamano_maximo:
+        if probar(tamano):
+            mayor_aceptado = tamano
+            tamano = max(tamano + 1, int(math.ceil(tamano * factor)))
+        else:
+            menor_rechazado = tamano
+            break
+
+    if mayor_aceptado is not None and menor_rechazado is not None:
+        while menor_rechazado - mayor_aceptado > max(1, int(mayor_aceptado * tolerancia)):
+            medio = (mayor_aceptado + menor_rechazado) // 2
+            if probar(medio):
+                mayor_aceptado = medio
+            else:
+                menor_rechazado = medio
+
+    return {
+        'algoritmo': algoritmo,
+        'tamano_maximo': mayor_aceptado,
+        'primer_rechazo': menor_rechazado,
+        'presupuesto_tiempo': presupuesto_tiempo,
+        'presupuesto_memoria_mb': presupuesto_memoria_mb,
+        'intentos': intentos,
+    }
+
+
+def pruebas_estres_adaptativo(algoritmos=None, presupuesto_tiempo=5.0, presupuesto_memoria_mb=None,
+                              tamano_inicial=10, factor=2.0, num_aulas=8, semilla=42, perfil=None):
+    """Ejecuta la búsqueda del punto de quiebre para cada planificador y resume los resultados"""
+
+    algoritmos = algoritmos or HEURISTICOS
+
+    print("="*70)
+    print("ESTRÉS ADAPTATIVO - BÚSQUEDA DEL PUNTO DE QUIEBRE")
+    print("="*70)
+    print(f"- Presupuesto de tiempo: {presupuesto_tiempo}s por intento")
+    if presupuesto_memoria_mb is not None:
+        print(f"- Presupuesto de memoria: {presupuesto_memoria_mb} MB por intento")
+    print(f"- Aulas disponibles: {num_aulas}")
+    if perfil is not None:
+        print(f"- Instancias vectorizadas con caché, perfil: {perfil}")
+    print()
+
+    resultados = {}
+    for algoritmo in algoritmos:
+        resultados[algoritmo] = buscar_punto_quiebre(
+            algoritmo, presupuesto_tiempo, presupuesto_memoria_mb,
+            tamano_inicial=tamano_inicial, factor=factor, num_aulas=num_aulas, semilla=semilla,
+            perfil=perfil
+        )
+        print()
+
+    print("RESUMEN:")
+    for algoritmo, resultado in resultados.items():
+        if resultado['tamano_maximo'] is None:
+            print(f"   {algoritmo}: ningún tamaño cabe en el presupuesto")
+        else:
+            print(f"   {algoritmo}: hasta {resultado['tamano_maximo']} clases "
+                  f"(primer rechazo: {resultado['primer_rechazo']})")
+
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Búsqueda adaptativa del punto de quiebre")
+    parser.add_argument('--algoritmos', nargs='+', choices=list(PLANIFICADORES),
+                        default=HEURISTICOS)
+    parser.add_argument('--tiempo', type=float, default=5.0, help="Presupuesto de tiempo (s)")
+    parser.add_argument('--memoria', type=float, default=None, help="Presupuesto de memoria (MB)")
+    parser.add_argument('--inicial', type=int, default=10, help="Tamaño inicial")
+    parser.add_argument('--factor', type=float, default=2.0, help="Factor de crecimiento geométrico")
+    parser.add_argument('--aulas', type=int, default=8)
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--perfil', default=None,
+                        help="Usar el generador vectorizado con caché y este perfil (p. ej. uniforme)")
+    args = parser.parse_args()
+
+    pruebas_estres_adaptativo(args.algoritmos, args.tiempo, args.memoria,
+                              args.inicial, args.factor, args.aulas, args.semilla, args.perfil)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+"""
+Formato columnar binario para instancias y horarios.
+
+Un archivo contiene tres tablas (clases, aulas, asignaciones) como columnas de
+enteros de ancho fijo más una tabla de cadenas, con esta disposición:
+
+    MAGIA (8 bytes) | longitud del encabezado (uint64 LE) | encabezado JSON
+    | relleno hasta múltiplo de 64 | columnas alineadas a 64 bytes
+
+El encabezado describe el dtype, el número de filas y el desplazamiento de
+cada columna relativo al inicio de los datos. La carga usa `np.memmap`, por lo
+que abrir un horario de un millón de asignaciones no lee ni materializa nada
+hasta que se accede a una columna; `a_objetos` construye los dataclasses solo
+cuando se pide.
+
+Las columnas de texto (nombre, profesor, tipo de aula, id de aula) guardan
+índices en la tabla de cadenas; el equipamiento de cada aula es una máscara de
+bits sobre el catálogo `equipamiento` del encabezado (al materializar, el
+equipamiento sale en el orden del catálogo). Los días se guardan como
+índice 0-4 (lunes a viernes) y las asignaciones referencian filas de las
+tablas de clases y aulas.
+"""
+
+import argparse
+import json
+import os
+import struct
+import time
+
+import numpy as np
+
+MAGIA = b'HORCOL01'
+VERSION = 1
+ALINEACION = 64
+DIAS = ('LUNES', 'MARTES', 'MIERCOLES', 'JUEVES', 'VIERNES')
+
+ESQUEMA = {
+    'clases': {
+        'id': '<i4', 'nombre': '<i4', 'profesor': '<i4', 'duracion': '<i1',
+        'dia_preferido': '<i1', 'hora_preferida': '<i1', 'aula_requerida': '<i4', 'estudiantes': '<i2',
+    },
+    'aulas': {'id': '<i4', 'capacidad': '<i2', 'equipamiento': '<u4'},
+    'asignaciones': {'clase': '<i4', 'aula': '<i4', 'dia': '<i1', 'hora_inicio': '<i1', 'hora_fin': '<i1'},
+}
+
+
+def _alinear(posicion):
+    return (posicion + ALINEACION - 1) // ALINEACION * ALINEACION
+
+
+class _TablaCadenas:
+    """Interna cadenas y devuelve su índice"""
+
+    def __init__(self):
+        self.indices = {}
+        self.cadenas = []
+
+    def indice(self, cadena):
+        indice = self.indices.get(cadena)
+        if indice is None:
+            indice = self.indices[cadena] = len(self.cadenas)
+            self.cadenas.append(cadena)
+        return indice
+
+    def indices_de(self, cadenas):
+        return np.fromiter((self.indice(c) for c in cadenas), dtype=np.int32, count=len(cadenas))
+
+    def columnas(self):
+        """Datos UTF-8 concatenados y desplazamientos (n+1) para cortar cada cadena"""
+        codificadas = [c.encode('utf-8') for c in self.cadenas]
+        desplazamientos = np.zeros(len(codificadas) + 1, dtype='<u8')
+        np.cumsum([len(c) for c in codificadas], out=desplazamientos[1:])
+        return np.frombuffer(b''.join(codificadas), dtype=np.uint8), desplazamientos
+
+
+def escribir_tablas(ruta, tablas, cadenas, equipamiento=()):
+    """
+    Escritura en bloque de tablas ya columnares.
+
+    `tablas` es {'clases'|'aulas'|'asignaciones': {columna: array}}; las
+    columnas de texto deben contener índices en `cadenas` (lista de str).
+    """
+    tabla_cadenas = _TablaCadenas()
+    for cadena in cadenas:
+        tabla_cadenas.indice(cadena)
+    datos_cadenas, desplazamientos = tabla_cadenas.columnas()
+
+    bloques = []
+    encabezado = {'version': VERSION, 'equipamiento': list(equipamiento), 'tablas': {}}
+    posicion = 0
+    for nombre_tabla, esquema in ESQUEMA.items():
+        columnas = tablas.get(nombre_tabla, {})
+        filas = len(next(iter(columnas.values()))) if columnas else 0
+        descripcion = {'filas': filas, 'columnas': {}}
+        for nombre_columna, dtype in esquema.items():
+            valores = np.ascontiguousarray(columnas.get(nombre_columna, np.zeros(filas)), dtype=dtype)
+            if len(valores) != filas:
+                raise ValueError(f"{nombre_tabla}.{nombre_columna}: {len(valores)} filas, se esperaban {filas}")
+            descripcion['columnas'][nombre_columna] = {'dtype': dtype, 'desplazamiento': posicion}
+            bloques.append((posicion, valores))
+            posicion = _alinear(posicion + valores.nbytes)
+        encabezado['tablas'][nombre_tabla] = descripcion
+
+    for nombre, valores in (('desplazamientos', desplazamientos), ('datos', datos_cadenas)):
+        encabezado[f'cadenas_{nombre}'] = {'dtype': valores.dtype.str, 'filas': len(valores),
+                                           'desplazamiento': posicion}
+        bloques.append((posicion, valores))
+        posicion = _alinear(posicion + valores.nbytes)
+
+    encabezado_bytes = json.dumps(encabezado).encode('utf-8')
+    inicio_datos = _alinear(len(MAGIA) + 8 + len(encabezado_bytes))
+
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, 'wb') as archivo:
+        archivo.write(MAGIA)
+        archivo.write(struct.pack('<Q', len(encabezado_bytes)))
+        archivo.write(encabezado_bytes)
+        for desplazamiento, valores in bloques:
+            archivo.seek(inicio_datos + desplazamiento)
+            archivo.write(valores.tobytes())
+        archivo.truncate(inicio_datos + posicion)
+    os.replace(temporal, ruta)
+    return ruta
+
+
+def tablas_desde_horario(horarios, clases=None, aulas=None):
+    """
+    Convierte los objetos de un planificador a tablas columnares.
+
+    Devuelve (tablas, cadenas, equipamiento) con el formato de
+    `escribir_tablas`. `clases` y `aulas` son opcionales: por defecto se usan
+    las que aparecen en `horarios`; pasar la lista completa de clases conserva
+    también las no asignadas.
+    """
+    if clases is None:
+        clases = list({id(h.clase): h.clase for h in horarios}.values())
+    if aulas is None:
+        aulas = list({h.aula.id: h.aula for h in horarios}.values())
+
+    cadenas = _TablaCadenas()
+    equipamiento = sorted({e for aula in aulas for e in aula.equipamiento})
+    if len(equipamiento) > 32:
+        raise ValueError("El formato admite como máximo 32 tipos de equipamiento")
+    bit = {e: 1 << i for i, e in enumerate(equipamiento)}
+
+    fila_clase = {id(c): i for i, c in enumerate(clases)}
+    fila_aula = {a.id: i for i, a in enumerate(aulas)}
+    dia = {nombre: i for i, nombre in enumerate(DIAS)}
+    n = len(clases)
+
+    tablas = {
+        'clases': {
+            'id': np.fromiter((c.id for c in clases), dtype='<i4', count=n),
+            'nombre': cadenas.indices_de([c.nombre for c in clases]),
+            'profesor': cadenas.indices_de([c.profesor for c in clases]),
+            'duracion': np.fromiter((c.duracion for c in clases), dtype='<i1', count=n),
+            'dia_preferido': np.fromiter((dia[c.horario_preferido[0].name] for c in clases), dtype='<i1', count=n),
+            'hora_preferida': np.fromiter((c.horario_preferido[1] for c in clases), dtype='<i1', count=n),
+            'aula_requerida': cadenas.indices_de([c.aula_requerida for c in clases]),
+            'estudiantes': np.fromiter((c.estudiantes for c in clases), dtype='<i2', count=n),
+        },
+        'aulas': {
+            'id': cadenas.indices_de([a.id for a in aulas]),
+            'capacidad': np.array([a.capacidad for a in aulas], dtype='<i2'),
+            'equipamiento': np.array([sum(bit[e] for e in set(a.equipamiento)) for a in aulas], dtype='<u4'),
+        },
+        'asignaciones': {
+            'clase': np.fromiter((fila_clase[id(h.clase)] for h in horarios), dtype='<i4', count=len(horarios)),
+            'aula': np.fromiter((fila_aula[h.aula.id] for h in horarios), dtype='<i4', count=len(horarios)),
+            'dia': np.fromiter((dia[h.dia.name] for h in horarios), dtype='<i1', count=len(horarios)),
+            'hora_inicio': np.fromiter((h.hora_inicio for h in horarios), dtype='<i1', count=len(horarios)),
+            'hora_fin': np.fromiter((h.hora_fin for h in horarios), dtype='<i1', count=len(horarios)),
+        },
+    }
+    return tablas, cadenas.cadenas, equipamiento
+
+
+def escribir_horario(ruta, horarios, clases=None, aulas=None):
+    """Guarda un horario a partir de los objetos de un planificador (ver `tablas_desde_horario`)"""
+    return escribir_tablas(ruta, *tablas_desde_horario(horarios, clases, aulas))
+
+
+def escribir_instancia(ruta, instancia, asignaciones=None):
+    """
+    Guarda una instancia de `generador_vectorizado` (y opcionalmente sus
+    asignaciones como columnas) sin pasar por objetos.
+    """
+    from generador_vectorizado import EQUIPAMIENTO, NOMBRES_CLASES, TIPOS_AULA
+
+    # Tabla de cadenas: nombres, tipos de aula, profesores y luego ids de aula
+    nombres = NOMBRES_CLASES.tolist()
+    tipos_aula = TIPOS_AULA.tolist()
+    profesores = list(instancia['profesores'])
+    num_aulas = len(instancia['aulas']['capacidad'])
+    ids_aulas = [f"Aula_V_{i+1}" for i in range(num_aulas)]
+    cadenas = nombres + tipos_aula + profesores + ids_aulas
+    base_tipos = len(nombres)
+    base_profesores = base_tipos + len(tipos_aula)
+    base_aulas = base_profesores + len(profesores)
+
+    c = instancia['clases']
+    tablas = {
+        'clases': dict(c, nombre=c['nombre'].astype('<i4'),
+                       profesor=c['profesor'].astype('<i4') + base_profesores,
+                       aula_requerida=c['aula_requerida'].astype('<i4') + base_tipos),
+        'aulas': {
+            'id': np.arange(base_aulas, base_aulas + num_aulas, dtype='<i4'),
+            'capacidad': instancia['aulas']['capacidad'],
+            'equipamiento': instancia['aulas']['equipamiento'],
+        },
+        'asignaciones': asignaciones or {},
+    }
+    return escribir_tablas(ruta, tablas, cadenas, EQUIPAMIENTO.tolist())
+
+
+class HorarioColumnar:
+    """
+    Vista de solo lectura sobre un archivo columnar.
+
+    `clases`, `aulas` y `asignaciones` son dicts {columna: np.memmap}; las
+    páginas se leen del disco bajo demanda.
+    """
+
+    def __init__(self, ruta, mmap=True):
+        self.ruta = ruta
+        with open(ruta, 'rb') as archivo:
+            if archivo.read(len(MAGIA)) != MAGIA:
+                raise ValueError(f"{ruta} no es un archivo columnar de horarios")
+            longitud, = struct.unpack('<Q', archivo.read(8))
+            self.encabezado = json.loads(archivo.read(longitud).decode('utf-8'))
+        if self.encabezado['version'] != VERSION:
+            raise ValueError(f"Versión de formato no soportada: {self.encabezado['version']}")
+        self._inicio_datos = _alinear(len(MAGIA) + 8 + longitud)
+        self._mmap = mmap
+        self.equipamiento = self.encabezado['equipamiento']
+
+        for nombre_tabla, descripcion in self.encabezado['tablas'].items():
+            setattr(self, nombre_tabla, {
+                nombre: self._columna(info['dtype'], descripcion['filas'], info['desplazamiento'])
+                for nombre, info in descripcion['columnas'].items()
+            })
+        self._desplazamientos_cadenas = self._columna(**self._info('cadenas_desplazamientos'))
+        self._datos_cadenas = self._columna(**self._info('cadenas_datos'))
+        self._cadenas = None
+
+    def _info(self, clave):
+        info = self.encabezado[clave]
+        return {'dtype': info['dtype'], 'filas': info['filas'], 'desplazamiento': info['desplazamiento']}
+
+    def _columna(self, dtype, filas, desplazamiento):
+        if filas == 0:
+            return np.zeros(0, dtype=dtype)
+        if self._mmap:
+            return np.memmap(self.ruta, dtype=dtype, mode='r', offset=self._inicio_datos + desplazamiento,
+                             shape=(filas,))
+        return np.fromfile(self.ruta, dtype=dtype, count=filas, offset=self._inicio_datos + desplazamiento)
+
+    def __len__(self):
+        return self.encabezado['tablas']['asignaciones']['filas']
+
+    def cadena(self, indice):
+        inicio, fin = int(self._desplazamientos_cadenas[indice]), int(self._desplazamientos_cadenas[indice + 1])
+        return bytes(self._datos_cadenas[inicio:fin]).decode('utf-8')
+
+    @property
+    def cadenas(self):
+        """Tabla de cadenas completa, decodificada una sola vez"""
+        if self._cadenas is None:
+            self._cadenas = [self.cadena(i) for i in range(len(self._desplazamientos_cadenas) - 1)]
+        return self._cadenas
+
+    def a_objetos(self, tipos='algoritmo_voraz'):
+        """Materializa (horarios, clases, aulas) con los dataclasses de `tipos`"""
+        if isinstance(tipos, str):
+            import importlib
+            tipos = importlib.import_module(tipos)
+        cadenas = self.cadenas
+        dias = [tipos.DiaSemana[nombre] for nombre in DIAS]
+
+        a = self.aulas
+        aulas = [
+            tipos.Aula(id=cadenas[id_aula], capacidad=capacidad,
+                       equipamiento=[e for b, e in enumerate(self.equipamiento) if mascara >> b & 1])
+            for id_aula, capacidad, mascara in zip(a['id'].tolist(), a['capacidad'].tolist(),
+                                                    a['equipamiento'].tolist())
+        ]
+        c = self.clases
+        clases = [
+            tipos.Clase(id=id_clase, nombre=cadenas[nombre], profesor=cadenas[profesor], duracion=duracion,
+                        horario_preferido=(dias[dia], hora), aula_requerida=cadenas[tipo],
+                        estudiantes=estudiantes)
+            for id_clase, nombre, profesor, duracion, dia, hora, tipo, estudiantes in zip(
+                c['id'].tolist(), c['nombre'].tolist(), c['profesor'].tolist(), c['duracion'].tolist(),
+                c['dia_preferido'].tolist(), c['hora_preferida'].tolist(), c['aula_requerida'].tolist(),
+                c['estudiantes'].tolist())
+        ]
+        s = self.asignaciones
+        horarios = [
+            tipos.HorarioAsignado(clase=clases[clase], dia=dias[dia], hora_inicio=inicio, hora_fin=fin,
+                                  aula=aulas[aula])
+            for clase, aula, dia, inicio, fin in zip(s['clase'].tolist(), s['aula'].tolist(), s['dia'].tolist(),
+                                                     s['hora_inicio'].tolist(), s['hora_fin'].tolist())
+        ]
+        return horarios, clases, aulas
+
+
+def cargar_horario(ruta, mmap=True):
+    return HorarioColumnar(ruta, mmap=mmap)
+
+
+def _asignaciones_sinteticas(instancia, semilla=42):
+    """Asignaciones aleatorias (sin validar conflictos) para medir el formato a gran escala"""
+    rng = np.random.default_rng(semilla)
+    duracion = instancia['clases']['duracion'].astype('<i1')
+    n = len(duracion)
+    inicio = (8 + rng.integers(0, 10 - duracion + 1)).astype('<i1')
+    return {
+        'clase': np.arange(n, dtype='<i4'),
+        'aula': rng.integers(0, len(instancia['aulas']['capacidad']), n, dtype='<i4'),
+        'dia': rng.integers(0, 5, n, dtype='<i1'),
+        'hora_inicio': inicio,
+        'hora_fin': (inicio + duracion).astype('<i1'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Escritura y carga del formato columnar de horarios")
+    parser.add_argument('--tamano', type=int, default=1_000_000, help="Asignaciones sintéticas")
+    parser.add_argument('--salida', default='horario_sintetico.hcol')
+    parser.add_argument('--semilla', type=int, default=42)
+    args = parser.parse_args()
+
+    from generador_vectorizado import obtener_instancia
+    instancia = obtener_instancia(args.tamano, semilla=args.semilla)
+    asignaciones = _asignaciones_sinteticas(instancia, args.semilla)
+
+    inicio = time.perf_counter()
+    escribir_instancia(args.salida, instancia, asignaciones)
+    print(f"Escritura de {args.tamano} asignaciones: {time.perf_counter() - inicio:.3f}s "
+          f"({os.path.getsize(args.salida) / 1024 / 1024:.1f} MB)")
+
+    inicio = time.perf_counter()
+    horario = cargar_horario(args.salida)
+    print(f"Apertura con memmap: {(time.perf_counter() - inicio) * 1000:.2f} ms")
+
+    inicio = time.perf_counter()
+    horas = int((horario.asignaciones['hora_fin'] - horario.asignaciones['hora_inicio']).sum(dtype=np.int64))
+    print(f"Horas asignadas (recorrido columnar): {horas} en {time.perf_counter() - inicio:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+Generador vectorizado de instancias grandes con caché en disco.
+
+Los generadores de los módulos llaman a `random.choices` y construyen un
+dataclass `Clase` por clase en un bucle de Python. Aquí las tablas de clases y
+aulas se generan por columnas con un `numpy.random.Generator`, de forma
+reproducible a partir de la semilla, y se guardan en `.npz` con la clave
+(tamaño, aulas, perfil, semilla). Las ejecuciones repetidas cargan la
+instancia del disco en lugar de regenerarla.
+
+Las columnas usan índices enteros sobre catálogos de cadenas (nombres,
+profesores, tipos de aula). `a_objetos` convierte la instancia a los
+dataclasses del planificador solo cuando se va a planificar.
+
+Los perfiles de carga (`PERFILES_VECTORIZADOS`) se definen solo aquí;
+`perfiles_carga.generar_perfil` los convierte a objetos.
+
+Uso:
+    python generador_vectorizado.py --tamano 1000000 --perfil saturado
+"""
+
+import argparse
+import importlib
+import os
+import time
+
+import numpy as np
+
+from indice_ocupacion import HORA_APERTURA, HORA_CIERRE
+
+DIRECTORIO_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache_instancias')
+
+# Cambiar al modificar la forma de las tablas o la distribución de un perfil
+VERSION_FORMATO = 1
+
+HORAS_SEMANA_AULA = 5 * (HORA_CIERRE - HORA_APERTURA)
+
+NOMBRES_CLASES = np.array([
+    "Matemáticas I", "Física I", "Química I", "Programación I", "Algoritmos",
+    "Estructuras de Datos", "Bases de Datos", "Redes", "Sistemas Operativos",
+    "Inteligencia Artificial", "Machine Learning", "Cálculo I", "Cálculo II",
+    "Estadística", "Probabilidad", "Álgebra Lineal", "Teoría de Grafos", "Compiladores",
+])
+PROFESORES_BASE = [
+    "Dr. García", "Dra. López", "Dr. Martínez", "Dra. Rodríguez", "Dr. González",
+    "Dra. Pérez", "Dr. Sánchez", "Dra. Ramírez", "Dr. Torres", "Dra. Flores",
+    "Dr. Morales", "Dra. Jiménez", "Dr. Ruiz", "Dra. Díaz", "Dr. Herrera",
+    "Dr. Vargas", "Dra. Castro", "Dr. Romero", "Dra. Aguilar", "Dr. Mendoza"
+]
+TIPOS_AULA = np.array(["Normal", "Laboratorio", "Computación"])
+EQUIPAMIENTO = np.array(["Proyector", "Pizarra", "Computadoras", "Laboratorio"])
+
+
+def _tabla_aulas(rng, capacidades):
+    """Capacidad y equipamiento como máscara de bits sobre EQUIPAMIENTO (1-3 elementos)"""
+    num_aulas = len(capacidades)
+    cantidad = rng.integers(1, 4, num_aulas)
+    # Se eligen `cantidad` elementos distintos tomando los primeros de una permutación por fila
+    orden = np.argsort(rng.random((num_aulas, len(EQUIPAMIENTO))), axis=1)
+    seleccion = np.arange(len(EQUIPAMIENTO)) < cantidad[:, None]
+    mascara = np.zeros(num_aulas, dtype=np.uint8)
+    for columna in range(len(EQUIPAMIENTO)):
+        mascara |= np.where(seleccion[:, columna], 1 << orden[:, columna], 0).astype(np.uint8)
+    return {
+        'capacidad': np.asarray(capacidades, dtype=np.int16),
+        'equipamiento': mascara,
+    }
+
+
+def _tabla_clases(rng, num_clases, num_profesores, duraciones=None, estudiantes=None, profesores=None,
+                  tipo_aula=None):
+    """Columnas de la tabla de clases; las columnas dadas sustituyen a las uniformes"""
+    if duraciones is None:
+        duraciones = rng.choice(np.array([1, 2, 3], dtype=np.int8), num_clases, p=[0.3, 0.5, 0.2])
+    duraciones = np.asarray(duraciones, dtype=np.int8)
+    return {
+        'id': np.arange(1, num_clases + 1, dtype=np.int32),
+        'nombre': rng.integers(0, len(NOMBRES_CLASES), num_clases, dtype=np.int16),
+        'profesor': (np.asarray(profesores, dtype=np.int32) if profesores is not None
+                     else rng.integers(0, num_profesores, num_clases, dtype=np.int32)),
+        'duracion': duraciones,
+        'dia_preferido': rng.integers(0, 5, num_clases, dtype=np.int8),
+        'hora_preferida': (HORA_APERTURA + rng.integers(0, HORA_CIERRE - HORA_APERTURA - duraciones + 1)
+                           ).astype(np.int8),
+        'aula_requerida': (np.asarray(tipo_aula, dtype=np.int8) if tipo_aula is not None
+                           else rng.integers(0, len(TIPOS_AULA), num_clases, dtype=np.int8)),
+        'estudiantes': (np.asarray(estudiantes, dtype=np.int16) if estudiantes is not None
+                        else rng.integers(15, 81, num_clases, dtype=np.int16)),
+    }
+
+
+def _uniforme(rng, num_clases, num_aulas):
+    """Carga de referencia: la misma forma que los generadores de los módulos"""
+    profesores = list(PROFESORES_BASE)
+    aulas = _tabla_aulas(rng, rng.integers(20, 101, num_aulas))
+    return _tabla_clases(rng, num_clases, len(profesores)), aulas, profesores
+
+
+def _profesor_saturado(rng, num_clases, num_aulas, fraccion=0.4):
+    """Un profesor imparte `fraccion` de las clases; su agenda es el cuello de botella"""
+    profesores = list(PROFESORES_BASE)
+    aulas = _tabla_aulas(rng, rng.integers(20, 101, num_aulas))
+    asignado = np.where(rng.random(num_clases) < fraccion, 0,
+                        rng.integers(1, len(profesores), num_clases))
+    return _tabla_clases(rng, num_clases, len(profesores), profesores=asignado), aulas, profesores
+
+
+def _crisis_capacidad(rng, num_clases, num_aulas, aulas_grandes=2):
+    """Grupos de 75 estudiantes con solo `aulas_grandes` aulas que los admiten"""
+    profesores = list(PROFESORES_BASE)
+    grandes = min(aulas_grandes, num_aulas)
+    capacidades = np.concatenate([np.full(grandes, 100), rng.integers(20, 51, num_aulas - grandes)])
+    estudiantes = np.where(rng.random(num_clases) < 0.6, 75, rng.integers(15, 46, num_clases))
+    return (_tabla_clases(rng, num_clases, len(profesores), estudiantes=estudiantes),
+            _tabla_aulas(rng, capacidades), profesores)
+
+
+def _duracion_larga(rng, num_clases, num_aulas):
+    """Solo laboratorios de 3 y 4 horas: pocos huecos válidos por día"""
+    profesores = list(PROFESORES_BASE)
+    aulas = _tabla_aulas(rng, rng.integers(20, 101, num_aulas))
+    clases = _tabla_clases(rng, num_clases, len(profesores),
+                           duraciones=rng.integers(3, 5, num_clases),
+                           tipo_aula=np.ones(num_clases, dtype=np.int8))
+    return clases, aulas, profesores
+
+
+def _saturado(rng, num_clases, num_aulas, ocupacion=0.98):
+    """
+    Demanda de horas-aula cercana al 100%.
+
+    El número de aulas se deriva de la demanda (se ignora `num_aulas`) para que
+    las horas pedidas sean `ocupacion` de las horas disponibles. Todas las
+    aulas admiten cualquier grupo y hay un profesor por cada cinco clases, así
+    la presión viene de los huecos de aula y no de otras restricciones.
+    """
+    profesores = [f"Prof. {i+1}" for i in range(max(1, num_clases // 5))]
+    clases = _tabla_clases(rng, num_clases, len(profesores))
+    horas = int(clases['duracion'].sum(dtype=np.int64))
+    aulas_necesarias = max(1, int(np.ceil(horas / (HORAS_SEMANA_AULA * ocupacion))))
+    return clases, _tabla_aulas(rng, np.full(aulas_necesarias, 100)), profesores
+
+
+def _cola_infactible(rng, num_clases, num_aulas, fraccion=0.1):
+    """
+    Carga uniforme seguida de una cola de clases imposibles de asignar.
+
+    La mitad de la cola excede la capacidad de todas las aulas; la otra mitad
+    son bloques de un mismo profesor más largos que la jornada (8:00-18:00),
+    que no caben en ningún día sea cual sea el tamaño. Los planificadores
+    recorren los días y aulas candidatos antes de rendirse con ellas.
+    """
+    clases, aulas, profesores = _uniforme(rng, num_clases, num_aulas)
+    profesores.append("Dr. Sobrecargado")
+    cola = np.arange(num_clases - max(1, round(num_clases * fraccion)), num_clases)
+    exceso, bloque = cola[cola % 2 == 0], cola[cola % 2 == 1]
+    clases['estudiantes'][exceso] = int(aulas['capacidad'].max()) + 10
+    clases['profesor'][bloque] = len(profesores) - 1
+    clases['duracion'][bloque] = HORA_CIERRE - HORA_APERTURA + 1
+    clases['hora_preferida'][bloque] = HORA_APERTURA
+    return clases, aulas, profesores
+
+
+PERFILES_VECTORIZADOS = {
+    'uniforme': _uniforme,
+    'profesor_saturado': _profesor_saturado,
+    'crisis_capacidad': _crisis_capacidad,
+    'duracion_larga': _duracion_larga,
+    'saturado': _saturado,
+    'cola_infactible': _cola_infactible,
+}
+
+
+def generar_instancia(num_clases, num_aulas=8, perfil='uniforme', semilla=42):
+    """
+    Genera la instancia por columnas. Devuelve un dict con las tablas
+    'clases' y 'aulas' ({columna: ndarray}) y el catálogo de profesores.
+    """
+    if perfil not in PERFILES_VECTORIZADOS:
+        raise ValueError(f"Perfil desconocido: {perfil}. Opciones: {list(PERFILES_VECTORIZADOS)}")
+    rng = np.random.default_rng(semilla)
+    clases, aulas, profesores = PERFILES_VECTORIZADOS[perfil](rng, num_clases, num_aulas)
+    return {'clases': clases, 'aulas': aulas, 'profesores': profesores}
+
+
+def ruta_cache(num_clases, num_aulas, perfil, semilla, directorio=DIRECTORIO_CACHE):
+    return os.path.join(directorio,
+                        f"instancia_{perfil}_{num_clases}_{num_aulas}_{semilla}_v{VERSION_FORMATO}.npz")
+
+
+def guardar_instancia(instancia, ruta):
+    """Guarda la instancia en `.npz` sin comprimir (la carga es una copia directa)"""
+    os.makedirs(os.path.dirname(ruta) or '.', exist_ok=True)
+    columnas = {f"clases__{nombre}": valores for nombre, valores in instancia['clases'].items()}
+    columnas.update({f"aulas__{nombre}": valores for nombre, valores in instancia['aulas'].items()})
+    # Escritura atómica: otro proceso del pool nunca ve un archivo a medias
+    temporal = f"{ruta}.{os.getpid()}.tmp.npz"
+    np.savez(temporal, profesores=np.array(instancia['profesores']), **columnas)
+    os.replace(temporal, ruta)
+
+
+def cargar_instancia(ruta):
+    with np.load(ruta) as datos:
+        instancia = {'clases': {}, 'aulas': {}, 'profesores': datos['profesores'].tolist()}
+        for clave in datos.files:
+            tabla, _, columna = clave.partition('__')
+            if columna:
+                instancia[tabla][columna] = datos[clave]
+    return instancia
+
+
+def obtener_instancia(num_clases, num_aulas=8, perfil='uniforme', semilla=42,
+                      usar_cache=True, directorio=DIRECTORIO_CACHE):
+    """Carga la instancia de la caché o la genera y la guarda"""
+    if not usar_cache:
+        return generar_instancia(num_clases, num_aulas, perfil, semilla)
+    ruta = ruta_cache(num_clases, num_aulas, perfil, semilla, directorio)
+    if os.path.exists(ruta):
+        return cargar_instancia(ruta)
+    instancia = generar_instancia(num_clases, num_aulas, perfil, semilla)
+    guardar_instancia(instancia, ruta)
+    return instancia
+
+
+def a_objetos(instancia, tipos='algoritmo_voraz'):
+    """
+    Convierte la instancia a (clases, aulas) con los dataclasses de `tipos`
+    (módulo o nombre de módulo) para pasarla a un planificador.
+    """
+    if isinstance(tipos, str):
+        tipos = importlib.import_module(tipos)
+    dias = list(tipos.DiaSemana)
+    profesores = instancia['profesores']
+    tabla_aulas = instancia['aulas']
+    aulas = [
+        tipos.Aula(id=f"Aula_V_{i+1}", capacidad=int(capacidad),
+                   equipamiento=[str(e) for b, e in enumerate(EQUIPAMIENTO) if int(mascara) >> b & 1])
+        for i, (capacidad, mascara) in enumerate(zip(tabla_aulas['capacidad'], tabla_aulas['equipamiento']))
+    ]
+    c = instancia['clases']
+    nombres = NOMBRES_CLASES.tolist()
+    tipos_aula = TIPOS_AULA.tolist()
+    clases = [
+        tipos.Clase(id=id_clase, nombre=nombres[nombre], profesor=profesores[profesor], duracion=duracion,
+                    horario_preferido=(dias[dia], hora), aula_requerida=tipos_aula[tipo],
+                    estudiantes=estudiantes)
+        for id_clase, nombre, profesor, duracion, dia, hora, tipo, estudiantes in zip(
+            c['id'].tolist(), c['nombre'].tolist(), c['profesor'].tolist(), c['duracion'].tolist(),
+            c['dia_preferido'].tolist(), c['hora_preferida'].tolist(), c['aula_requerida'].tolist(),
+            c['estudiantes'].tolist())
+    ]
+    return clases, aulas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera (o carga de la caché) una instancia vectorizada")
+    parser.add_argument('--tamano', type=int, default=1_000_000)
+    parser.add_argument('--aulas', type=int, default=8)
+    parser.add_argument('--perfil', choices=list(PERFILES_VECTORIZADOS), default='uniforme')
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--directorio', default=DIRECTORIO_CACHE)
+    parser.add_argument('--comparar', action='store_true',
+                        help="Medir también el generador por objetos de algoritmo_voraz")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    instancia = generar_instancia(args.tamano, args.aulas, args.perfil, args.semilla)
+    print(f"Generación vectorizada: {time.perf_counter() - inicio:.3f}s")
+
+    ruta = ruta_cache(args.tamano, args.aulas, args.perfil, args.semilla, args.directorio)
+    inicio = time.perf_counter()
+    guardar_instancia(instancia, ruta)
+    print(f"Guardado en {ruta}: {time.perf_counter() - inicio:.3f}s "
+          f"({os.path.getsize(ruta) / 1024 / 1024:.1f} MB)")
+
+    inicio = time.perf_counter()
+    obtener_instancia(args.tamano, args.aulas, args.perfil, args.semilla, directorio=args.directorio)
+    print(f"Carga desde caché: {time.perf_counter() - inicio:.3f}s")
+
+    inicio = time.perf_counter()
+    a_objetos(instancia)
+    print(f"Conversión a dataclasses: {time.perf_counter() - inicio:.3f}s")
+
+    if args.comparar:
+        import random
+        from algoritmo_voraz import generar_datos_prueba_greedy
+        random.seed(args.semilla)
+        inicio = time.perf_counter()
+        generar_datos_prueba_greedy(args.tamano, args.aulas)
+        print(f"Generador por objetos (algoritmo_voraz): {time.perf_counter() - inicio:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Índice de ocupación en bits y arranque en caliente desde un horario previo.
+
+`IndiceOcupacion` guarda, por (aula, día) y por (profesor, día), un entero con
+un bit por hora de 8:00 a 18:00. Comprobar si una franja está libre es un AND
+de dos máscaras en vez del recorrido lineal de `horarios_asignados` que hacen
+los planificadores, así que colocar una clase cuesta O(días × aulas)
+independientemente del tamaño del horario.
+
+`conservar_validas` toma un horario anterior (de la semana o el periodo
+pasado), conserva cada asignación que sigue siendo válida para las clases y
+aulas actuales y devuelve las clases que hay que volver a colocar; `colocar`
+las coloca en la primera franja libre. Con ambos, los planificadores
+replanifican un horario grande tras pocos cambios con un coste proporcional a
+los cambios, no al tamaño del horario.
+
+Solo usa la biblioteca estándar.
+"""
+
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+HORA_APERTURA = 8
+HORA_CIERRE = 18
+DIA_COMPLETO = (1 << (HORA_CIERRE - HORA_APERTURA)) - 1
+
+
+def mascara(hora_inicio: int, duracion: int) -> int:
+    """Bits de las horas [hora_inicio, hora_inicio + duracion) dentro del día"""
+    return ((1 << duracion) - 1) << (hora_inicio - HORA_APERTURA)
+
+
+def ventanas(libres: int, duracion: int) -> int:
+    """Bit h activo si las horas h..h+duracion-1 están todas en `libres`"""
+    resultado = libres
+    for desplazamiento in range(1, duracion):
+        resultado &= libres >> desplazamiento
+    return resultado
+
+
+class IndiceOcupacion:
+    """Ocupación por (aula, día) y (profesor, día); los días se identifican por nombre"""
+
+    def __init__(self):
+        self.aulas: Dict[Tuple[str, str], int] = {}
+        self.profesores: Dict[Tuple[str, str], int] = {}
+        # (duración, estudiantes) sin hueco en ningún aula: mientras solo se
+        # ocupen franjas, cualquier clase igual o mayor tampoco cabe
+        self._sin_hueco = set()
+
+    @classmethod
+    def desde_horarios(cls, horarios) -> 'IndiceOcupacion':
+        indice = cls()
+        for h in horarios:
+            indice.ocupar(h.clase, h.dia, h.hora_inicio, h.aula)
+        return indice
+
+    def libre(self, clase, dia, hora_inicio: int, aula) -> bool:
+        bits = mascara(hora_inicio, clase.duracion)
+        return not (self.aulas.get((aula.id, dia.name), 0) & bits
+                    or self.profesores.get((clase.profesor, dia.name), 0) & bits)
+
+    def ocupar(self, clase, dia, hora_inicio: int, aula):
+        bits = mascara(hora_inicio, clase.duracion)
+        clave_aula, clave_profesor = (aula.id, dia.name), (clase.profesor, dia.name)
+        self.aulas[clave_aula] = self.aulas.get(clave_aula, 0) | bits
+        self.profesores[clave_profesor] = self.profesores.get(clave_profesor, 0) | bits
+
+    def bloquear(self, tipo: str, recurso: str, dia: str, bits: int):
+        """Marca las horas `bits` de un aula (`tipo` 'aula') o profesor como ocupadas en `dia` (nombre)"""
+        tabla = self.aulas if tipo == 'aula' else self.profesores
+        tabla[(recurso, dia)] = tabla.get((recurso, dia), 0) | bits
+
+    def liberar(self, clase, dia, hora_inicio: int, aula):
+        bits = mascara(hora_inicio, clase.duracion)
+        self.aulas[(aula.id, dia.name)] &= ~bits
+        self.profesores[(clase.profesor, dia.name)] &= ~bits
+        self._sin_hueco.clear()
+
+    def primera_libre(self, clase, dias, aulas) -> Optional[Tuple[object, int, object]]:
+        """
+        (día, hora, aula) de la primera franja libre en orden día → hora → aula.
+
+        Por cada (día, aula) calcula de una vez todas las ventanas libres de la
+        duración de la clase, así que un fallo cuesta O(días × aulas).
+        """
+        duracion, estudiantes = clase.duracion, clase.estudiantes
+        if any(d <= duracion and e <= estudiantes for d, e in self._sin_hueco):
+            return None
+        validas = [aula for aula in aulas if aula.capacidad >= estudiantes]
+        hay_hueco = False
+        for dia in dias:
+            libres_profesor = ventanas(~self.profesores.get((clase.profesor, dia.name), 0) & DIA_COMPLETO,
+                                       duracion)
+            mejor = None
+            for aula in validas:
+                libres_aula = ventanas(~self.aulas.get((aula.id, dia.name), 0) & DIA_COMPLETO, duracion)
+                if not libres_aula:
+                    continue
+                hay_hueco = True
+                comunes = libres_aula & libres_profesor
+                if comunes:
+                    hora = (comunes & -comunes).bit_length() - 1
+                    if mejor is None or hora < mejor[0]:
+                        mejor = (hora, aula)
+                        if hora == 0:
+                            break
+            if mejor is not None:
+                return dia, HORA_APERTURA + mejor[0], mejor[1]
+        if not hay_hueco:
+            self._sin_hueco.add((duracion, estudiantes))
+        return None
+
+
+def conservar_validas(horario_previo, clases, aulas, tipos, bloqueos=()):
+    """
+    Separa el horario previo en asignaciones conservadas y clases pendientes.
+
+    Las asignaciones se emparejan por `Clase.id` y `Aula.id` (el horario previo
+    puede venir de otro proceso o de un archivo). Se descarta una asignación si
+    su clase o su aula ya no existen, si el aula no tiene capacidad, si con la
+    duración actual se sale de la ventana, si pisa una franja bloqueada o si
+    choca con otra ya conservada. `bloqueos` son franjas no disponibles con
+    `tipo`, `recurso`, `dia` y `bits` (p. ej. `reparacion.Disrupcion`); quedan
+    ocupadas en el índice devuelto.
+
+    Devuelve (conservados, pendientes, indice, descartes): los conservados se
+    reconstruyen con los objetos actuales y los tipos del módulo `tipos`, las
+    pendientes conservan el orden de `clases` y `descartes` cuenta los motivos.
+    """
+    clases_por_id = {c.id: c for c in clases}
+    aulas_por_id = {a.id: a for a in aulas}
+    indice = IndiceOcupacion()
+    bloqueado = IndiceOcupacion()
+    for bloqueo in bloqueos:
+        indice.bloquear(bloqueo.tipo, bloqueo.recurso, bloqueo.dia, bloqueo.bits)
+        bloqueado.bloquear(bloqueo.tipo, bloqueo.recurso, bloqueo.dia, bloqueo.bits)
+    conservados = []
+    asignadas = set()
+    descartes = Counter()
+
+    for h in horario_previo:
+        clase = clases_por_id.get(h.clase.id)
+        aula = aulas_por_id.get(h.aula.id)
+        if clase is None:
+            descartes['clase_eliminada'] += 1
+        elif clase.id in asignadas:
+            descartes['duplicada'] += 1
+        elif aula is None:
+            descartes['aula_eliminada'] += 1
+        elif aula.capacidad < clase.estudiantes:
+            descartes['capacidad'] += 1
+        elif not HORA_APERTURA <= h.hora_inicio <= HORA_CIERRE - clase.duracion:
+            descartes['fuera_de_horario'] += 1
+        else:
+            dia = tipos.DiaSemana[h.dia.name]
+            if not bloqueado.libre(clase, dia, h.hora_inicio, aula):
+                descartes['bloqueada'] += 1
+                continue
+            if not indice.libre(clase, dia, h.hora_inicio, aula):
+                descartes['conflicto'] += 1
+                continue
+            indice.ocupar(clase, dia, h.hora_inicio, aula)
+            asignadas.add(clase.id)
+            conservados.append(tipos.HorarioAsignado(clase=clase, dia=dia, hora_inicio=h.hora_inicio,
+                                                     hora_fin=h.hora_inicio + clase.duracion, aula=aula))
+
+    pendientes = [c for c in clases if c.id not in asignadas]
+    return conservados, pendientes, indice, dict(descartes)
+
+
+def colocar(indice: IndiceOcupacion, clases, aulas, tipos, orden_aulas=None, token=None):
+    """
+    Coloca `clases` en el orden dado en la primera franja libre del índice.
+
+    `orden_aulas(clase, aulas)` puede reordenar las aulas por clase (p. ej.
+    mejor ajuste de capacidad). Devuelve (horarios nuevos, truncado).
+    """
+    dias = list(tipos.DiaSemana)
+    nuevos: List = []
+    for clase in clases:
+        if token is not None and token.expirado():
+            return nuevos, True
+        candidatas = orden_aulas(clase, aulas) if orden_aulas is not None else aulas
+        colocacion = indice.primera_libre(clase, dias, candidatas)
+        if colocacion is None:
+            continue
+        dia, hora, aula = colocacion
+        indice.ocupar(clase, dia, hora, aula)
+        nuevos.append(tipos.HorarioAsignado(clase=clase, dia=dia, hora_inicio=hora,
+                                            hora_fin=hora + clase.duracion, aula=aula))
+    return nuevos, False
+
+
+def cargar_horario_previo(ruta, tipos):
+    """Horario previo desde un archivo columnar (.hcol) con los tipos de `tipos`"""
+    from formato_columnar import cargar_horario
+    horarios, _, _ = cargar_horario(ruta).a_objetos(tipos)
+    return horarios
@@ -0,0 +1,98 @@
+"""
+Instancia de planificación en memoria compartida para pools de procesos.
+
+En vez de serializar las clases y aulas en cada tarea, el proceso principal
+las publica una vez en un bloque `multiprocessing.shared_memory` de enteros de
+32 bits y cada trabajador, en el inicializador del pool, reconstruye sus
+propios objetos una sola vez. Las tareas solo envían parámetros pequeños
+(semillas, rangos, criterios) y devuelven tuplas de índices, que el proceso
+principal traduce a los objetos originales: las clases y aulas conservan su
+posición en el bloque.
+
+Formato del bloque (int32): [num_clases, num_aulas], luego por clase
+(id, duracion, estudiantes, profesor, dia_preferido, hora_preferida) y por aula
+la capacidad. Los profesores se guardan como índices: los planificadores solo
+los comparan por igualdad.
+
+Solo usa la biblioteca estándar.
+"""
+
+from array import array
+from multiprocessing import shared_memory
+
+CAMPOS_CLASE = 6
+_instancia_trabajador = None
+
+
+class InstanciaCompartida:
+    """Publica (clases, aulas) en memoria compartida; usar como gestor de contexto"""
+
+    def __init__(self, clases, aulas):
+        from algoritmo_voraz import DiaSemana
+        dias = {dia.name: i for i, dia in enumerate(DiaSemana)}
+        profesores = {}
+        datos = array('i', [len(clases), len(aulas)])
+        for clase in clases:
+            datos.extend((clase.id, clase.duracion, clase.estudiantes,
+                          profesores.setdefault(clase.profesor, len(profesores)),
+                          dias[clase.horario_preferido[0].name], clase.horario_preferido[1]))
+        datos.extend(aula.capacidad for aula in aulas)
+        # Nombre → índice: en los trabajadores el profesor i se llama "P{i}"
+        self.profesores = profesores
+
+        bytes_datos = datos.tobytes()
+        self._memoria = shared_memory.SharedMemory(create=True, size=max(1, len(bytes_datos)))
+        self._memoria.buf[:len(bytes_datos)] = bytes_datos
+
+    @property
+    def nombre(self) -> str:
+        return self._memoria.name
+
+    def cerrar(self):
+        self._memoria.close()
+        self._memoria.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def adjuntar(nombre):
+    """Lee el bloque `nombre` y construye clases y aulas locales (tipos de algoritmo_voraz)"""
+    from algoritmo_voraz import Aula, Clase, DiaSemana
+
+    memoria = shared_memory.SharedMemory(name=nombre)
+    try:
+        enteros = memoria.buf.cast('i')
+        num_clases, num_aulas = enteros[0], enteros[1]
+        datos = enteros[2:2 + num_clases * CAMPOS_CLASE + num_aulas].tolist()
+        enteros.release()
+    finally:
+        memoria.close()
+
+    dias = list(DiaSemana)
+    clases = []
+    for i in range(num_clases):
+        id_clase, duracion, estudiantes, profesor, dia, hora = datos[i * CAMPOS_CLASE:(i + 1) * CAMPOS_CLASE]
+        clases.append(Clase(id=id_clase, nombre="", profesor=f"P{profesor}", duracion=duracion,
+                            horario_preferido=(dias[dia], hora), aula_requerida="",
+                            estudiantes=estudiantes))
+    capacidades = datos[num_clases * CAMPOS_CLASE:]
+    aulas = [Aula(id=f"A{r}", capacidad=capacidad, equipamiento=[])
+             for r, capacidad in enumerate(capacidades)]
+    return clases, aulas
+
+
+def inicializar_trabajador(nombre):
+    """Inicializador del pool: adjunta la instancia una vez por proceso"""
+    global _instancia_trabajador
+    _instancia_trabajador = adjuntar(nombre)
+
+
+def instancia_trabajador():
+    """(clases, aulas) del proceso trabajador actual"""
+    if _instancia_trabajador is None:
+        raise RuntimeError("El proceso no se inicializó con inicializar_trabajador")
+    return _instancia_trabajador
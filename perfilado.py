@@ -0,0 +1,173 @@
+"""
+Modo de perfilado para las pruebas de sobrecarga.
+
+Envuelve un planificador y un tamaño elegidos en:
+- cProfile (determinista): escribe un archivo `.pstats` y muestra las funciones
+  con mayor tiempo acumulado.
+- Un muestreador de pila basado en la biblioteca estándar (bajo overhead):
+  escribe pilas colapsadas (`.folded`), el formato que leen flamegraph.pl,
+  speedscope o inferno, y muestra las funciones con más muestras propias.
+
+Uso:
+    python perfilado.py --algoritmo greedy --tamano 500 --modo cprofile
+    python perfilado.py --algoritmo divide_venceras --tamano 800 --modo muestreo
+"""
+
+import argparse
+import cProfile
+import importlib
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+from estres_adaptativo import PLANIFICADORES
+
+
+def preparar_ejecucion(algoritmo, tamano, num_aulas=8, semilla=42):
+    """Genera la instancia y devuelve (función sin argumentos que planifica, planificador)"""
+    if algoritmo not in PLANIFICADORES:
+        raise ValueError(f"Algoritmo desconocido: {algoritmo}. Opciones: {list(PLANIFICADORES)}")
+
+    nombre_modulo, nombre_generador, nombre_clase, nombre_metodo = PLANIFICADORES[algoritmo]
+    modulo = importlib.import_module(nombre_modulo)
+
+    random.seed(semilla)
+    clases, aulas = getattr(modulo, nombre_generador)(tamano, num_aulas)
+    planificador = getattr(modulo, nombre_clase)(aulas)
+    metodo = getattr(planificador, nombre_metodo)
+    return (lambda: metodo(clases)), planificador
+
+
+def perfilar_cprofile(algoritmo, tamano, ruta_salida=None, num_aulas=8, semilla=42, top=15):
+    """Ejecuta el planificador bajo cProfile y guarda las estadísticas en `.pstats`"""
+    ejecutar, planificador = preparar_ejecucion(algoritmo, tamano, num_aulas, semilla)
+    ruta_salida = ruta_salida or f"perfil_{algoritmo}_{tamano}.pstats"
+
+    perfilador = cProfile.Profile()
+    perfilador.enable()
+    ejecutar()
+    perfilador.disable()
+    perfilador.dump_stats(ruta_salida)
+
+    print(f"Perfil cProfile guardado en {ruta_salida}")
+    print(f"Clases asignadas: {planificador.estadisticas()['clases_asignadas']}/{tamano}")
+    print(f"\nTop {top} funciones por tiempo acumulado:")
+    estadisticas = pstats.Stats(ruta_salida)
+    estadisticas.strip_dirs().sort_stats('cumulative').print_stats(top)
+    return ruta_salida
+
+
+def _nombre_marco(marco):
+    codigo = marco.f_code
+    return f"{os.path.basename(codigo.co_filename)}:{codigo.co_name}"
+
+
+class MuestreadorPila:
+    """
+    Muestreador estadístico de la pila de un hilo.
+
+    Un hilo auxiliar lee `sys._current_frames()` cada `intervalo` segundos y
+    acumula la pila del hilo objetivo en formato colapsado
+    ("raiz;...;hoja" -> número de muestras).
+    """
+
+    def __init__(self, intervalo=0.001, hilo_objetivo=None):
+        self.intervalo = intervalo
+        self.hilo_objetivo = hilo_objetivo or threading.get_ident()
+        self.pilas = Counter()
+        self.muestras = 0
+        self._detener = threading.Event()
+        self._hilo = None
+
+    def _muestrear(self):
+        while not self._detener.wait(self.intervalo):
+            marco = sys._current_frames().get(self.hilo_objetivo)
+            if marco is None:
+                continue
+            pila = []
+            while marco is not None:
+                pila.append(_nombre_marco(marco))
+                marco = marco.f_back
+            self.pilas[';'.join(reversed(pila))] += 1
+            self.muestras += 1
+
+    def __enter__(self):
+        # Con el intervalo de cambio de GIL por defecto (5 ms) el muestreador
+        # no obtendría el GIL con la frecuencia pedida
+        self._intervalo_gil = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._intervalo_gil, self.intervalo / 2))
+        self._detener.clear()
+        self._hilo = threading.Thread(target=self._muestrear, daemon=True)
+        self._hilo.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._detener.set()
+        self._hilo.join()
+        sys.setswitchinterval(self._intervalo_gil)
+        return False
+
+    def guardar_colapsado(self, ruta):
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            for pila, cuenta in self.pilas.most_common():
+                archivo.write(f"{pila} {cuenta}\n")
+        return ruta
+
+    def funciones_principales(self, top=15):
+        """Devuelve [(función, muestras propias, muestras inclusivas)] ordenado por muestras propias"""
+        propias = Counter()
+        inclusivas = Counter()
+        for pila, cuenta in self.pilas.items():
+            marcos = pila.split(';')
+            propias[marcos[-1]] += cuenta
+            for funcion in set(marcos):
+                inclusivas[funcion] += cuenta
+        return [(funcion, cuenta, inclusivas[funcion]) for funcion, cuenta in propias.most_common(top)]
+
+
+def perfilar_muestreo(algoritmo, tamano, ruta_salida=None, num_aulas=8, semilla=42,
+                      intervalo=0.001, top=15):
+    """Ejecuta el planificador bajo el muestreador de pila y guarda las pilas colapsadas"""
+    ejecutar, planificador = preparar_ejecucion(algoritmo, tamano, num_aulas, semilla)
+    ruta_salida = ruta_salida or f"perfil_{algoritmo}_{tamano}.folded"
+
+    inicio = time.perf_counter()
+    with MuestreadorPila(intervalo) as muestreador:
+        ejecutar()
+    tiempo = time.perf_counter() - inicio
+    muestreador.guardar_colapsado(ruta_salida)
+
+    print(f"Pilas colapsadas guardadas en {ruta_salida} ({muestreador.muestras} muestras en {tiempo:.3f}s)")
+    print(f"Clases asignadas: {planificador.estadisticas()['clases_asignadas']}/{tamano}")
+    print(f"\nTop {top} funciones por muestras propias:")
+    total = max(1, muestreador.muestras)
+    for funcion, propias, inclusivas in muestreador.funciones_principales(top):
+        print(f"   {propias / total * 100:5.1f}% propio  {inclusivas / total * 100:5.1f}% inclusivo  {funcion}")
+    return ruta_salida
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Perfilado de un planificador con un tamaño dado")
+    parser.add_argument('--algoritmo', choices=list(PLANIFICADORES), default='greedy')
+    parser.add_argument('--tamano', type=int, default=500)
+    parser.add_argument('--modo', choices=['cprofile', 'muestreo'], default='cprofile')
+    parser.add_argument('--salida', default=None, help="Ruta del archivo .pstats / .folded")
+    parser.add_argument('--aulas', type=int, default=8)
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--intervalo', type=float, default=0.001, help="Intervalo de muestreo (s)")
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    if args.modo == 'cprofile':
+        perfilar_cprofile(args.algoritmo, args.tamano, args.salida, args.aulas, args.semilla, args.top)
+    else:
+        perfilar_muestreo(args.algoritmo, args.tamano, args.salida, args.aulas, args.semilla,
+                          args.intervalo, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Perfiles de carga estructurados y adversariales para pruebas de estrés.
+
+Los generadores de cada módulo producen cargas uniformes. Los días difíciles
+tienen otra forma: un profesor con gran parte de las clases, laboratorios
+largos, grupos grandes con pocas aulas grandes, aulas casi saturadas o una
+cola de clases que no caben. Los perfiles se definen una sola vez en
+`generador_vectorizado` (deterministas dada la semilla); aquí se convierten a
+los tipos del módulo planificador indicado y se mide la latencia de peor caso.
+
+Uso:
+    python perfiles_carga.py --tamanos 100 300 500 --repeticiones 3
+"""
+
+import argparse
+import importlib
+import statistics
+import time
+
+from estres_adaptativo import PLANIFICADORES
+from generador_vectorizado import PERFILES_VECTORIZADOS as PERFILES_CARGA, a_objetos, generar_instancia
+
+
+def generar_perfil(nombre, num_clases, num_aulas=8, semilla=42, tipos='algoritmo_voraz'):
+    """
+    Genera (clases, aulas) para el perfil `nombre`.
+
+    `tipos` es el módulo (o su nombre) cuyas clases Clase, Aula y DiaSemana se
+    usan para construir la instancia.
+    """
+    return a_objetos(generar_instancia(num_clases, num_aulas, nombre, semilla), tipos)
+
+
+def medir_perfil(algoritmo, perfil, tamano, num_aulas=8, semilla=42, repeticiones=3):
+    """Planifica una instancia del perfil `repeticiones` veces y devuelve latencias y calidad"""
+    nombre_modulo, _, nombre_clase, nombre_metodo = PLANIFICADORES[algoritmo]
+    modulo = importlib.import_module(nombre_modulo)
+    clases, aulas = generar_perfil(perfil, tamano, num_aulas, semilla, tipos=modulo)
+
+    muestras = []
+    for _ in range(repeticiones):
+        planificador = getattr(modulo, nombre_clase)(aulas)
+        inicio = time.perf_counter()
+        getattr(planificador, nombre_metodo)(clases)
+        muestras.append(time.perf_counter() - inicio)
+
+    asignadas = planificador.estadisticas()['clases_asignadas']
+    from validador import validar_horario
+    validacion = validar_horario(planificador.horarios_asignados, clases, aulas)
+    from cotas import calcular_cotas
+    cotas = calcular_cotas(clases, aulas)
+    return {
+        'algoritmo': algoritmo,
+        'perfil': perfil,
+        'tamano': tamano,
+        'aulas': len(aulas),
+        'tiempo_mediana': statistics.median(muestras),
+        'tiempo_maximo': max(muestras),
+        'muestras_tiempo': muestras,
+        'clases_asignadas': asignadas,
+        'tasa_asignacion': asignadas / tamano if tamano else 0.0,
+        'violaciones': validacion.total,
+        'cota_superior': cotas.cota,
+        'brecha': cotas.brecha(asignadas),
+    }
+
+
+def pruebas_peor_caso(tamanos=(100, 300, 500), algoritmos=('greedy', 'divide_venceras'),
+                      perfiles=tuple(PERFILES_CARGA), num_aulas=8, semilla=42, repeticiones=3):
+    """
+    Ejecuta cada perfil con cada planificador y tamaño y reporta el peor caso.
+
+    Para cada tamaño se indica el perfil con la mayor latencia máxima y cuántas
+    veces es más lento que la carga uniforme.
+    """
+    print("="*80)
+    print("PRUEBAS DE PEOR CASO POR PERFIL DE CARGA")
+    print("="*80)
+    print(f"- Perfiles: {list(perfiles)}")
+    print(f"- Tamaños: {list(tamanos)}, repeticiones: {repeticiones}, semilla: {semilla}")
+
+    mediciones = []
+    for algoritmo in algoritmos:
+        print(f"\n{algoritmo.upper()}")
+        print(f"   {'perfil':<18} {'n':>6} {'aulas':>6} {'mediana':>10} {'máximo':>10} {'asignadas':>10} {'brecha':>8}")
+        for tamano in tamanos:
+            for perfil in perfiles:
+                medicion = medir_perfil(algoritmo, perfil, tamano, num_aulas, semilla + tamano, repeticiones)
+                mediciones.append(medicion)
+                print(f"   {perfil:<18} {tamano:>6} {medicion['aulas']:>6} "
+                      f"{medicion['tiempo_mediana']:>9.4f}s {medicion['tiempo_maximo']:>9.4f}s "
+                      f"{medicion['tasa_asignacion']*100:>9.1f}% {medicion['brecha']*100:>7.1f}%"
+                      + (f"  ❌ {medicion['violaciones']} violaciones" if medicion['violaciones'] else ""))
+
+    print("\nPEOR CASO POR TAMAÑO:")
+    for algoritmo in algoritmos:
+        for tamano in tamanos:
+            del_tamano = [m for m in mediciones if m['algoritmo'] == algoritmo and m['tamano'] == tamano]
+            peor = max(del_tamano, key=lambda m: m['tiempo_maximo'])
+            referencia = next((m for m in del_tamano if m['perfil'] == 'uniforme'), None)
+            relacion = ""
+            if referencia and referencia['tiempo_mediana'] > 0:
+                relacion = f" ({peor['tiempo_maximo'] / referencia['tiempo_mediana']:.1f}x la mediana uniforme)"
+            print(f"   {algoritmo} n={tamano}: {peor['perfil']} {peor['tiempo_maximo']:.4f}s{relacion}")
+
+    return mediciones
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latencia de peor caso con perfiles de carga adversariales")
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[100, 300, 500])
+    parser.add_argument('--perfiles', nargs='+', choices=list(PERFILES_CARGA), default=list(PERFILES_CARGA))
+    parser.add_argument('--algoritmos', nargs='+', choices=list(PLANIFICADORES),
+                        default=['greedy', 'divide_venceras'])
+    parser.add_argument('--aulas', type=int, default=8)
+    parser.add_argument('--repeticiones', type=int, default=3)
+    parser.add_argument('--semilla', type=int, default=42)
+    args = parser.parse_args()
+
+    pruebas_peor_caso(args.tamanos, args.algoritmos, args.perfiles, args.aulas,
+                      args.semilla, args.repeticiones)
+
+
+if __name__ == "__main__":
+    main()
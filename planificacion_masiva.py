@@ -0,0 +1,201 @@
+"""
+Planificación masiva: muchas instancias independientes (facultades) en paralelo.
+
+Las instancias se reparten en un pool de procesos de mayor a menor número de
+clases (regla LPT: la más grande empieza primero y las pequeñas rellenan los
+huecos), así que el lote termina cerca de max(instancia más lenta, suma /
+trabajadores) en vez de la suma de todas. Los resultados se devuelven según
+terminan, con el tiempo de planificación, la espera en cola y el proceso de
+cada instancia.
+
+Uso:
+    python planificacion_masiva.py --instancias 24 --min 200 --max 3000
+"""
+
+import argparse
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from servicio_planificacion import PLANIFICADORES_SERVICIO
+
+
+@dataclass
+class ResultadoInstancia:
+    nombre: str
+    clases: int
+    aulas: int
+    clases_asignadas: int = 0
+    horarios: List = field(default_factory=list)
+    tiempo: float = 0.0  # planificación dentro del trabajador
+    espera: float = 0.0  # desde el envío del lote hasta que empezó a planificarse
+    proceso: Optional[int] = None
+    error: Optional[str] = None
+    desde_cache: bool = False
+
+
+def _planificar_instancia(nombre: str, clases, aulas, planificador: str, envio: float):
+    """Trabajador: planifica una instancia y devuelve las asignaciones por índices"""
+    import importlib
+    from algoritmo_voraz import _a_indices
+
+    espera = time.time() - envio
+    inicio = time.perf_counter()
+    nombre_modulo, nombre_clase, metodo = PLANIFICADORES_SERVICIO[planificador]
+    instancia = getattr(importlib.import_module(nombre_modulo), nombre_clase)(aulas)
+    if metodo == 'replanificar':
+        instancia.replanificar(clases, [])
+    else:
+        getattr(instancia, metodo)(clases)
+    tiempo = time.perf_counter() - inicio
+    return nombre, _a_indices(instancia.horarios_asignados, clases, aulas), tiempo, espera, os.getpid()
+
+
+def _reconstruir(asignaciones, clases, aulas, tipos) -> List:
+    horarios = []
+    for indice_clase, dia, hora_inicio, indice_aula in asignaciones:
+        clase = clases[indice_clase]
+        horarios.append(tipos.HorarioAsignado(clase=clase, dia=tipos.DiaSemana[dia], hora_inicio=hora_inicio,
+                                              hora_fin=hora_inicio + clase.duracion, aula=aulas[indice_aula]))
+    return horarios
+
+
+def planificar_lote(instancias: Dict[str, Tuple[List, List]], planificador: str = 'greedy',
+                    trabajadores: Optional[int] = None, cache=None) -> Iterator[ResultadoInstancia]:
+    """
+    Planifica {nombre: (clases, aulas)} en paralelo y va devolviendo un
+    `ResultadoInstancia` por instancia en orden de finalización. Los horarios
+    se reconstruyen con los objetos originales de cada instancia.
+
+    Con `cache` (`cache_resultados.CacheResultados`) las instancias ya
+    resueltas se devuelven primero sin planificar y las nuevas se guardan.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    if planificador not in PLANIFICADORES_SERVICIO:
+        raise ValueError(f"Planificador desconocido: {planificador}. Opciones: {list(PLANIFICADORES_SERVICIO)}")
+    if not instancias:
+        return
+    orden = sorted(instancias, key=lambda nombre: -len(instancias[nombre][0]))
+    huellas = {}
+    if cache is not None:
+        from cache_resultados import huella_instancia
+        pendientes = []
+        for nombre in orden:
+            clases, aulas = instancias[nombre]
+            huellas[nombre] = huella_instancia(clases, aulas, planificador)
+            horarios = cache.obtener(huellas[nombre], clases, aulas)
+            if horarios is None:
+                pendientes.append(nombre)
+                continue
+            yield ResultadoInstancia(nombre, len(clases), len(aulas), len(horarios), horarios, desde_cache=True)
+        orden = pendientes
+        if not orden:
+            return
+    trabajadores = trabajadores or min(len(orden), os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+        envio = time.time()
+        futuros = {pool.submit(_planificar_instancia, nombre, *instancias[nombre], planificador, envio): nombre
+                   for nombre in orden}
+        for futuro in as_completed(futuros):
+            nombre = futuros[futuro]
+            clases, aulas = instancias[nombre]
+            resultado = ResultadoInstancia(nombre, len(clases), len(aulas))
+            try:
+                _, asignaciones, resultado.tiempo, resultado.espera, resultado.proceso = futuro.result()
+            except Exception as error:
+                resultado.error = f"{type(error).__name__}: {error}"
+                yield resultado
+                continue
+            tipos = sys.modules[type(clases[0]).__module__] if clases else None
+            resultado.horarios = _reconstruir(asignaciones, clases, aulas, tipos) if tipos else []
+            resultado.clases_asignadas = len(resultado.horarios)
+            if nombre in huellas and clases:
+                cache.guardar(huellas[nombre], resultado.horarios, clases, aulas)
+            yield resultado
+
+
+def resumen_lote(resultados: List[ResultadoInstancia], tiempo_pared: float, trabajadores: int) -> Dict:
+    """Tiempo de pared frente a la suma secuencial y a la cota max(mayor, suma / trabajadores)"""
+    tiempos = [r.tiempo for r in resultados if r.error is None]
+    suma = sum(tiempos)
+    mayor = max(tiempos, default=0.0)
+    cota = max(mayor, suma / trabajadores) if trabajadores else suma
+    return {
+        'instancias': len(resultados),
+        'errores': sum(r.error is not None for r in resultados),
+        'desde_cache': sum(r.desde_cache for r in resultados),
+        'clases_asignadas': sum(r.clases_asignadas for r in resultados),
+        'tiempo_pared': tiempo_pared,
+        'suma_secuencial': suma,
+        'instancia_mayor': mayor,
+        'cota_inferior': cota,
+        'eficiencia': cota / tiempo_pared if tiempo_pared > 0 else 0.0,
+        'aceleracion': suma / tiempo_pared if tiempo_pared > 0 else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Planificación masiva de instancias independientes")
+    parser.add_argument('--instancias', type=int, default=24)
+    parser.add_argument('--min', type=int, default=200, help="Clases de la facultad más pequeña")
+    parser.add_argument('--max', type=int, default=3000, help="Clases de la facultad más grande")
+    parser.add_argument('--planificador', choices=list(PLANIFICADORES_SERVICIO), default='greedy')
+    parser.add_argument('--trabajadores', type=int, default=None)
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--cache', default=None, help="Directorio de caché de resultados (repetir el lote la aprovecha)")
+    args = parser.parse_args()
+
+    import importlib
+    import random
+    from estres_adaptativo import PLANIFICADORES
+    from validador import validar_horario
+
+    random.seed(args.semilla)
+    nombre_modulo, nombre_generador, _, _ = PLANIFICADORES[args.planificador]
+    generador = getattr(importlib.import_module(nombre_modulo), nombre_generador)
+    instancias = {}
+    for i in range(args.instancias):
+        tamano = random.randint(args.min, args.max)
+        instancias[f"facultad_{i:02d}"] = generador(tamano, max(2, tamano // 30),
+                                                    num_profesores=max(20, tamano // 10))
+
+    trabajadores = args.trabajadores or min(args.instancias, os.cpu_count() or 1)
+    print(f"{args.instancias} facultades ({args.min}-{args.max} clases), planificador {args.planificador}, "
+          f"{trabajadores} trabajadores\n")
+    print(f"{'Facultad':<14} {'Clases':>7} {'Asignadas':>10} {'Tiempo':>9} {'Espera':>9} {'Proceso':>8}  Validación")
+    print("-" * 80)
+
+    inicio = time.perf_counter()
+    resultados = []
+    cache = None
+    if args.cache:
+        from cache_resultados import CacheResultados
+        cache = CacheResultados(args.cache)
+    for resultado in planificar_lote(instancias, args.planificador, trabajadores, cache):
+        resultados.append(resultado)
+        if resultado.error:
+            print(f"{resultado.nombre:<14} ❌ {resultado.error}")
+            continue
+        validacion = validar_horario(resultado.horarios, *instancias[resultado.nombre])
+        print(f"{resultado.nombre:<14} {resultado.clases:>7} {resultado.clases_asignadas:>10} "
+              f"{resultado.tiempo:>8.3f}s {resultado.espera:>8.3f}s "
+              f"{'caché' if resultado.desde_cache else resultado.proceso:>8}  "
+              f"{'✅' if validacion.valido else '❌ ' + validacion.describir()}")
+    resumen = resumen_lote(resultados, time.perf_counter() - inicio, trabajadores)
+
+    print(f"\nTiempo de pared: {resumen['tiempo_pared']:.2f}s | suma secuencial {resumen['suma_secuencial']:.2f}s | "
+          f"instancia mayor {resumen['instancia_mayor']:.2f}s")
+    print(f"Cota max(mayor, suma / trabajadores): {resumen['cota_inferior']:.2f}s "
+          f"(eficiencia {resumen['eficiencia']:.0%}, aceleración {resumen['aceleracion']:.2f}x)")
+    if cache is not None:
+        metricas = cache.metricas()
+        print(f"Caché: {metricas['aciertos']} aciertos, {metricas['fallos']} fallos, "
+              f"{metricas['entradas']} entradas ({metricas['bytes'] / 2 ** 20:.2f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,451 @@
+"""
+Reparación local de horarios ante disrupciones.
+
+Cuando un aula cierra o un profesor falta en un día y rango de horas, en vez
+de replanificar todo:
+
+1. Se bloquea la franja en el índice de ocupación y se desalojan solo las
+   asignaciones que la pisan (localizadas por (aula, día) o (profesor, día)).
+2. Cada clase desalojada se reubica en el hueco libre más cercano a su
+   posición original: mismo día primero, hora más próxima, misma aula si se
+   puede.
+3. Si no hay hueco libre, una búsqueda local acotada prueba a mover una sola
+   clase que estorba a otro hueco libre (cadena de expulsión de longitud 1),
+   también lo más cerca posible de su posición original.
+
+`HorarioReparable` se construye una vez en O(n) y después cada reparación
+cuesta proporcional al número de clases afectadas, no al tamaño del horario.
+Los planificadores conservan el suyo entre llamadas (`horario_reparable`,
+también base de la vista de `horario()`) junto con las franjas bloqueadas, así
+que solo lo reconstruyen si sustituyen el horario.
+
+Uso:
+    python reparacion.py --tamano 5000 --aulas 150
+"""
+
+import argparse
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from indice_ocupacion import (DIA_COMPLETO, HORA_APERTURA, HORA_CIERRE, IndiceOcupacion,
+                              mascara, ventanas)
+from transacciones import Diario, Transaccional
+
+TIPOS_DISRUPCION = ('aula', 'profesor')
+
+
+@dataclass
+class Disrupcion:
+    """Recurso no disponible: `tipo` 'aula' (id de aula) o 'profesor' (nombre)"""
+    tipo: str
+    recurso: str
+    dia: str  # nombre del DiaSemana, p. ej. 'LUNES'
+    hora_inicio: int = HORA_APERTURA
+    hora_fin: int = HORA_CIERRE
+
+    def __post_init__(self):
+        if self.tipo not in TIPOS_DISRUPCION:
+            raise ValueError(f"Tipo de disrupción desconocido: {self.tipo}. Opciones: {TIPOS_DISRUPCION}")
+        if not HORA_APERTURA <= self.hora_inicio < self.hora_fin <= HORA_CIERRE:
+            raise ValueError(f"Rango horario inválido: {self.hora_inicio}-{self.hora_fin}")
+
+    @property
+    def bits(self) -> int:
+        return mascara(self.hora_inicio, self.hora_fin - self.hora_inicio)
+
+
+@dataclass
+class _SinDiario:
+    """Diario de un planificador sin instantáneas: no hay nada que revertir"""
+
+    def anotar(self, funcion, *argumentos):
+        pass
+
+    def marca(self) -> int:
+        return 0
+
+    def revertir(self, marca: int):
+        pass
+
+
+_SIN_DIARIO = _SinDiario()
+
+
+@dataclass
+class ResultadoReparacion:
+    desalojadas: int = 0
+    reubicadas: int = 0
+    # Otras clases movidas para hacer sitio (id de clase)
+    movidas: List[int] = field(default_factory=list)
+    # Clases desalojadas que no se pudieron reubicar (id de clase)
+    sin_reubicar: List[int] = field(default_factory=list)
+    expulsiones_intentadas: int = 0
+    tiempo: float = 0.0
+
+    def describir(self) -> str:
+        return (f"{self.desalojadas} desalojadas, {self.reubicadas} reubicadas, "
+                f"{len(self.movidas)} movidas, {len(self.sin_reubicar)} sin reubicar "
+                f"en {self.tiempo * 1000:.2f} ms")
+
+
+class HorarioReparable(Transaccional):
+    """
+    Horario con índices por recurso para reparaciones locales.
+
+    Los `HorarioAsignado` se modifican en su sitio al moverlos, así que las
+    listas que los contienen (p. ej. `planificador.horarios_asignados`) ven
+    los cambios; las clases que no se pueden reubicar se retiran de
+    `horarios()`. Cada cambio se anota en `diario`, así que `instantanea()` y
+    `revertir()` deshacen reparaciones y movimientos en proporción a los
+    cambios. Enlazado a un planificador (`horario_reparable`), anota en el
+    diario del planificador y mantiene su `horarios_asignados` al quitar o
+    añadir clases.
+
+    Las franjas de `disrupciones` quedan bloqueadas desde el principio; la
+    lista se usa tal cual (no se copia) y cada reparación le añade la suya.
+    """
+
+    def __init__(self, horarios, aulas, tipos, diario: Optional[Diario] = None,
+                 disrupciones: Optional[List['Disrupcion']] = None):
+        self.aulas = list(aulas)
+        self.tipos = tipos
+        self._dias = {dia.name: dia for dia in tipos.DiaSemana}
+        self._orden_dias = list(self._dias)
+        self._aulas_por_id = {a.id: a for a in self.aulas}
+        self.ocupacion = IndiceOcupacion()
+        # Solo las franjas bloqueadas: liberar una clase no debe desbloquearlas
+        self.bloqueos = IndiceOcupacion()
+        self._asignaciones: Dict[int, object] = {}
+        self._por_aula: Dict[Tuple[str, str], set] = {}
+        self._por_profesor: Dict[Tuple[str, str], set] = {}
+        self.disrupciones: List[Disrupcion] = disrupciones if disrupciones is not None else []
+        self._diario = diario if diario is not None else Diario()
+        self.planificador = None
+        for disrupcion in self.disrupciones:
+            self.ocupacion.bloquear(disrupcion.tipo, disrupcion.recurso, disrupcion.dia, disrupcion.bits)
+            self.bloqueos.bloquear(disrupcion.tipo, disrupcion.recurso, disrupcion.dia, disrupcion.bits)
+        for h in horarios:
+            self._alta(h)
+        # Asignaciones que pisan una franja bloqueada: se reubican en la siguiente reparación
+        self._en_bloqueo = [h for h in horarios if self._bloqueada(h)] if self.disrupciones else []
+
+    @property
+    def diario(self):
+        if self.planificador is None:
+            return self._diario
+        diario = self.planificador.diario_activo() if hasattr(self.planificador, 'diario_activo') else None
+        return diario if diario is not None else _SIN_DIARIO
+
+    def horarios(self) -> List:
+        return list(self._asignaciones.values())
+
+    def _bloqueada(self, h) -> bool:
+        return not self.bloqueos.libre(h.clase, h.dia, h.hora_inicio, h.aula)
+
+    def instantanea(self) -> int:
+        return self.diario.marca()
+
+    def revertir(self, instantanea: int):
+        self.diario.revertir(instantanea)
+
+    def _alta(self, h):
+        self._asignaciones[h.clase.id] = h
+        self.ocupacion.ocupar(h.clase, h.dia, h.hora_inicio, h.aula)
+        self._por_aula.setdefault((h.aula.id, h.dia.name), set()).add(h.clase.id)
+        self._por_profesor.setdefault((h.clase.profesor, h.dia.name), set()).add(h.clase.id)
+
+    def _baja(self, h):
+        del self._asignaciones[h.clase.id]
+        self.ocupacion.liberar(h.clase, h.dia, h.hora_inicio, h.aula)
+        clave_aula, clave_profesor = (h.aula.id, h.dia.name), (h.clase.profesor, h.dia.name)
+        self.ocupacion.aulas[clave_aula] |= self.bloqueos.aulas.get(clave_aula, 0)
+        self.ocupacion.profesores[clave_profesor] |= self.bloqueos.profesores.get(clave_profesor, 0)
+        self._por_aula[(h.aula.id, h.dia.name)].discard(h.clase.id)
+        self._por_profesor[(h.clase.profesor, h.dia.name)].discard(h.clase.id)
+
+    def _registrar(self, h):
+        self._alta(h)
+        self.diario.anotar(self._baja, h)
+
+    def _retirar(self, h):
+        self._baja(h)
+        self.diario.anotar(self._alta, h)
+
+    def _colocar(self, h, dia_nombre: str, hora: int, aula):
+        self.diario.anotar(_restaurar_posicion, h, h.dia, h.hora_inicio, h.hora_fin, h.aula)
+        _restaurar_posicion(h, self._dias[dia_nombre], hora, hora + h.clase.duracion, aula)
+        self._registrar(h)
+
+    def _restaurar_bits(self, tabla: Dict, clave, bits: int):
+        tabla[clave] = bits
+        self.ocupacion._sin_hueco.clear()
+
+    def _sincronizar(self, nuevas):
+        """Registra asignaciones añadidas a la lista del planificador desde la última llamada"""
+        for h in nuevas:
+            self._registrar(h)
+            if self.disrupciones and self._bloqueada(h):
+                self._en_bloqueo.append(h)
+
+    def _quitar_de_lista(self, ids):
+        """Sustituye la lista del planificador por otra sin las clases `ids` (las instantáneas guardan la anterior)"""
+        if self.planificador is None:
+            return
+        lista = [h for h in self.planificador.horarios_asignados if h.clase.id not in ids]
+        self.planificador.horarios_asignados = lista
+        self.planificador._reparable = (lista, len(lista), self)
+
+    def agregar(self, h):
+        """Añade una asignación (sin comprobar conflictos) y, si está enlazado, al planificador"""
+        if h.clase.id in self._asignaciones:
+            raise ValueError(f"La clase {h.clase.id} ya está en el horario")
+        self._registrar(h)
+        if self.planificador is not None:
+            lista = self.planificador.horarios_asignados
+            lista.append(h)
+            self.planificador._reparable = (lista, len(lista), self)
+
+    def quitar(self, id_clase: int):
+        """Quita y devuelve la asignación de la clase"""
+        h = self._asignaciones[id_clase]
+        self._retirar(h)
+        self._quitar_de_lista({id_clase})
+        return h
+
+    def mover(self, id_clase: int, dia: str, hora_inicio: int, id_aula: Optional[str] = None) -> bool:
+        """
+        Mueve una clase asignada a (día, hora, aula; por defecto la suya) si
+        la franja está libre para el aula y el profesor y el aula tiene
+        capacidad; devuelve si se movió. Para edición interactiva: el cambio
+        se anota en el diario, así que `revertir` lo deshace.
+        """
+        h = self._asignaciones[id_clase]
+        aula = self._aulas_por_id.get(id_aula or h.aula.id)
+        if (aula is None or aula.capacidad < h.clase.estudiantes or dia not in self._dias
+                or not HORA_APERTURA <= hora_inicio <= HORA_CIERRE - h.clase.duracion):
+            return False
+        self._retirar(h)
+        if not self.ocupacion.libre(h.clase, self._dias[dia], hora_inicio, aula):
+            self._registrar(h)
+            return False
+        self._colocar(h, dia, hora_inicio, aula)
+        return True
+
+    def _mejor_hueco(self, clase, dia_preferido: str, hora_preferida: int, aula_preferida: str,
+                     ocupacion_aula=None, ocupacion_profesor=None) -> Optional[Tuple[str, int, object]]:
+        """
+        Hueco libre más cercano a (día, hora, aula) preferidos: el primer día
+        con hueco (empezando por el preferido), la hora más próxima y, a
+        igualdad, el aula preferida. Los diccionarios opcionales sustituyen la
+        ocupación de algunas claves (para evaluar una expulsión sin aplicarla).
+        """
+        ocupacion_aula = ocupacion_aula or {}
+        ocupacion_profesor = ocupacion_profesor or {}
+        dias = [dia_preferido] + [d for d in self._orden_dias if d != dia_preferido]
+        preferida = hora_preferida - HORA_APERTURA
+        for dia in dias:
+            clave_profesor = (clase.profesor, dia)
+            libres_profesor = ventanas(~ocupacion_profesor.get(
+                clave_profesor, self.ocupacion.profesores.get(clave_profesor, 0)) & DIA_COMPLETO, clase.duracion)
+            if not libres_profesor:
+                continue
+            mejor = None
+            for aula in self.aulas:
+                if aula.capacidad < clase.estudiantes:
+                    continue
+                clave_aula = (aula.id, dia)
+                comunes = libres_profesor & ventanas(~ocupacion_aula.get(
+                    clave_aula, self.ocupacion.aulas.get(clave_aula, 0)) & DIA_COMPLETO, clase.duracion)
+                while comunes:
+                    bit = comunes & -comunes
+                    hora = bit.bit_length() - 1
+                    comunes ^= bit
+                    puntuacion = (abs(hora - preferida), aula.id != aula_preferida, hora)
+                    if mejor is None or puntuacion < mejor[0]:
+                        mejor = (puntuacion, hora, aula)
+            if mejor is not None:
+                return dia, HORA_APERTURA + mejor[1], mejor[2]
+        return None
+
+    def _expulsar_uno(self, h, dia_preferido: str, hora_preferida: int, limite: int,
+                      resultado: ResultadoReparacion) -> bool:
+        """Coloca `h` moviendo como mucho otra clase a un hueco libre"""
+        clase = h.clase
+        dias = [dia_preferido] + [d for d in self._orden_dias if d != dia_preferido]
+        for dia in dias:
+            for aula in self.aulas:
+                if aula.capacidad < clase.estudiantes:
+                    continue
+                for id_otra in list(self._por_aula.get((aula.id, dia), ())):
+                    if resultado.expulsiones_intentadas >= limite:
+                        return False
+                    resultado.expulsiones_intentadas += 1
+                    otra = self._asignaciones[id_otra]
+                    bits_otra = mascara(otra.hora_inicio, otra.clase.duracion)
+                    # Ocupación del aula y del profesor sin la otra clase
+                    sin_otra_aula = self.ocupacion.aulas[(aula.id, dia)] & ~bits_otra
+                    ocupado_profesor = self.ocupacion.profesores.get((clase.profesor, dia), 0)
+                    if otra.clase.profesor == clase.profesor:
+                        ocupado_profesor &= ~bits_otra
+                    comunes = (ventanas(~sin_otra_aula & DIA_COMPLETO, clase.duracion)
+                               & ventanas(~ocupado_profesor & DIA_COMPLETO, clase.duracion))
+                    if not comunes:
+                        continue
+                    hora = (comunes & -comunes).bit_length() - 1 + HORA_APERTURA
+                    bits = mascara(hora, clase.duracion)
+
+                    # ¿Cabe la otra clase en algún hueco con `h` ya colocada?
+                    ocupacion_aula = {(aula.id, dia): sin_otra_aula | bits}
+                    ocupacion_profesor = {}
+                    clave_otra = (otra.clase.profesor, dia)
+                    ocupacion_profesor[clave_otra] = self.ocupacion.profesores[clave_otra] & ~bits_otra
+                    if otra.clase.profesor == clase.profesor:
+                        ocupacion_profesor[clave_otra] |= bits
+                    destino = self._mejor_hueco(otra.clase, dia, otra.hora_inicio, otra.aula.id,
+                                                ocupacion_aula, ocupacion_profesor)
+                    if destino is None:
+                        continue
+
+                    self._retirar(otra)
+                    self._colocar(h, dia, hora, aula)
+                    self._colocar(otra, *destino)
+                    resultado.movidas.append(id_otra)
+                    return True
+        return False
+
+    def reparar(self, disrupcion: Disrupcion, limite_expulsiones: int = 200) -> ResultadoReparacion:
+        """
+        Aplica la disrupción y reubica las clases afectadas, junto con las que
+        pisaban una franja ya bloqueada.
+
+        `limite_expulsiones` acota el número de clases candidatas a mover que
+        se evalúan en total durante la búsqueda local. Si el horario está
+        enlazado a un planificador, las clases sin reubicar salen también de
+        su `horarios_asignados`.
+        """
+        inicio = time.perf_counter()
+        resultado = ResultadoReparacion()
+        if disrupcion.dia not in self._dias:
+            raise ValueError(f"Día desconocido: {disrupcion.dia}")
+
+        clave = (disrupcion.recurso, disrupcion.dia)
+        por_recurso = self._por_aula if disrupcion.tipo == 'aula' else self._por_profesor
+        afectadas = {i: self._asignaciones[i] for i in por_recurso.get(clave, ())
+                     if self._asignaciones[i].hora_inicio < disrupcion.hora_fin
+                     and disrupcion.hora_inicio < self._asignaciones[i].hora_fin}
+        afectadas.update((h.clase.id, h) for h in self._en_bloqueo
+                         if self._asignaciones.get(h.clase.id) is h and self._bloqueada(h))
+        self.diario.anotar(setattr, self, '_en_bloqueo', self._en_bloqueo)
+        self._en_bloqueo = []
+        afectadas = list(afectadas.values())
+        afectadas.sort(key=lambda h: (-h.clase.duracion, h.clase.id))
+        posiciones = {h.clase.id: (h.dia.name, h.hora_inicio, h.aula.id) for h in afectadas}
+        for h in afectadas:
+            self._retirar(h)
+        resultado.desalojadas = len(afectadas)
+
+        # Bloquear la franja después de desalojar para no borrar bits de clases
+        for indice in (self.ocupacion, self.bloqueos):
+            tabla = indice.aulas if disrupcion.tipo == 'aula' else indice.profesores
+            self.diario.anotar(self._restaurar_bits, tabla, clave, tabla.get(clave, 0))
+            indice.bloquear(disrupcion.tipo, disrupcion.recurso, disrupcion.dia, disrupcion.bits)
+        self.disrupciones.append(disrupcion)
+        self.diario.anotar(self.disrupciones.pop)
+
+        for h in afectadas:
+            dia, hora, id_aula = posiciones[h.clase.id]
+            destino = self._mejor_hueco(h.clase, dia, hora, id_aula)
+            if destino is not None:
+                self._colocar(h, *destino)
+                resultado.reubicadas += 1
+            elif self._expulsar_uno(h, dia, hora, limite_expulsiones, resultado):
+                resultado.reubicadas += 1
+            else:
+                resultado.sin_reubicar.append(h.clase.id)
+        if resultado.sin_reubicar:
+            self._quitar_de_lista(set(resultado.sin_reubicar))
+
+        resultado.tiempo = time.perf_counter() - inicio
+        return resultado
+
+
+def _restaurar_posicion(h, dia, hora_inicio: int, hora_fin: int, aula):
+    h.dia, h.hora_inicio, h.hora_fin, h.aula = dia, hora_inicio, hora_fin, aula
+
+
+def horario_reparable(planificador, tipos=None, clase=None) -> HorarioReparable:
+    """
+    `HorarioReparable` (o la subclase `clase`) enlazado al planificador y
+    guardado entre llamadas. Se reutiliza mientras el planificador solo añada
+    asignaciones al final de `horarios_asignados` (se registran las nuevas);
+    si sustituye la lista se reconstruye en O(n), con las disrupciones
+    acumuladas en `planificador.disrupciones` ya bloqueadas.
+    """
+    import sys
+    tipos = tipos or sys.modules[type(planificador).__module__]
+    clase = clase or HorarioReparable
+    if getattr(planificador, 'disrupciones', None) is None:
+        planificador.disrupciones = []
+    lista = planificador.horarios_asignados
+    anterior = getattr(planificador, '_reparable', None)
+    if (anterior is not None and anterior[0] is lista and anterior[1] <= len(lista)
+            and isinstance(anterior[2], clase) and anterior[2].tipos is tipos
+            and anterior[2].disrupciones is planificador.disrupciones):
+        reparable = anterior[2]
+        reparable._sincronizar(lista[anterior[1]:])
+    else:
+        # Construido sin anotar: revertir el planificador lo descarta entero
+        reparable = clase(lista, planificador.aulas, tipos, disrupciones=planificador.disrupciones)
+        reparable.planificador = planificador
+    planificador._reparable = (lista, len(lista), reparable)
+    return reparable
+
+
+def reparar_disrupcion(planificador, disrupcion: Disrupcion, tipos=None,
+                       limite_expulsiones: int = 200) -> ResultadoReparacion:
+    """
+    Repara el horario de un planificador y acumula la disrupción en
+    `planificador.disrupciones`, con el `HorarioReparable` que el planificador
+    conserva entre llamadas (`horario_reparable`).
+    """
+    return horario_reparable(planificador, tipos).reparar(disrupcion, limite_expulsiones)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reparación local tras cerrar un aula y ausentarse un profesor")
+    parser.add_argument('--tamano', type=int, default=5000)
+    parser.add_argument('--aulas', type=int, default=150)
+    parser.add_argument('--profesores', type=int, default=400)
+    parser.add_argument('--semilla', type=int, default=42)
+    args = parser.parse_args()
+
+    import random
+    import algoritmo_voraz
+    from validador import validar_horario
+
+    random.seed(args.semilla)
+    clases, aulas = algoritmo_voraz.generar_datos_prueba_greedy(args.tamano, args.aulas,
+                                                                num_profesores=args.profesores)
+    planificador = algoritmo_voraz.PlanificadorVoraz(aulas)
+    planificador.replanificar(clases, [])
+    print(f"Horario inicial: {len(planificador.horarios_asignados)}/{args.tamano} clases")
+
+    inicio = time.perf_counter()
+    reparable = HorarioReparable(planificador.horarios_asignados, aulas, algoritmo_voraz)
+    print(f"Índices construidos en {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+    profesor = planificador.horarios_asignados[0].clase.profesor
+    for disrupcion in (Disrupcion('aula', aulas[0].id, 'LUNES'),
+                       Disrupcion('profesor', profesor, 'MARTES', 10, 14),
+                       Disrupcion('aula', aulas[1].id, 'MIERCOLES', 8, 13)):
+        resultado = reparable.reparar(disrupcion)
+        print(f"   {disrupcion.tipo} {disrupcion.recurso} {disrupcion.dia} "
+              f"{disrupcion.hora_inicio}-{disrupcion.hora_fin}: {resultado.describir()}")
+
+    horarios = reparable.horarios()
+    print(f"Validación: {validar_horario(horarios, clases, aulas).describir()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,471 @@
+"""
+Servicio local de planificación: asyncio, JSON por líneas, trabajadores calientes.
+
+El servicio escucha en un socket Unix (o TCP local) y recibe una solicitud
+JSON por línea. Cada instancia (un horario identificado por nombre) vive en un
+proceso trabajador fijo, elegido por hash del nombre, que ya tiene importados
+los planificadores y conserva el planificador entre solicitudes: no se arranca
+un proceso ni se reconstruye `PlanificadorVoraz` por llamada.
+
+Las solicitudes de una misma instancia se encolan y se procesan por lotes: las
+que llegan mientras el trabajador está ocupado se envían juntas en la
+siguiente llamada, y las altas y bajas de clases consecutivas se aplican con un
+único arranque en caliente (`replanificar`).
+
+Operaciones (campo "op"):
+    planificar  {"instancia", "clases", "aulas", "planificador"?}
+    agregar     {"instancia", "clases"}
+    eliminar    {"instancia", "ids"}
+    disrupcion  {"instancia", "tipo", "recurso", "dia", "hora_inicio"?, "hora_fin"?}
+    horario     {"instancia"}
+    metricas    {}
+
+Cada respuesta lleva "id" (el de la solicitud), "ok", "latencia_ms", "lote"
+(solicitudes procesadas juntas) y "cola" (solicitudes pendientes al llegar).
+
+Uso:
+    python servicio_planificacion.py servir --socket /tmp/planificacion.sock
+    python servicio_planificacion.py demo --clientes 8 --solicitudes 25
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+import zlib
+from collections import deque
+from typing import Dict, List, Optional
+
+# 'greedy' arranca con `replanificar` desde un horario vacío: mismo resultado que
+# `greedy_adaptativo`, pero con el índice de ocupación en bits
+PLANIFICADORES_SERVICIO = {
+    'greedy': ('algoritmo_voraz', 'PlanificadorVoraz', 'replanificar'),
+    'divide_venceras': ('divide_venceras', 'PlanificadorDivideVenceras', 'divide_venceras'),
+}
+OPERACIONES_INSTANCIA = ('planificar', 'agregar', 'eliminar', 'disrupcion', 'horario')
+
+# Estado del proceso trabajador por instancia: planificador, {id: Clase}, módulo de
+# tipos, ids añadidos desde el último replanificar y si desde entonces se liberó sitio.
+# Las disrupciones aplicadas las guarda el propio planificador y `replanificar` mantiene
+# sus franjas bloqueadas
+_estados: Dict[str, Dict] = {}
+
+
+def _calentar() -> int:
+    """Primera tarea de cada trabajador: importa planificadores y reparación una vez"""
+    import algoritmo_voraz  # noqa: F401
+    import divide_venceras  # noqa: F401
+    import reparacion  # noqa: F401
+    return os.getpid()
+
+
+def _clase_desde_json(tipos, datos: Dict):
+    dia = datos.get('dia_preferido', 'LUNES')
+    return tipos.Clase(id=int(datos['id']), nombre=datos.get('nombre', ''), profesor=datos['profesor'],
+                       duracion=int(datos['duracion']),
+                       horario_preferido=(tipos.DiaSemana[dia], int(datos.get('hora_preferida', 8))),
+                       aula_requerida="", estudiantes=int(datos['estudiantes']))
+
+
+def _resumen(planificador, clases: Dict) -> Dict:
+    return {'ok': True, 'asignadas': len(planificador.horarios_asignados), 'clases': len(clases)}
+
+
+def _procesar_lote(instancia: str, operaciones: List[Dict]) -> List[Dict]:
+    """
+    Trabajador: aplica las operaciones de una instancia en orden. Las altas y
+    bajas consecutivas se agrupan en un solo `replanificar`.
+    """
+    import importlib
+    from reparacion import Disrupcion
+
+    resultados: List[Optional[Dict]] = [None] * len(operaciones)
+    grupo: List[int] = []  # altas/bajas pendientes de replanificar
+
+    def cerrar_grupo():
+        if not grupo:
+            return
+        estado = _estados[instancia]
+        planificador, clases = estado['planificador'], estado['clases']
+        if estado['liberado']:
+            candidatas = list(clases.values())
+        else:
+            # Sin bajas, las clases que no cupieron antes tampoco caben ahora:
+            # solo se intentan las nuevas
+            candidatas = [h.clase for h in planificador.horarios_asignados] + [
+                clases[id_clase] for id_clase in estado['nuevas'] if id_clase in clases]
+        planificador.replanificar(candidatas, planificador.horarios_asignados)
+        estado['nuevas'].clear()
+        estado['liberado'] = False
+        for i in grupo:
+            resultados[i] = dict(_resumen(planificador, clases),
+                                 colocadas=planificador.resultados_replanificacion['colocadas'])
+        grupo.clear()
+
+    for i, operacion in enumerate(operaciones):
+        op = operacion['op']
+        try:
+            if op == 'planificar':
+                cerrar_grupo()
+                nombre_modulo, nombre_clase, metodo = PLANIFICADORES_SERVICIO[operacion.get('planificador', 'greedy')]
+                tipos = importlib.import_module(nombre_modulo)
+                aulas = [tipos.Aula(id=a['id'], capacidad=int(a['capacidad']), equipamiento=a.get('equipamiento', []))
+                         for a in operacion['aulas']]
+                clases = {c.id: c for c in (_clase_desde_json(tipos, d) for d in operacion['clases'])}
+                planificador = getattr(tipos, nombre_clase)(aulas)
+                if metodo == 'replanificar':
+                    planificador.replanificar(list(clases.values()), [])
+                else:
+                    getattr(planificador, metodo)(list(clases.values()))
+                _estados[instancia] = {'planificador': planificador, 'clases': clases, 'tipos': tipos,
+                                       'nuevas': [], 'liberado': False}
+                resultados[i] = _resumen(planificador, clases)
+                continue
+
+            if instancia not in _estados:
+                raise KeyError(f"Instancia desconocida: {instancia}; usar 'planificar' primero")
+            estado = _estados[instancia]
+            planificador, clases = estado['planificador'], estado['clases']
+            if op == 'agregar':
+                for datos in operacion['clases']:
+                    clase = _clase_desde_json(estado['tipos'], datos)
+                    # Sustituir una clase ya existente puede liberar su franja
+                    estado['liberado'] |= clase.id in clases
+                    clases[clase.id] = clase
+                    estado['nuevas'].append(clase.id)
+                grupo.append(i)
+            elif op == 'eliminar':
+                for id_clase in operacion['ids']:
+                    clases.pop(int(id_clase), None)
+                estado['liberado'] = True
+                grupo.append(i)
+            elif op == 'disrupcion':
+                cerrar_grupo()
+                planificador.reparar(Disrupcion(operacion['tipo'], operacion['recurso'], operacion['dia'],
+                                                int(operacion.get('hora_inicio', 8)),
+                                                int(operacion.get('hora_fin', 18))))
+                resultados[i] = dict(_resumen(planificador, clases), **planificador.resultados_reparacion)
+            elif op == 'horario':
+                cerrar_grupo()
+                resultados[i] = dict(_resumen(planificador, clases), horario=[
+                    [h.clase.id, h.dia.name, h.hora_inicio, h.aula.id] for h in planificador.horarios_asignados])
+            else:
+                raise ValueError(f"Operación desconocida: {op}")
+        except Exception as error:
+            cerrar_grupo()
+            resultados[i] = {'ok': False, 'error': f"{type(error).__name__}: {error}"}
+
+    cerrar_grupo()
+    return resultados
+
+
+class ServicioPlanificacion:
+    """Cola por instancia, lotes y métricas; los cálculos van a los trabajadores"""
+
+    def __init__(self, trabajadores: Optional[int] = None, lote_maximo: int = 64,
+                 ventana_metricas: int = 1000):
+        self.num_trabajadores = trabajadores or os.cpu_count() or 1
+        self.lote_maximo = lote_maximo
+        self._trabajadores = []
+        self._pendientes: Dict[str, List] = {}
+        self._drenando = set()
+        # asyncio solo guarda referencias débiles a las tareas de los drenados en curso
+        self._tareas_drenado = set()
+        self._en_cola = 0
+        self._latencias = deque(maxlen=ventana_metricas)
+        self._lotes = 0
+        self._procesadas = 0
+        self._inicio = time.perf_counter()
+        self._conexiones: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    async def iniciar(self):
+        """Crea los trabajadores (uno por proceso, con afinidad por instancia) y los calienta"""
+        from concurrent.futures import ProcessPoolExecutor
+        loop = asyncio.get_running_loop()
+        self._trabajadores = [ProcessPoolExecutor(max_workers=1) for _ in range(self.num_trabajadores)]
+        await asyncio.gather(*(loop.run_in_executor(t, _calentar) for t in self._trabajadores))
+
+    def cerrar(self):
+        for trabajador in self._trabajadores:
+            trabajador.shutdown(cancel_futures=True)
+        self._trabajadores = []
+
+    def _trabajador(self, instancia: str):
+        return self._trabajadores[zlib.crc32(instancia.encode()) % len(self._trabajadores)]
+
+    def metricas(self) -> Dict:
+        latencias = sorted(self._latencias)
+
+        def percentil(p):
+            return latencias[min(len(latencias) - 1, int(p / 100 * len(latencias)))] if latencias else 0.0
+
+        return {
+            'ok': True,
+            'solicitudes': self._procesadas,
+            'lotes': self._lotes,
+            'lote_medio': self._procesadas / self._lotes if self._lotes else 0.0,
+            'cola': self._en_cola,
+            'instancias_activas': len(self._drenando),
+            'latencia_p50_ms': percentil(50),
+            'latencia_p95_ms': percentil(95),
+            'latencia_p99_ms': percentil(99),
+            'latencia_media_ms': statistics.fmean(latencias) if latencias else 0.0,
+            'trabajadores': len(self._trabajadores),
+            'activo_s': time.perf_counter() - self._inicio,
+        }
+
+    async def atender(self, mensaje: Dict) -> Dict:
+        inicio = time.perf_counter()
+        cola = self._en_cola
+        op = mensaje.get('op')
+        if op == 'metricas':
+            respuesta = self.metricas()
+        elif op not in OPERACIONES_INSTANCIA:
+            respuesta = {'ok': False, 'error': f"Operación desconocida: {op}"}
+        elif not isinstance(mensaje.get('instancia'), str):
+            respuesta = {'ok': False, 'error': "Falta el campo 'instancia'"}
+        else:
+            futuro = asyncio.get_running_loop().create_future()
+            instancia = mensaje['instancia']
+            self._pendientes.setdefault(instancia, []).append((mensaje, futuro))
+            self._en_cola += 1
+            if instancia not in self._drenando:
+                self._drenando.add(instancia)
+                tarea = asyncio.create_task(self._drenar(instancia))
+                self._tareas_drenado.add(tarea)
+                tarea.add_done_callback(self._tareas_drenado.discard)
+            respuesta = await futuro
+
+        latencia = (time.perf_counter() - inicio) * 1000
+        if op in OPERACIONES_INSTANCIA:
+            self._latencias.append(latencia)
+        respuesta.update(latencia_ms=latencia, cola=cola)
+        if 'id' in mensaje:
+            respuesta['id'] = mensaje['id']
+        return respuesta
+
+    async def _drenar(self, instancia: str):
+        """Envía al trabajador de la instancia todo lo acumulado, lote a lote"""
+        loop = asyncio.get_running_loop()
+        try:
+            while self._pendientes.get(instancia):
+                lote = self._pendientes[instancia][:self.lote_maximo]
+                del self._pendientes[instancia][:len(lote)]
+                self._en_cola -= len(lote)
+                try:
+                    resultados = await loop.run_in_executor(self._trabajador(instancia), _procesar_lote,
+                                                            instancia, [mensaje for mensaje, _ in lote])
+                except Exception as error:
+                    resultados = [{'ok': False, 'error': f"{type(error).__name__}: {error}"}] * len(lote)
+                self._lotes += 1
+                self._procesadas += len(lote)
+                for (_, futuro), resultado in zip(lote, resultados):
+                    futuro.set_result(dict(resultado, lote=len(lote)))
+        finally:
+            self._pendientes.pop(instancia, None)
+            self._drenando.discard(instancia)
+
+    async def _conexion(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        self._conexiones[asyncio.current_task()] = escritor
+        bloqueo = asyncio.Lock()
+
+        async def responder(linea: bytes):
+            try:
+                mensaje = json.loads(linea)
+                if not isinstance(mensaje, dict):
+                    raise ValueError("Se esperaba un objeto JSON")
+                respuesta = await self.atender(mensaje)
+            except ValueError as error:
+                respuesta = {'ok': False, 'error': f"JSON inválido: {error}"}
+            async with bloqueo:
+                escritor.write(json.dumps(respuesta, ensure_ascii=False).encode() + b'\n')
+                await escritor.drain()
+
+        tareas = set()
+        try:
+            while linea := await lector.readline():
+                if linea.strip():
+                    tarea = asyncio.create_task(responder(linea))
+                    tareas.add(tarea)
+                    tarea.add_done_callback(tareas.discard)
+            await asyncio.gather(*tareas)
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+            self._conexiones.pop(asyncio.current_task(), None)
+
+    async def servir(self, socket: Optional[str] = None, host: str = '127.0.0.1', puerto: int = 8765):
+        """Inicia el servidor (Unix si se da `socket`, si no TCP) y devuelve el asyncio.Server"""
+        if not self._trabajadores:
+            await self.iniciar()
+        if socket:
+            return await asyncio.start_unix_server(self._conexion, path=socket, limit=2 ** 26)
+        return await asyncio.start_server(self._conexion, host, puerto, limit=2 ** 26)
+
+    async def detener(self, servidor):
+        """Deja de aceptar conexiones, cierra las abiertas y apaga los trabajadores"""
+        servidor.close()
+        for escritor in list(self._conexiones.values()):
+            escritor.transport.abort()
+        await asyncio.gather(*self._conexiones, return_exceptions=True)
+        await servidor.wait_closed()
+        self.cerrar()
+
+
+class ClientePlanificacion:
+    """Cliente asyncio: varias solicitudes en vuelo por conexión, emparejadas por id"""
+
+    def __init__(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        self._lector, self._escritor = lector, escritor
+        self._esperando: Dict[int, asyncio.Future] = {}
+        self._siguiente = 0
+        self._lectura = asyncio.create_task(self._leer())
+
+    @classmethod
+    async def conectar(cls, socket: Optional[str] = None, host: str = '127.0.0.1', puerto: int = 8765):
+        if socket:
+            lector, escritor = await asyncio.open_unix_connection(socket, limit=2 ** 26)
+        else:
+            lector, escritor = await asyncio.open_connection(host, puerto, limit=2 ** 26)
+        return cls(lector, escritor)
+
+    async def _leer(self):
+        while linea := await self._lector.readline():
+            respuesta = json.loads(linea)
+            futuro = self._esperando.pop(respuesta.get('id'), None)
+            if futuro is not None:
+                futuro.set_result(respuesta)
+
+    async def solicitar(self, op: str, **campos) -> Dict:
+        self._siguiente += 1
+        futuro = asyncio.get_running_loop().create_future()
+        self._esperando[self._siguiente] = futuro
+        self._escritor.write(json.dumps(dict(campos, op=op, id=self._siguiente)).encode() + b'\n')
+        await self._escritor.drain()
+        return await futuro
+
+    async def cerrar(self):
+        self._escritor.close()
+        self._lectura.cancel()
+
+
+def instancia_a_json(clases, aulas) -> Dict:
+    """Clases y aulas de cualquier planificador en el formato de 'planificar'"""
+    return {
+        'clases': [{'id': c.id, 'nombre': c.nombre, 'profesor': c.profesor, 'duracion': c.duracion,
+                    'estudiantes': c.estudiantes, 'dia_preferido': c.horario_preferido[0].name,
+                    'hora_preferida': c.horario_preferido[1]} for c in clases],
+        'aulas': [{'id': a.id, 'capacidad': a.capacidad} for a in aulas],
+    }
+
+
+async def _demo(args):
+    import random
+    import subprocess
+    import sys
+    import tempfile
+    from algoritmo_voraz import generar_datos_prueba_greedy
+
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    inicio = time.perf_counter()
+    subprocess.run([sys.executable, '-c', 'import algoritmo_voraz'], cwd=directorio, check=True)
+    print(f"Referencia: arrancar un proceso e importar el planificador cuesta "
+          f"{(time.perf_counter() - inicio) * 1000:.0f} ms")
+
+    random.seed(args.semilla)
+    ruta = os.path.join(tempfile.mkdtemp(), 'planificacion.sock')
+    servicio = ServicioPlanificacion(args.trabajadores)
+    servidor = await servicio.servir(socket=ruta)
+    try:
+        instancias = {}
+        siguiente_id = 0
+        for i in range(args.instancias):
+            clases, aulas = generar_datos_prueba_greedy(args.tamano, args.aulas)
+            for clase in clases:
+                clase.id = siguiente_id
+                siguiente_id += 1
+            instancias[f"facultad_{i}"] = (clases, aulas)
+
+        cliente = await ClientePlanificacion.conectar(ruta)
+        for nombre, (clases, aulas) in instancias.items():
+            respuesta = await cliente.solicitar('planificar', instancia=nombre, **instancia_a_json(clases, aulas))
+            print(f"   {nombre}: {respuesta['asignadas']}/{respuesta['clases']} asignadas "
+                  f"en {respuesta['latencia_ms']:.0f} ms")
+
+        nuevas, _ = generar_datos_prueba_greedy(args.clientes * args.solicitudes, args.aulas)
+        for clase in nuevas:
+            clase.id = siguiente_id
+            siguiente_id += 1
+        nombres = list(instancias)
+
+        async def cliente_incremental(c):
+            conexion = await ClientePlanificacion.conectar(ruta)
+            for s in range(args.solicitudes):
+                clase = nuevas[c * args.solicitudes + s]
+                await conexion.solicitar('agregar', instancia=nombres[(c + s) % len(nombres)],
+                                         **instancia_a_json([clase], []))
+            await conexion.cerrar()
+
+        inicio = time.perf_counter()
+        await asyncio.gather(*(cliente_incremental(c) for c in range(args.clientes)))
+        transcurrido = time.perf_counter() - inicio
+        metricas = await cliente.solicitar('metricas')
+        await cliente.cerrar()
+
+        total = args.clientes * args.solicitudes
+        print(f"\n{total} altas incrementales de {args.clientes} clientes en {transcurrido:.2f}s "
+              f"({total / transcurrido:.0f} solicitudes/s)")
+        print(f"   Lotes: {metricas['lotes']} (tamaño medio {metricas['lote_medio']:.1f})")
+        print(f"   Latencia p50 {metricas['latencia_p50_ms']:.1f} ms, p95 {metricas['latencia_p95_ms']:.1f} ms, "
+              f"p99 {metricas['latencia_p99_ms']:.1f} ms")
+    finally:
+        await servicio.detener(servidor)
+        os.unlink(ruta)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servicio local de planificación con lotes por instancia")
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+
+    servir = subparsers.add_parser('servir', help="Atender solicitudes hasta Ctrl+C")
+    servir.add_argument('--socket', default=None, help="Ruta del socket Unix (si no, TCP)")
+    servir.add_argument('--host', default='127.0.0.1')
+    servir.add_argument('--puerto', type=int, default=8765)
+    servir.add_argument('--trabajadores', type=int, default=None)
+
+    demo = subparsers.add_parser('demo', help="Servidor y clientes concurrentes en este proceso")
+    demo.add_argument('--tamano', type=int, default=2000)
+    demo.add_argument('--aulas', type=int, default=60)
+    demo.add_argument('--instancias', type=int, default=2)
+    demo.add_argument('--clientes', type=int, default=8)
+    demo.add_argument('--solicitudes', type=int, default=25)
+    demo.add_argument('--trabajadores', type=int, default=None)
+    demo.add_argument('--semilla', type=int, default=42)
+    args = parser.parse_args()
+
+    if args.comando == 'demo':
+        asyncio.run(_demo(args))
+        return
+
+    async def atender_siempre():
+        servicio = ServicioPlanificacion(args.trabajadores)
+        servidor = await servicio.servir(args.socket, args.host, args.puerto)
+        destino = args.socket or f"{args.host}:{args.puerto}"
+        print(f"Servicio de planificación en {destino} con {servicio.num_trabajadores} trabajadores")
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            servicio.cerrar()
+
+    try:
+        asyncio.run(atender_siempre())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""
+Solver exacto por ramificación y poda para instancias pequeñas (≲ 100 clases).
+
+Sirve como referencia de calidad: maximiza el número de clases asignadas con
+las mismas restricciones que los planificadores heurísticos (capacidad, sin
+choques de aula ni de profesor, ventana 8:00-18:00) y, si termina dentro del
+límite de tiempo, demuestra que la solución es óptima.
+
+- Ocupación en bits: la semana de cada aula y de cada profesor es un entero de
+  50 bits (5 días × 10 horas); una colocación es una máscara y comprobar un
+  choque es un AND.
+- Cota: asignadas + mínimo entre la cota por profesor (horas libres de cada
+  profesor) y la cota por banda de capacidad (horas libres de las k aulas más
+  grandes), ambas sobre las clases restantes. Se poda si no supera la mejor.
+- Simetrías: aulas de igual capacidad con la misma ocupación son
+  intercambiables (solo se prueba la primera); las clases idénticas (profesor,
+  duración, estudiantes) se colocan en orden creciente de franja.
+- Incumbente inicial: la solución del voraz adaptativo, así que el resultado
+  nunca es peor que el del voraz y la poda es efectiva desde el principio.
+- Límite de tiempo: al agotarse devuelve la mejor solución encontrada y marca
+  `optimo=False`; la cota de la raíz acota lo que se pudo perder.
+
+Solo usa la biblioteca estándar, como los demás planificadores.
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List
+
+from algoritmo_voraz import (Aula, Clase, DiaSemana, HorarioAsignado,
+                             generar_datos_prueba_greedy as generar_datos_prueba_exacto)
+from indice_ocupacion import HORA_APERTURA, HORA_CIERRE
+
+HORAS_DIA = HORA_CIERRE - HORA_APERTURA
+HORAS_SEMANA = len(DiaSemana) * HORAS_DIA
+TAMANO_MAXIMO = 500  # la búsqueda es recursiva: una llamada por clase
+INTERVALO_RELOJ = 1024  # nodos entre consultas al reloj
+
+
+class _Detener(Exception):
+    pass
+
+
+class PlanificadorExacto:
+
+    def __init__(self, aulas: List[Aula], instrumentar: bool = False, limite_tiempo: float = 10.0):
+        self.aulas = aulas
+        self.instrumentar = instrumentar
+        self.limite_tiempo = limite_tiempo
+        self.horarios_asignados: List[HorarioAsignado] = []
+        self.estadisticas_exacto = self._estadisticas_vacias()
+
+    @staticmethod
+    def _estadisticas_vacias() -> Dict:
+        return {'nodos': 0, 'podas': 0, 'soluciones_mejoradas': 0, 'cota_raiz': 0,
+                'asignadas_voraz': 0, 'optimo': False, 'tiempo': 0.0}
+
+    def _preparar(self, clases: List[Clase]):
+        """Ordena las clases y precalcula máscaras, aulas válidas y sufijos para la cota"""
+        capacidades = sorted({a.capacidad for a in self.aulas})
+        tipo_aula = [capacidades.index(a.capacidad) for a in self.aulas]
+        # Aulas de mayor a menor capacidad: la banda k son las k primeras
+        por_capacidad = sorted(range(len(self.aulas)), key=lambda r: -self.aulas[r].capacidad)
+
+        profesores = {}
+        datos = []
+        for clase in clases:
+            validas = [r for r in por_capacidad if self.aulas[r].capacidad >= clase.estudiantes]
+            if not validas or not 1 <= clase.duracion <= HORAS_DIA:
+                continue
+            # Mejor ajuste primero, como el voraz
+            validas.sort(key=lambda r: self.aulas[r].capacidad)
+            datos.append((clase, profesores.setdefault(clase.profesor, len(profesores)), validas))
+
+        # Más restringidas primero; las idénticas quedan contiguas
+        datos.sort(key=lambda d: (len(d[2]), -d[0].duracion, d[1], d[0].estudiantes))
+        opciones = {}
+        for duracion in {d[0].duracion for d in datos}:
+            bloque = (1 << duracion) - 1
+            opciones[duracion] = [(bloque << (dia * HORAS_DIA + hora), dia, HORA_APERTURA + hora)
+                                  for dia in range(len(DiaSemana))
+                                  for hora in range(HORAS_DIA - duracion + 1)]
+
+        self._clases = [d[0] for d in datos]
+        self._profesor = [d[1] for d in datos]
+        self._aulas_validas = [d[2] for d in datos]
+        self._banda = [len(d[2]) for d in datos]
+        self._opciones = [opciones[d[0].duracion] for d in datos]
+        self._identica_anterior = [
+            i > 0 and (self._profesor[i], c.duracion, c.estudiantes) ==
+            (self._profesor[i - 1], self._clases[i - 1].duracion, self._clases[i - 1].estudiantes)
+            for i, c in enumerate(self._clases)
+        ]
+        self._tipo_aula = tipo_aula
+        self._por_capacidad = por_capacidad
+        self._bandas = sorted(set(self._banda))
+        # Clases restantes desde cada posición, de menor a mayor duración
+        self._sufijos = [sorted((c.duracion, self._profesor[j], self._banda[j])
+                                for j, c in enumerate(self._clases[i:], i))
+                         for i in range(len(self._clases) + 1)]
+        self._num_profesores = len(profesores)
+
+    def _solucion_voraz(self, clases: List[Clase]):
+        """Solución del voraz adaptativo expresada como (indice, opcion, aula)"""
+        from algoritmo_voraz import PlanificadorVoraz
+        voraz = PlanificadorVoraz(self.aulas)
+        voraz.greedy_adaptativo(clases)
+
+        indice_clase = {id(c): i for i, c in enumerate(self._clases)}
+        indice_aula = {id(a): r for r, a in enumerate(self.aulas)}
+        dias = [dia.name for dia in DiaSemana]
+        solucion = []
+        for horario in voraz.horarios_asignados:
+            indice = indice_clase[id(horario.clase)]
+            franjas = HORAS_DIA - horario.clase.duracion + 1
+            numero = dias.index(horario.dia.name) * franjas + horario.hora_inicio - HORA_APERTURA
+            solucion.append((indice, numero, indice_aula[id(horario.aula)]))
+        return solucion
+
+    def _cota_restante(self, indice: int) -> int:
+        """Cota superior de cuántas de las clases restantes se pueden añadir"""
+        restantes = self._sufijos[indice]
+        if not restantes:
+            return 0
+
+        libres_profesor = [HORAS_SEMANA - h for h in self._horas_profesor]
+        cota_profesor = 0
+        for duracion, profesor, _ in restantes:
+            if duracion <= libres_profesor[profesor]:
+                libres_profesor[profesor] -= duracion
+                cota_profesor += 1
+
+        cota = cota_profesor
+        libres_banda = 0
+        k_anterior = 0
+        for k in self._bandas:
+            for r in self._por_capacidad[k_anterior:k]:
+                libres_banda += HORAS_SEMANA - self._horas_aula[r]
+            k_anterior = k
+            libres, caben, en_banda = libres_banda, 0, 0
+            for duracion, _, banda in restantes:
+                if banda <= k:
+                    en_banda += 1
+                    if duracion <= libres:
+                        libres -= duracion
+                        caben += 1
+            cota = min(cota, caben + len(restantes) - en_banda)
+        return cota
+
+    def _buscar(self, indice: int, asignadas: int, opcion_anterior: int):
+        estadisticas = self.estadisticas_exacto
+        estadisticas['nodos'] += 1
+        if estadisticas['nodos'] % INTERVALO_RELOJ == 0 and time.perf_counter() > self._fin:
+            raise _Detener
+
+        if asignadas > self._mejor:
+            self._mejor = asignadas
+            self._mejor_solucion = list(self._actual)
+            estadisticas['soluciones_mejoradas'] += 1
+            if asignadas >= estadisticas['cota_raiz']:
+                estadisticas['optimo'] = True
+                raise _Detener
+        if indice == len(self._clases):
+            return
+        if asignadas + self._cota_restante(indice) <= self._mejor:
+            estadisticas['podas'] += 1
+            return
+
+        clase = self._clases[indice]
+        profesor = self._profesor[indice]
+        identica = self._identica_anterior[indice]
+        # Una clase idéntica a la anterior va en una franja posterior; si la
+        # anterior quedó sin asignar, esta también
+        primera = opcion_anterior + 1 if identica else 0
+        if identica and opcion_anterior < 0:
+            primera = len(self._opciones[indice])
+
+        ocupacion_aula = self._ocupacion_aula
+        ocupacion_profesor = self._ocupacion_profesor
+        opciones = self._opciones[indice]
+        for numero in range(primera, len(opciones)):
+            mascara = opciones[numero][0]
+            if ocupacion_profesor[profesor] & mascara:
+                continue
+            vistas = set()
+            for r in self._aulas_validas[indice]:
+                if ocupacion_aula[r] & mascara:
+                    continue
+                firma = (self._tipo_aula[r], ocupacion_aula[r])
+                if firma in vistas:
+                    continue
+                vistas.add(firma)
+
+                ocupacion_aula[r] |= mascara
+                ocupacion_profesor[profesor] |= mascara
+                self._horas_aula[r] += clase.duracion
+                self._horas_profesor[profesor] += clase.duracion
+                self._actual.append((indice, numero, r))
+                self._buscar(indice + 1, asignadas + 1, numero)
+                self._actual.pop()
+                self._horas_profesor[profesor] -= clase.duracion
+                self._horas_aula[r] -= clase.duracion
+                ocupacion_profesor[profesor] ^= mascara
+                ocupacion_aula[r] ^= mascara
+
+        # Rama sin asignar esta clase
+        self._buscar(indice + 1, asignadas, -1)
+
+    def ramificacion_y_poda(self, clases: List[Clase]) -> List[HorarioAsignado]:
+        if len(clases) > TAMANO_MAXIMO:
+            raise ValueError(f"El solver exacto admite como máximo {TAMANO_MAXIMO} clases")
+        inicio = time.perf_counter()
+        self._fin = inicio + self.limite_tiempo
+        self.estadisticas_exacto = self._estadisticas_vacias()
+        self._preparar(clases)
+
+        self._ocupacion_aula = [0] * len(self.aulas)
+        self._ocupacion_profesor = [0] * self._num_profesores
+        self._horas_aula = [0] * len(self.aulas)
+        self._horas_profesor = [0] * self._num_profesores
+        self._actual = []
+        self._mejor_solucion = self._solucion_voraz(clases) if clases else []
+        self._mejor = len(self._mejor_solucion)
+        self.estadisticas_exacto['asignadas_voraz'] = self._mejor
+        self.estadisticas_exacto['cota_raiz'] = self._cota_restante(0)
+
+        limite_recursion = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limite_recursion, len(self._clases) + 100))
+        try:
+            # Si el voraz ya alcanza la cota de la raíz no hace falta buscar
+            if self._mejor < self.estadisticas_exacto['cota_raiz']:
+                self._buscar(0, 0, -1)
+            self.estadisticas_exacto['optimo'] = True
+        except _Detener:
+            pass
+        finally:
+            sys.setrecursionlimit(limite_recursion)
+
+        dias = list(DiaSemana)
+        horarios = []
+        for indice, numero, r in self._mejor_solucion:
+            clase = self._clases[indice]
+            _, dia, hora = self._opciones[indice][numero]
+            horarios.append(HorarioAsignado(clase=clase, dia=dias[dia], hora_inicio=hora,
+                                            hora_fin=hora + clase.duracion, aula=self.aulas[r]))
+        self.horarios_asignados.extend(horarios)
+        self.estadisticas_exacto['tiempo'] = time.perf_counter() - inicio
+        return horarios
+
+    def limpiar_horarios(self):
+        self.horarios_asignados = []
+        self.estadisticas_exacto = self._estadisticas_vacias()
+
+    def estadisticas(self) -> Dict:
+        utilizacion_aulas = {aula.id: sum(h.hora_fin - h.hora_inicio for h in self.horarios_asignados
+                                          if h.aula.id == aula.id)
+                             for aula in self.aulas}
+        return {
+            "clases_asignadas": len(self.horarios_asignados),
+            "total_horas": sum(h.hora_fin - h.hora_inicio for h in self.horarios_asignados),
+            "utilizacion_aulas": utilizacion_aulas,
+            "estadisticas_exacto": self.estadisticas_exacto,
+            "perfil_fases": {}
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solver exacto de referencia frente al voraz")
+    parser.add_argument('--tamano', type=int, default=60)
+    parser.add_argument('--aulas', type=int, default=8)
+    parser.add_argument('--limite', type=float, default=10.0, help="Límite de tiempo (s)")
+    parser.add_argument('--perfil', default=None, help="Perfil de carga de perfiles_carga.py")
+    parser.add_argument('--semilla', type=int, default=42)
+    args = parser.parse_args()
+
+    if args.perfil is None:
+        import random
+        random.seed(args.semilla)
+        clases, aulas = generar_datos_prueba_exacto(args.tamano, args.aulas)
+    else:
+        from perfiles_carga import generar_perfil
+        clases, aulas = generar_perfil(args.perfil, args.tamano, args.aulas, args.semilla)
+
+    from algoritmo_voraz import PlanificadorVoraz
+    voraz = PlanificadorVoraz(aulas)
+    voraz.greedy_adaptativo(clases)
+    exacto = PlanificadorExacto(aulas, limite_tiempo=args.limite)
+    exacto.ramificacion_y_poda(clases)
+
+    stats = exacto.estadisticas()['estadisticas_exacto']
+    asignadas_voraz = len(voraz.horarios_asignados)
+    asignadas_exacto = len(exacto.horarios_asignados)
+    estado = 'óptimo demostrado' if stats['optimo'] else f"límite alcanzado (cota {stats['cota_raiz']})"
+    print(f"Exacto: {asignadas_exacto}/{args.tamano} en {stats['tiempo']:.2f}s, "
+          f"{stats['nodos']} nodos, {stats['podas']} podas, {estado}")
+    print(f"Voraz:  {asignadas_voraz}/{args.tamano} "
+          f"({asignadas_exacto - asignadas_voraz} clases menos que el exacto)")
+
+
+if __name__ == "__main__":
+    main()
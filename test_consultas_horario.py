@@ -0,0 +1,76 @@
+"""
+Regresión: las ediciones de `horario()` y las reparaciones comparten índices y
+diario con el planificador.
+
+    python -m pytest test_consultas_horario.py
+"""
+
+import random
+
+import algoritmo_voraz
+from reparacion import Disrupcion
+from validador import validar_horario
+
+
+def _planificador(tamano=400, num_aulas=12, semilla=7):
+    random.seed(semilla)
+    clases, aulas = algoritmo_voraz.generar_datos_prueba_greedy(tamano, num_aulas, num_profesores=tamano // 8)
+    planificador = algoritmo_voraz.PlanificadorVoraz(aulas)
+    planificador.replanificar(clases, [])
+    return planificador, clases, aulas
+
+
+def _mover_varias(planificador, cantidad):
+    """Mueve hasta `cantidad` clases a su primera franja libre; devuelve las movidas"""
+    vista = planificador.horario()
+    movidas = []
+    for h in list(planificador.horarios_asignados):
+        destino = vista.primera_franja_libre(h.clase)
+        if destino is not None and vista.mover(h.clase.id, *destino):
+            movidas.append(h.clase.id)
+            if len(movidas) == cantidad:
+                break
+    return movidas
+
+
+def _pisa(h, disrupcion):
+    recurso = h.aula.id if disrupcion.tipo == 'aula' else h.clase.profesor
+    return (recurso == disrupcion.recurso and h.dia.name == disrupcion.dia
+            and h.hora_inicio < disrupcion.hora_fin and disrupcion.hora_inicio < h.hora_fin)
+
+
+def test_reparar_tras_mover_en_la_vista():
+    planificador, clases, aulas = _planificador()
+    primera = Disrupcion('aula', aulas[0].id, 'LUNES')
+    planificador.reparar(primera)
+    assert _mover_varias(planificador, 166)
+
+    segunda = Disrupcion('aula', aulas[1].id, 'MARTES')
+    planificador.reparar(segunda)
+
+    horarios = planificador.horarios_asignados
+    assert validar_horario(horarios, clases, aulas).valido
+    assert not any(_pisa(h, d) for h in horarios for d in (primera, segunda))
+    vista = planificador.horario()
+    assert len(vista) == len(horarios)
+    assert all(vista.de_clase(h.clase.id) is h for h in horarios)
+
+
+def test_revertir_deshace_movimientos_de_la_vista():
+    planificador, _, _ = _planificador()
+    posiciones = [(h.clase.id, h.dia.name, h.hora_inicio, h.aula.id) for h in planificador.horarios_asignados]
+
+    instantanea = planificador.instantanea()
+    assert len(_mover_varias(planificador, 50)) == 50
+    planificador.revertir(instantanea)
+
+    assert posiciones == [(h.clase.id, h.dia.name, h.hora_inicio, h.aula.id)
+                          for h in planificador.horarios_asignados]
+    vista = planificador.horario()
+    assert all(vista.de_clase(id_clase).hora_inicio == hora for id_clase, _, hora, _ in posiciones)
+
+
+if __name__ == "__main__":
+    test_reparar_tras_mover_en_la_vista()
+    test_revertir_deshace_movimientos_de_la_vista()
+    print("✅ consultas_horario")
@@ -0,0 +1,121 @@
+"""
+Benchmark de tiempo de importación de los módulos planificadores.
+
+Ejecuta `python -X importtime -c "import <módulo>"` en un proceso limpio,
+reporta el tiempo acumulado de importación y verifica que el núcleo de
+planificación solo cargue la biblioteca estándar y módulos del propio
+repositorio. Los módulos que el intérprete ya carga al arrancar (`-c pass`,
+p. ej. ganchos .pth del entorno) no cuentan.
+Devuelve código de salida 1 si alguna verificación falla, para usarlo en CI.
+
+Uso:
+    python tiempo_importacion.py
+    python tiempo_importacion.py --limite-ms 50 --repeticiones 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+MODULOS_PLANIFICADORES = ['algoritmo_voraz', 'divide_venceras', 'solver_exacto']
+DEPENDENCIAS_PESADAS = ['matplotlib', 'numpy', 'psutil']
+
+
+def modulos_de_terceros(importados, directorio=None, arranque=()):
+    """
+    Módulos de primer nivel que no son de la biblioteca estándar, del
+    repositorio ni del arranque. -X importtime también registra importaciones
+    que fallan (p. ej. `org.python.core`, que la biblioteca estándar prueba
+    para Jython); se descartan los nombres que no se pueden encontrar.
+    """
+    import importlib.util
+
+    directorio = directorio or os.path.dirname(os.path.abspath(__file__))
+    locales = {nombre[:-3] for nombre in os.listdir(directorio) if nombre.endswith('.py')}
+    return sorted(nombre for nombre in set(importados) - set(arranque)
+                  if nombre not in sys.stdlib_module_names and nombre not in locales
+                  and importlib.util.find_spec(nombre) is not None)
+
+
+def medir_importacion(modulo, directorio=None):
+    """
+    Importa `modulo` en un intérprete nuevo con -X importtime.
+
+    Devuelve (tiempo acumulado del módulo en µs, conjunto de módulos de primer
+    nivel importados).
+    """
+    directorio = directorio or os.path.dirname(os.path.abspath(__file__))
+    salida = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {modulo}' if modulo else 'pass'],
+        cwd=directorio, capture_output=True, text=True, check=True
+    ).stderr
+
+    acumulado = None
+    importados = set()
+    for linea in salida.splitlines():
+        # Formato: "import time: self [us] | cumulative | imported package"
+        if not linea.startswith('import time:') or '|' not in linea:
+            continue
+        _, cumulativo, nombre = linea[len('import time:'):].split('|')
+        nombre = nombre.strip()
+        if not cumulativo.strip().isdigit():
+            continue  # cabecera
+        importados.add(nombre.split('.')[0])
+        if nombre == modulo:
+            acumulado = int(cumulativo)
+
+    return acumulado, importados
+
+
+def benchmark_importacion(modulos=None, repeticiones=3, limite_ms=None):
+    """Mide cada módulo varias veces y verifica las dependencias cargadas"""
+
+    modulos = modulos or MODULOS_PLANIFICADORES
+    correcto = True
+    _, arranque = medir_importacion(None)
+
+    print("="*70)
+    print("BENCHMARK DE TIEMPO DE IMPORTACIÓN")
+    print("="*70)
+
+    for modulo in modulos:
+        tiempos = []
+        importados = set()
+        for _ in range(repeticiones):
+            acumulado, importados = medir_importacion(modulo)
+            tiempos.append(acumulado / 1000)
+
+        mediana = statistics.median(tiempos)
+        terceros = modulos_de_terceros(importados, arranque=arranque)
+        pesadas = [nombre for nombre in terceros if nombre in DEPENDENCIAS_PESADAS]
+
+        print(f"  {modulo}: mediana {mediana:.2f} ms (mín {min(tiempos):.2f}, máx {max(tiempos):.2f})")
+        if terceros:
+            correcto = False
+            print(f"     ❌ Importa módulos de terceros: {', '.join(terceros)}"
+                  + (f" (pesadas: {', '.join(pesadas)})" if pesadas else ""))
+        else:
+            print(f"     ✅ Solo biblioteca estándar y módulos del repositorio")
+        if limite_ms is not None and mediana > limite_ms:
+            correcto = False
+            print(f"     ❌ Supera el límite de {limite_ms} ms")
+
+    return correcto
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de tiempo de importación")
+    parser.add_argument('--modulos', nargs='+', default=MODULOS_PLANIFICADORES)
+    parser.add_argument('--repeticiones', type=int, default=3)
+    parser.add_argument('--limite-ms', type=float, default=None,
+                        help="Tiempo máximo de importación permitido (mediana)")
+    args = parser.parse_args()
+
+    if not benchmark_importacion(args.modulos, args.repeticiones, args.limite_ms):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Instantáneas y reversión baratas para explorar alternativas ("¿y si...?").
+
+Dos piezas:
+
+- `Diario`: registro de deshacer. Cada modificación en su sitio anota cómo
+  deshacerse; revertir a una marca ejecuta las anotaciones posteriores en
+  orden inverso, con coste proporcional a los cambios.
+- `PlanificadorTransaccional`: mixin para los planificadores. Sus métodos solo
+  añaden al final de `horarios_asignados` o lo sustituyen por una lista nueva,
+  así que una instantánea guarda la lista actual y su longitud, copia los
+  diccionarios de estadísticas (tamaño constante) y una marca del diario para
+  las modificaciones en su sitio (p. ej. `reparar`). Revertir recorta la lista
+  y deshace el diario.
+
+Uso:
+    with planificador.probar():
+        planificador.reparar(disrupcion)
+        print(len(planificador.horarios_asignados))
+    # aquí el planificador vuelve a estar como antes
+
+    python transacciones.py --tamano 5000 --aulas 150
+"""
+
+import copy
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+
+class Diario:
+    """Pila de (función, argumentos) que deshacen cada cambio anotado"""
+
+    def __init__(self):
+        self._deshacer: List[Tuple] = []
+
+    def __len__(self) -> int:
+        return len(self._deshacer)
+
+    def anotar(self, funcion, *argumentos):
+        self._deshacer.append((funcion, argumentos))
+
+    def marca(self) -> int:
+        return len(self._deshacer)
+
+    def revertir(self, marca: int):
+        if marca > len(self._deshacer):
+            raise ValueError(f"Marca {marca} posterior al diario ({len(self._deshacer)} entradas)")
+        while len(self._deshacer) > marca:
+            funcion, argumentos = self._deshacer.pop()
+            funcion(*argumentos)
+
+
+class Transaccional:
+    """
+    Contextos sobre `instantanea()` y `revertir(instantanea)`, que define
+    cada clase.
+    """
+
+    @contextmanager
+    def transaccion(self):
+        """Confirma los cambios si el bloque termina bien; los revierte si lanza una excepción"""
+        instantanea = self.instantanea()
+        try:
+            yield instantanea
+        except BaseException:
+            self.revertir(instantanea)
+            raise
+
+    @contextmanager
+    def probar(self):
+        """Revierte siempre al salir: para evaluar un cambio y descartarlo"""
+        instantanea = self.instantanea()
+        try:
+            yield instantanea
+        finally:
+            self.revertir(instantanea)
+
+
+@dataclass(frozen=True)
+class InstantaneaPlanificador:
+    horarios: List
+    longitud: int
+    estado: Dict[str, object]
+    marca: int
+
+
+class PlanificadorTransaccional(Transaccional):
+    """
+    Instantáneas de un planificador. `ATRIBUTOS_INSTANTANEA` enumera los
+    atributos que se restauran: los diccionarios se copian (son de tamaño
+    constante) y el resto se guarda por referencia. También reúne `reparar` y
+    `horario`, que solo necesitan los tipos del módulo del planificador y
+    anotan sus cambios en el diario.
+    """
+
+    ATRIBUTOS_INSTANTANEA: Tuple[str, ...] = ()
+
+    @property
+    def diario(self) -> Diario:
+        # Se crea con la primera instantánea: sin instantáneas no se anota nada
+        if getattr(self, '_diario', None) is None:
+            self._diario = Diario()
+        return self._diario
+
+    def diario_activo(self):
+        """Diario en el que anotar cambios en su sitio, o None si no hay instantáneas"""
+        return getattr(self, '_diario', None)
+
+    def instantanea(self) -> InstantaneaPlanificador:
+        estado = {}
+        for nombre in self.ATRIBUTOS_INSTANTANEA:
+            valor = getattr(self, nombre)
+            estado[nombre] = copy.deepcopy(valor) if isinstance(valor, dict) else valor
+        return InstantaneaPlanificador(self.horarios_asignados, len(self.horarios_asignados),
+                                       estado, self.diario.marca())
+
+    def revertir(self, instantanea: InstantaneaPlanificador):
+        self.diario.revertir(instantanea.marca)
+        del instantanea.horarios[instantanea.longitud:]
+        self.horarios_asignados = instantanea.horarios
+        for nombre, valor in instantanea.estado.items():
+            setattr(self, nombre, copy.deepcopy(valor) if isinstance(valor, dict) else valor)
+        # Si los índices de reparación (y la vista de `horario()`) se crearon
+        # después de la instantánea, no se pueden deshacer: se reconstruyen
+        self._reparable = None
+
+    def reparar(self, disrupcion, limite_expulsiones: int = 200) -> List:
+        """
+        Repara el horario actual tras una disrupción (`reparacion.Disrupcion`:
+        aula o profesor no disponible en un día y rango de horas). Solo se
+        desalojan y reubican las clases afectadas, moviendo como mucho una
+        clase más por cada una. La franja queda bloqueada para las siguientes
+        reparaciones y replanificaciones. Devuelve el horario completo.
+        """
+        from reparacion import reparar_disrupcion
+
+        resultado = reparar_disrupcion(self, disrupcion, limite_expulsiones=limite_expulsiones)
+        self.resultados_reparacion = {
+            'desalojadas': resultado.desalojadas,
+            'reubicadas': resultado.reubicadas,
+            'movidas': len(resultado.movidas),
+            'sin_reubicar': len(resultado.sin_reubicar),
+            'tiempo': resultado.tiempo,
+        }
+        return self.horarios_asignados
+
+    def horario(self):
+        """
+        Vista indexada del horario actual (`consultas_horario.HorarioIndexado`)
+        con consultas por aula, profesor, día y franjas libres. Es el mismo
+        objeto que usa `reparar`: se extiende mientras el planificador solo
+        añada asignaciones y sus ediciones se anotan en el diario.
+        """
+        from consultas_horario import horario_de
+        return horario_de(self)
+
+    def descartar_instantaneas(self):
+        """Libera el diario; las instantáneas tomadas hasta ahora dejan de ser válidas"""
+        self._diario = None
+
+
+def main():
+    # argparse y time solo en la CLI: este módulo lo importan los planificadores
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Coste de instantáneas y reversión frente a copiar el planificador")
+    parser.add_argument('--tamano', type=int, default=5000)
+    parser.add_argument('--aulas', type=int, default=150)
+    parser.add_argument('--profesores', type=int, default=400)
+    parser.add_argument('--semilla', type=int, default=42)
+    args = parser.parse_args()
+
+    import random
+    import algoritmo_voraz
+    from reparacion import Disrupcion
+
+    random.seed(args.semilla)
+    clases, aulas = algoritmo_voraz.generar_datos_prueba_greedy(args.tamano, args.aulas,
+                                                                num_profesores=args.profesores)
+    planificador = algoritmo_voraz.PlanificadorVoraz(aulas)
+    planificador.replanificar(clases, [])
+    huella = [(h.clase.id, h.dia.name, h.hora_inicio, h.aula.id) for h in planificador.horarios_asignados]
+    print(f"Horario: {len(huella)}/{args.tamano} clases")
+
+    inicio = time.perf_counter()
+    copy.deepcopy(planificador)
+    print(f"   Copia profunda del planificador: {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+    inicio = time.perf_counter()
+    instantanea = planificador.instantanea()
+    print(f"   Instantánea: {(time.perf_counter() - inicio) * 1000:.3f} ms")
+
+    for aula in aulas[:3]:
+        planificador.reparar(Disrupcion('aula', aula.id, 'LUNES'))
+    print(f"   Tras cerrar 3 aulas el lunes: {len(planificador.horarios_asignados)} clases, "
+          f"{len(planificador.diario)} cambios anotados")
+
+    inicio = time.perf_counter()
+    planificador.revertir(instantanea)
+    print(f"   Reversión: {(time.perf_counter() - inicio) * 1000:.3f} ms")
+
+    restaurado = [(h.clase.id, h.dia.name, h.hora_inicio, h.aula.id) for h in planificador.horarios_asignados]
+    print(f"   Horario restaurado: {'✅ idéntico' if restaurado == huella else '❌ distinto'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Validador vectorizado de horarios.
+
+Comprueba sobre las columnas de asignaciones (formato de `formato_columnar`)
+que un horario:
+- no tiene dos clases en la misma aula a la vez,
+- no tiene a un profesor en dos clases a la vez,
+- respeta la capacidad del aula,
+- queda dentro de la ventana diaria (8:00-18:00) con la duración de la clase,
+- no asigna la misma clase dos veces.
+
+Los solapamientos se detectan con ordenamiento y barrido por grupo (aula/día o
+profesor/día): tras ordenar por (grupo, inicio), una asignación se solapa con
+alguna anterior del grupo si su inicio es menor que el máximo fin acumulado de
+las anteriores. El máximo acumulado por grupo se obtiene con un solo
+`np.maximum.accumulate` sobre la clave codificada grupo·K + fin, así que todo
+el validador es O(n log n) y no materializa objetos.
+"""
+
+import argparse
+import time
+from dataclasses import dataclass, field
+from typing import Dict
+
+import numpy as np
+
+from indice_ocupacion import HORA_APERTURA, HORA_CIERRE
+
+TIPOS_VIOLACION = ('conflicto_aula', 'conflicto_profesor', 'capacidad', 'fuera_de_horario',
+                   'duracion_incorrecta', 'clase_duplicada')
+
+
+@dataclass
+class ResultadoValidacion:
+    """
+    Violaciones por tipo. Los solapamientos son arrays (k, 2) de pares de filas
+    de asignación (posterior, anterior con la que choca); el resto son arrays de
+    filas de asignación.
+    """
+    asignaciones: int
+    violaciones: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(len(v) for v in self.violaciones.values())
+
+    @property
+    def valido(self) -> bool:
+        return self.total == 0
+
+    def resumen(self) -> Dict[str, int]:
+        return {tipo: len(self.violaciones.get(tipo, ())) for tipo in TIPOS_VIOLACION}
+
+    def describir(self) -> str:
+        if self.valido:
+            return f"✅ {self.asignaciones} asignaciones sin violaciones"
+        detalle = ", ".join(f"{tipo}: {cuenta}" for tipo, cuenta in self.resumen().items() if cuenta)
+        return f"❌ {self.total} violaciones en {self.asignaciones} asignaciones ({detalle})"
+
+
+def _solapamientos(grupo, inicio, fin):
+    """
+    Pares (fila, fila_anterior) de asignaciones que se solapan dentro de su grupo.
+
+    Cada asignación que choca con alguna anterior del grupo (en orden de
+    inicio) aparece una vez, emparejada con la anterior de mayor fin.
+    """
+    n = len(grupo)
+    if n < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    grupo = grupo.astype(np.int64)
+    inicio = inicio.astype(np.int64)
+    fin = fin.astype(np.int64)
+
+    orden = np.lexsort((inicio, grupo))
+    g, i, f = grupo[orden], inicio[orden], fin[orden]
+
+    # Clave (grupo, fin, posición): su máximo acumulado da, para cada fila, el
+    # mayor fin del grupo visto hasta ella y la posición que lo alcanzó
+    f_codificado = np.clip(f, 0, None)
+    base_fin = int(f_codificado.max()) + 1
+    clave = (g * base_fin + f_codificado) * n + np.arange(n, dtype=np.int64)
+    maximo = np.maximum.accumulate(clave)
+    anterior = np.empty(n, dtype=np.int64)
+    anterior[0] = -1
+    anterior[1:] = maximo[:-1]
+
+    mismo_grupo = anterior // n // base_fin == g
+    mismo_grupo[0] = False
+    fin_anterior = anterior // n % base_fin
+    choca = mismo_grupo & (i < fin_anterior)
+
+    filas = np.nonzero(choca)[0]
+    return np.column_stack([orden[filas], orden[anterior[filas] % n]])
+
+
+def validar_tablas(tablas) -> ResultadoValidacion:
+    """
+    Valida tablas columnares {'clases', 'aulas', 'asignaciones'} (dicts de
+    arrays o un `HorarioColumnar`).
+    """
+    if not isinstance(tablas, dict):
+        tablas = {'clases': tablas.clases, 'aulas': tablas.aulas, 'asignaciones': tablas.asignaciones}
+    clases, aulas, asignaciones = tablas['clases'], tablas['aulas'], tablas['asignaciones']
+
+    fila_clase = np.asarray(asignaciones['clase'], dtype=np.int64)
+    fila_aula = np.asarray(asignaciones['aula'], dtype=np.int64)
+    dia = np.asarray(asignaciones['dia'], dtype=np.int64)
+    inicio = np.asarray(asignaciones['hora_inicio'], dtype=np.int64)
+    fin = np.asarray(asignaciones['hora_fin'], dtype=np.int64)
+    n = len(fila_clase)
+
+    resultado = ResultadoValidacion(asignaciones=n)
+    if n == 0:
+        return resultado
+
+    profesor = np.asarray(clases['profesor'], dtype=np.int64)[fila_clase]
+    estudiantes = np.asarray(clases['estudiantes'], dtype=np.int64)[fila_clase]
+    duracion = np.asarray(clases['duracion'], dtype=np.int64)[fila_clase]
+    capacidad = np.asarray(aulas['capacidad'], dtype=np.int64)[fila_aula]
+
+    resultado.violaciones['conflicto_aula'] = _solapamientos(fila_aula * 5 + dia, inicio, fin)
+    resultado.violaciones['conflicto_profesor'] = _solapamientos(profesor * 5 + dia, inicio, fin)
+    resultado.violaciones['capacidad'] = np.nonzero(estudiantes > capacidad)[0]
+    resultado.violaciones['fuera_de_horario'] = np.nonzero(
+        (inicio < HORA_APERTURA) | (fin > HORA_CIERRE) | (dia < 0) | (dia > 4))[0]
+    resultado.violaciones['duracion_incorrecta'] = np.nonzero(fin - inicio != duracion)[0]
+
+    orden = np.argsort(fila_clase, kind='stable')
+    repetida = np.zeros(n, dtype=bool)
+    repetida[1:] = fila_clase[orden][1:] == fila_clase[orden][:-1]
+    resultado.violaciones['clase_duplicada'] = np.sort(orden[repetida])
+    return resultado
+
+
+def validar_horario(horarios, clases=None, aulas=None) -> ResultadoValidacion:
+    """Valida la lista de `HorarioAsignado` de cualquiera de los planificadores"""
+    from formato_columnar import tablas_desde_horario
+    tablas, _, _ = tablas_desde_horario(horarios, clases, aulas)
+    return validar_tablas(tablas)
+
+
+def validar_archivo(ruta) -> ResultadoValidacion:
+    """Valida un horario guardado en formato columnar sin materializar objetos"""
+    from formato_columnar import cargar_horario
+    return validar_tablas(cargar_horario(ruta))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Valida un horario en formato columnar")
+    parser.add_argument('ruta', help="Archivo .hcol")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    resultado = validar_archivo(args.ruta)
+    print(f"{resultado.describir()} en {time.perf_counter() - inicio:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,670 @@
+"""
+Etapa de renderizado de gráficas, separada de la ejecución de las pruebas.
+
+Las pruebas de sobrecarga guardan sus resultados en archivos JSON y esta etapa
+los renderiza después, importando matplotlib de forma perezosa con un backend
+no interactivo. Así, importar un planificador o medir un benchmark no paga el
+costo de matplotlib ni se bloquea en `plt.show()`.
+
+Uso desde la línea de comandos:
+    python visualizaciones.py greedy resultados_greedy.json
+"""
+
+import argparse
+import json
+import math
+import multiprocessing as mp
+import os
+import statistics
+
+ARCHIVOS_RESULTADOS = {
+    'greedy': 'resultados_greedy.json',
+    'dv': 'resultados_dv.json',
+    'comparacion': 'resultados_comparacion.json',
+    'barrido': 'resultados_barrido.json',
+    'utilizacion': 'resultados_utilizacion.json',
+}
+
+
+def _pyplot(interactivo=False):
+    """Importa matplotlib.pyplot bajo demanda; sin `interactivo` usa el backend Agg"""
+    import matplotlib
+    if not interactivo:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _finalizar_figura(plt, mostrar):
+    if mostrar:
+        plt.show()
+    plt.close('all')
+
+
+def guardar_resultados(resultados, ruta):
+    """Guarda el diccionario de resultados de una prueba en JSON"""
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump(resultados, archivo, ensure_ascii=False, indent=2)
+    return ruta
+
+
+def cargar_resultados(ruta):
+    with open(ruta, encoding='utf-8') as archivo:
+        return json.load(archivo)
+
+
+def _resolver_resultados(resultados):
+    return cargar_resultados(resultados) if isinstance(resultados, str) else resultados
+
+
+def _renderizar_perfil_fases(plt, resultados, archivo, titulo, directorio, dpi, mostrar):
+    """Tiempo medido por fase (barras apiladas) y comparaciones por sondeo de conflicto"""
+    perfiles = resultados.get('perfil_fases')
+    if not perfiles or not any(perfiles):
+        return
+    
+    tamanos = resultados['tamanos']
+    fases = list(perfiles[0].keys())
+    posiciones = list(range(len(tamanos)))
+    
+    fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+    fig.suptitle(titulo, fontsize=14, fontweight='bold')
+    
+    base = [0.0] * len(tamanos)
+    for fase in fases:
+        tiempos = [perfil[fase]['tiempo'] for perfil in perfiles]
+        axes[0].bar(posiciones, tiempos, bottom=base, label=fase)
+        base = [b + t for b, t in zip(base, tiempos)]
+    axes[0].set_xticks(posiciones)
+    axes[0].set_xticklabels([str(t) for t in tamanos])
+    axes[0].set_xlabel('Número de Clases')
+    axes[0].set_ylabel('Tiempo por Fase (segundos)')
+    axes[0].set_title('Distribución del Tiempo por Fase')
+    axes[0].legend()
+    axes[0].grid(True, alpha=0.3, axis='y')
+    
+    comparaciones_por_sondeo = []
+    for perfil in perfiles:
+        verificacion = perfil.get('verificacion_conflictos', {})
+        llamadas = verificacion.get('llamadas', 0)
+        comparaciones_por_sondeo.append(verificacion.get('comparaciones', 0) / llamadas if llamadas else 0)
+    axes[1].plot(tamanos, comparaciones_por_sondeo, 'r-o', linewidth=2, markersize=6)
+    axes[1].set_xlabel('Número de Clases')
+    axes[1].set_ylabel('Comparaciones por Sondeo')
+    axes[1].set_title('Costo de _verificar_conflicto')
+    axes[1].grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    plt.savefig(os.path.join(directorio, archivo), dpi=dpi, bbox_inches='tight')
+    _finalizar_figura(plt, mostrar)
+
+
+def renderizar_greedy(resultados, directorio='.', dpi=300, mostrar=False):
+    """Renderiza las gráficas del Algoritmo Voraz desde un dict o un archivo de resultados"""
+    resultados = _resolver_resultados(resultados)
+    if not resultados['tamanos']:
+        print("No hay datos para visualizar")
+        return
+    
+    plt = _pyplot(mostrar)
+    
+    fig, axes = plt.subplots(3, 3, figsize=(20, 15))
+    fig.suptitle('Análisis de Sobrecarga - Algoritmo Voraz (Greedy)', fontsize=16, fontweight='bold')
+    
+    axes[0, 0].plot(resultados['tamanos'], resultados['tiempos_greedy_adaptativo'], 'g-^', label='Greedy Adaptativo', linewidth=2, markersize=6)
+    axes[0, 0].set_xlabel('Número de Clases')
+    axes[0, 0].set_ylabel('Tiempo de Ejecución (segundos)')
+    axes[0, 0].set_title('Escalabilidad Temporal')
+    axes[0, 0].legend()
+    axes[0, 0].grid(True, alpha=0.3)
+    
+    axes[0, 1].plot(resultados['tamanos'], resultados['memoria_greedy_adaptativo'], 'g-^', label='Greedy Adaptativo', linewidth=2, markersize=6)
+    axes[0, 1].set_xlabel('Número de Clases')
+    axes[0, 1].set_ylabel('Uso de Memoria (MB)')
+    axes[0, 1].set_title('Consumo de Memoria')
+    axes[0, 1].legend()
+    axes[0, 1].grid(True, alpha=0.3)
+    
+    axes[0, 2].plot(resultados['tamanos'], resultados['clases_asignadas_greedy_adaptativo'], 'g-^', label='Greedy Adaptativo', linewidth=2, markersize=6)
+    axes[0, 2].plot(resultados['tamanos'], resultados['tamanos'], 'k--', alpha=0.5, label='Máximo teórico')
+    if resultados.get('cota_superior'):
+        axes[0, 2].plot(resultados['tamanos'], resultados['cota_superior'], 'm:', linewidth=2, label='Cota superior')
+    axes[0, 2].set_xlabel('Número de Clases')
+    axes[0, 2].set_ylabel('Clases Asignadas')
+    axes[0, 2].set_title('Eficiencia en Asignación')
+    axes[0, 2].legend()
+    axes[0, 2].grid(True, alpha=0.3)
+    
+    axes[1, 0].plot(resultados['tamanos'], resultados['eficiencia_greedy_adaptativo'], 'g-^', label='Greedy Adaptativo', linewidth=2, markersize=6)
+    axes[1, 0].set_xlabel('Número de Clases')
+    axes[1, 0].set_ylabel('Eficiencia (clases/segundo)')
+    axes[1, 0].set_title('Ratio de Eficiencia')
+    axes[1, 0].legend()
+    axes[1, 0].grid(True, alpha=0.3)
+    
+    axes[1, 1].plot(resultados['tamanos'], resultados['iteraciones'], 'm-d', linewidth=2, markersize=6)
+    axes[1, 1].set_xlabel('Número de Clases')
+    axes[1, 1].set_ylabel('Iteraciones')
+    axes[1, 1].set_title('Comportamiento Iterativo')
+    axes[1, 1].grid(True, alpha=0.3)
+    
+    axes[1, 2].plot(resultados['tamanos'], resultados['asignaciones_exitosas'], 'g-o', label='Exitosas', linewidth=2, markersize=6)
+    axes[1, 2].plot(resultados['tamanos'], resultados['asignaciones_fallidas'], 'r-s', label='Fallidas', linewidth=2, markersize=6)
+    axes[1, 2].set_xlabel('Número de Clases')
+    axes[1, 2].set_ylabel('Número de Asignaciones')
+    axes[1, 2].set_title('Éxito vs Fallo en Asignaciones')
+    axes[1, 2].legend()
+    axes[1, 2].grid(True, alpha=0.3)
+    
+    axes[2, 0].plot(resultados['tamanos'], resultados['mejoras_locales'], 'c-p', linewidth=2, markersize=6)
+    axes[2, 0].set_xlabel('Número de Clases')
+    axes[2, 0].set_ylabel('Mejoras Locales')
+    axes[2, 0].set_title('Optimización Local')
+    axes[2, 0].grid(True, alpha=0.3)
+    
+    axes[2, 1].loglog(resultados['tamanos'], resultados['tiempos_greedy_adaptativo'], 'g-^', label='Greedy Adaptativo')
+    axes[2, 1].set_xlabel('Número de Clases (log)')
+    axes[2, 1].set_ylabel('Tiempo (log)')
+    axes[2, 1].set_title('Análisis Logarítmico - Tiempo')
+    axes[2, 1].legend()
+    axes[2, 1].grid(True, alpha=0.3)
+    
+    # 9. Tendencia de eficiencia
+    axes[2, 2].plot(resultados['tamanos'], resultados['eficiencia_greedy_adaptativo'], 'g-^', label='Tendencia de Eficiencia')
+    axes[2, 2].set_xlabel('Número de Clases')
+    axes[2, 2].set_ylabel('Eficiencia (clases/segundo)')
+    axes[2, 2].set_title('Tendencia de Eficiencia')
+    axes[2, 2].legend()
+    axes[2, 2].grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    plt.savefig(os.path.join(directorio, 'sobrecarga_algoritmo_voraz.png'), dpi=dpi, bbox_inches='tight')
+    _finalizar_figura(plt, mostrar)
+    
+    # Gráfica adicional: Análisis detallado de comportamiento
+    plt.figure(figsize=(15, 10))
+    
+    plt.subplot(2, 2, 1)
+    plt.semilogx(resultados['tamanos'], resultados['eficiencia_greedy_adaptativo'], 'g-^', label='Greedy Adaptativo')
+    plt.xlabel('Número de Clases (log)')
+    plt.ylabel('Eficiencia (clases/segundo)')
+    plt.title('Eficiencia vs Tamaño (Log)')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    
+    plt.subplot(2, 2, 2)
+    plt.semilogx(resultados['tamanos'], resultados['iteraciones'], 'm-d', linewidth=2, markersize=6)
+    plt.xlabel('Número de Clases (log)')
+    plt.ylabel('Iteraciones')
+    plt.title('Iteraciones vs Tamaño')
+    plt.grid(True, alpha=0.3)
+    
+    plt.subplot(2, 2, 3)
+    if resultados['asignaciones_exitosas'] and resultados['asignaciones_fallidas']:
+        ratio_exito = [e/(e+f) if (e+f) > 0 else 0 for e, f in zip(resultados['asignaciones_exitosas'], resultados['asignaciones_fallidas'])]
+        plt.semilogx(resultados['tamanos'], ratio_exito, 'c-p', linewidth=2, markersize=6)
+        plt.xlabel('Número de Clases (log)')
+        plt.ylabel('Ratio de Éxito')
+        plt.title('Ratio de Éxito en Asignaciones')
+        plt.grid(True, alpha=0.3)
+    
+    plt.subplot(2, 2, 4)
+    plt.semilogx(resultados['tamanos'], resultados['memoria_greedy_adaptativo'], 'g-^', label='Greedy Adaptativo')
+    plt.xlabel('Número de Clases (log)')
+    plt.ylabel('Memoria (MB)')
+    plt.title('Memoria vs Tamaño')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    plt.savefig(os.path.join(directorio, 'analisis_detallado_greedy.png'), dpi=dpi, bbox_inches='tight')
+    _finalizar_figura(plt, mostrar)
+    
+    _renderizar_perfil_fases(plt, resultados, 'perfil_fases_greedy.png',
+                             'Perfil por Fase - Algoritmo Voraz', directorio, dpi, mostrar)
+
+
+def _trazar_ajuste(destino, tamanos, valores, estilo):
+    """Dibuja la curva ajustada y ≈ a·n^b sobre `destino` (pyplot o ejes) y devuelve el ajuste"""
+    from analisis_complejidad import ajustar_potencia
+    ajuste = ajustar_potencia(tamanos, valores)
+    if ajuste is not None:
+        destino.loglog(tamanos, ajuste.predecir(tamanos), estilo, alpha=0.7,
+                       label=f'Ajuste n^{ajuste.exponente:.2f}')
+    return ajuste
+
+
+def renderizar_dv(resultados, directorio='.', dpi=300, mostrar=False):
+    """Renderiza las gráficas de Divide y Vencerás desde un dict o un archivo de resultados"""
+    resultados = _resolver_resultados(resultados)
+    if not resultados['tamanos']:
+        print("No hay datos para visualizar")
+        return
+    
+    plt = _pyplot(mostrar)
+    
+    fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+    fig.suptitle('Análisis de Sobrecarga - Algoritmo Divide y Vencerás', fontsize=16, fontweight='bold')
+    
+    axes[0, 0].plot(resultados['tamanos'], resultados['tiempos'], 'b-o', linewidth=2, markersize=6)
+    axes[0, 0].set_xlabel('Número de Clases')
+    axes[0, 0].set_ylabel('Tiempo de Ejecución (segundos)')
+    axes[0, 0].set_title('Escalabilidad Temporal')
+    axes[0, 0].grid(True, alpha=0.3)
+    
+    axes[0, 1].plot(resultados['tamanos'], resultados['memoria'], 'r-s', linewidth=2, markersize=6)
+    axes[0, 1].set_xlabel('Número de Clases')
+    axes[0, 1].set_ylabel('Uso de Memoria (MB)')
+    axes[0, 1].set_title('Consumo de Memoria')
+    axes[0, 1].grid(True, alpha=0.3)
+    
+    axes[0, 2].plot(resultados['tamanos'], resultados['clases_asignadas'], 'g-^', linewidth=2, markersize=6)
+    axes[0, 2].plot(resultados['tamanos'], resultados['tamanos'], 'k--', alpha=0.5, label='Máximo teórico')
+    if resultados.get('cota_superior'):
+        axes[0, 2].plot(resultados['tamanos'], resultados['cota_superior'], 'm:', linewidth=2, label='Cota superior')
+    axes[0, 2].set_xlabel('Número de Clases')
+    axes[0, 2].set_ylabel('Clases Asignadas')
+    axes[0, 2].set_title('Eficiencia en Asignación')
+    axes[0, 2].legend()
+    axes[0, 2].grid(True, alpha=0.3)
+    
+    axes[1, 0].plot(resultados['tamanos'], resultados['llamadas_recursivas'], 'm-d', linewidth=2, markersize=6)
+    axes[1, 0].set_xlabel('Número de Clases')
+    axes[1, 0].set_ylabel('Llamadas Recursivas')
+    axes[1, 0].set_title('Comportamiento Recursivo')
+    axes[1, 0].grid(True, alpha=0.3)
+    
+    axes[1, 1].plot(resultados['tamanos'], resultados['niveles_maximos'], 'c-p', linewidth=2, markersize=6)
+    axes[1, 1].set_xlabel('Número de Clases')
+    axes[1, 1].set_ylabel('Niveles Máximos de Recursión')
+    axes[1, 1].set_title('Profundidad de Recursión')
+    axes[1, 1].grid(True, alpha=0.3)
+    
+    axes[1, 2].plot(resultados['tamanos'], resultados['eficiencia'], 'orange', marker='o', linewidth=2, markersize=6)
+    axes[1, 2].set_xlabel('Número de Clases')
+    axes[1, 2].set_ylabel('Eficiencia (clases/segundo)')
+    axes[1, 2].set_title('Ratio de Eficiencia')
+    axes[1, 2].grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    plt.savefig(os.path.join(directorio, 'sobrecarga_divide_venceras.png'), dpi=dpi, bbox_inches='tight')
+    _finalizar_figura(plt, mostrar)
+    
+    plt.figure(figsize=(12, 8))
+    
+    plt.subplot(2, 2, 1)
+    plt.loglog(resultados['tamanos'], resultados['tiempos'], 'b-o', label='Tiempo real')
+    # Curvas teóricas ancladas en el primer punto medido: t0·(n/n0)^k
+    n0, t0 = resultados['tamanos'][0], resultados['tiempos'][0]
+    tiempos_teoricos = [t0 * (n / n0)**2 for n in resultados['tamanos']]
+    plt.loglog(resultados['tamanos'], tiempos_teoricos, 'r--', alpha=0.7, label='O(n²) teórico')
+    _trazar_ajuste(plt, resultados['tamanos'], resultados['tiempos'], 'b:')
+    plt.xlabel('Número de Clases (log)')
+    plt.ylabel('Tiempo (log)')
+    plt.title('Análisis Logarítmico - Tiempo')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    
+    plt.subplot(2, 2, 2)
+    plt.loglog(resultados['tamanos'], resultados['llamadas_recursivas'], 'g-s', label='Llamadas reales')
+    l0 = resultados['llamadas_recursivas'][0]
+    llamadas_teoricas = [l0 * (n * math.log2(n)) / (n0 * math.log2(n0)) for n in resultados['tamanos']]
+    plt.loglog(resultados['tamanos'], llamadas_teoricas, 'r--', alpha=0.7, label='O(n log n) teórico')
+    plt.xlabel('Número de Clases (log)')
+    plt.ylabel('Llamadas Recursivas (log)')
+    plt.title('Análisis Logarítmico - Recursión')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    
+    plt.subplot(2, 2, 3)
+    plt.semilogx(resultados['tamanos'], resultados['eficiencia'], 'm-^', linewidth=2, markersize=6)
+    plt.xlabel('Número de Clases (log)')
+    plt.ylabel('Eficiencia (clases/segundo)')
+    plt.title('Eficiencia vs Tamaño')
+    plt.grid(True, alpha=0.3)
+    
+    plt.subplot(2, 2, 4)
+    plt.semilogx(resultados['tamanos'], resultados['memoria'], 'c-p', linewidth=2, markersize=6)
+    plt.xlabel('Número de Clases (log)')
+    plt.ylabel('Memoria (MB)')
+    plt.title('Memoria vs Tamaño')
+    plt.grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    plt.savefig(os.path.join(directorio, 'analisis_logaritmico_dv.png'), dpi=dpi, bbox_inches='tight')
+    _finalizar_figura(plt, mostrar)
+    
+    _renderizar_perfil_fases(plt, resultados, 'perfil_fases_dv.png',
+                             'Perfil por Fase - Divide y Vencerás', directorio, dpi, mostrar)
+
+
+def renderizar_comparativas(resultados, directorio='.', dpi=300, mostrar=False):
+    """Renderiza las gráficas comparativas desde un dict o un archivo de resultados"""
+    resultados = _resolver_resultados(resultados)
+    if not resultados['tamanos']:
+        print("No hay datos para visualizar")
+        return
+    
+    plt = _pyplot(mostrar)
+    
+    # Crear figura principal con múltiples subplots
+    fig, axes = plt.subplots(3, 3, figsize=(20, 15))
+    fig.suptitle('Comparación de Sobrecarga: Divide y Vencerás vs Algoritmo Voraz', fontsize=16, fontweight='bold')
+    
+    # 1. Tiempo de ejecución - Comparación directa
+    axes[0, 0].plot(resultados['tamanos'], resultados['tiempos_dv'], 'b-o', label='Divide y Vencerás', linewidth=2, markersize=6)
+    axes[0, 0].plot(resultados['tamanos'], resultados['tiempos_greedy'], 'r-s', label='Greedy Adaptativo', linewidth=2, markersize=6)
+    axes[0, 0].set_xlabel('Número de Clases')
+    axes[0, 0].set_ylabel('Tiempo de Ejecución (segundos)')
+    axes[0, 0].set_title('Comparación Temporal')
+    axes[0, 0].legend()
+    axes[0, 0].grid(True, alpha=0.3)
+    
+    # 2. Uso de memoria - Comparación directa
+    axes[0, 1].plot(resultados['tamanos'], resultados['memoria_dv'], 'b-o', label='Divide y Vencerás', linewidth=2, markersize=6)
+    axes[0, 1].plot(resultados['tamanos'], resultados['memoria_greedy'], 'r-s', label='Greedy Adaptativo', linewidth=2, markersize=6)
+    axes[0, 1].set_xlabel('Número de Clases')
+    axes[0, 1].set_ylabel('Uso de Memoria (MB)')
+    axes[0, 1].set_title('Comparación de Memoria')
+    axes[0, 1].legend()
+    axes[0, 1].grid(True, alpha=0.3)
+    
+    # 3. Clases asignadas - Comparación directa
+    axes[0, 2].plot(resultados['tamanos'], resultados['clases_asignadas_dv'], 'b-o', label='Divide y Vencerás', linewidth=2, markersize=6)
+    axes[0, 2].plot(resultados['tamanos'], resultados['clases_asignadas_greedy'], 'r-s', label='Greedy Adaptativo', linewidth=2, markersize=6)
+    exactos = [(t, a) for t, a in zip(resultados['tamanos'], resultados.get('clases_asignadas_exacto', [])) if a is not None]
+    if exactos:
+        axes[0, 2].plot(*zip(*exactos), 'k*', markersize=10, label='Exacto (referencia)')
+    axes[0, 2].plot(resultados['tamanos'], resultados['tamanos'], 'k--', alpha=0.5, label='Máximo teórico')
+    if resultados.get('cota_superior'):
+        axes[0, 2].plot(resultados['tamanos'], resultados['cota_superior'], 'm:', linewidth=2, label='Cota superior')
+    axes[0, 2].set_xlabel('Número de Clases')
+    axes[0, 2].set_ylabel('Clases Asignadas')
+    axes[0, 2].set_title('Comparación de Eficiencia')
+    axes[0, 2].legend()
+    axes[0, 2].grid(True, alpha=0.3)
+    
+    # 4. Eficiencia (clases por segundo) - Comparación directa
+    axes[1, 0].plot(resultados['tamanos'], resultados['eficiencia_dv'], 'b-o', label='Divide y Vencerás', linewidth=2, markersize=6)
+    axes[1, 0].plot(resultados['tamanos'], resultados['eficiencia_greedy'], 'r-s', label='Greedy Adaptativo', linewidth=2, markersize=6)
+    axes[1, 0].set_xlabel('Número de Clases')
+    axes[1, 0].set_ylabel('Eficiencia (clases/segundo)')
+    axes[1, 0].set_title('Comparación de Eficiencia')
+    axes[1, 0].legend()
+    axes[1, 0].grid(True, alpha=0.3)
+    
+    # 5. Ratio de tiempo (DV/Greedy)
+    ratios_tiempo = [t_dv/t_g if t_g > 0 else 0 for t_dv, t_g in zip(resultados['tiempos_dv'], resultados['tiempos_greedy'])]
+    axes[1, 1].plot(resultados['tamanos'], ratios_tiempo, 'purple', marker='d', linewidth=2, markersize=6)
+    axes[1, 1].axhline(y=1, color='k', linestyle='--', alpha=0.5, label='Línea de equilibrio')
+    axes[1, 1].set_xlabel('Número de Clases')
+    axes[1, 1].set_ylabel('Ratio de Tiempo (DV/Greedy)')
+    axes[1, 1].set_title('Ventaja Temporal Relativa')
+    axes[1, 1].legend()
+    axes[1, 1].grid(True, alpha=0.3)
+    
+    # 6. Ratio de eficiencia (DV/Greedy)
+    ratios_eficiencia = [e_dv/e_g if e_g > 0 else 0 for e_dv, e_g in zip(resultados['eficiencia_dv'], resultados['eficiencia_greedy'])]
+    axes[1, 2].plot(resultados['tamanos'], ratios_eficiencia, 'orange', marker='o', linewidth=2, markersize=6)
+    axes[1, 2].axhline(y=1, color='k', linestyle='--', alpha=0.5, label='Línea de equilibrio')
+    axes[1, 2].set_xlabel('Número de Clases')
+    axes[1, 2].set_ylabel('Ratio de Eficiencia (DV/Greedy)')
+    axes[1, 2].set_title('Ventaja de Eficiencia Relativa')
+    axes[1, 2].legend()
+    axes[1, 2].grid(True, alpha=0.3)
+    
+    # 7. Comportamiento recursivo vs iterativo
+    axes[2, 0].plot(resultados['tamanos'], resultados['llamadas_recursivas'], 'b-o', label='Llamadas Recursivas (DV)', linewidth=2, markersize=6)
+    axes[2, 0].plot(resultados['tamanos'], resultados['iteraciones_greedy'], 'r-s', label='Iteraciones (Greedy)', linewidth=2, markersize=6)
+    axes[2, 0].set_xlabel('Número de Clases')
+    axes[2, 0].set_ylabel('Operaciones')
+    axes[2, 0].set_title('Comportamiento Recursivo vs Iterativo')
+    axes[2, 0].legend()
+    axes[2, 0].grid(True, alpha=0.3)
+    
+    # 8. Análisis logarítmico - Tiempo
+    axes[2, 1].loglog(resultados['tamanos'], resultados['tiempos_dv'], 'b-o', label='Divide y Vencerás')
+    axes[2, 1].loglog(resultados['tamanos'], resultados['tiempos_greedy'], 'r-s', label='Greedy Adaptativo')
+    axes[2, 1].set_xlabel('Número de Clases (log)')
+    axes[2, 1].set_ylabel('Tiempo (log)')
+    axes[2, 1].set_title('Análisis Logarítmico - Tiempo')
+    axes[2, 1].legend()
+    axes[2, 1].grid(True, alpha=0.3)
+    
+    # 9. Ajustes log-log y punto de cruce
+    from analisis_complejidad import punto_cruce
+    ajuste_dv = _trazar_ajuste(axes[2, 2], resultados['tamanos'], resultados['tiempos_dv'], 'b-')
+    ajuste_greedy = _trazar_ajuste(axes[2, 2], resultados['tamanos'], resultados['tiempos_greedy'], 'r-')
+    axes[2, 2].loglog(resultados['tamanos'], resultados['tiempos_dv'], 'bo', alpha=0.5)
+    axes[2, 2].loglog(resultados['tamanos'], resultados['tiempos_greedy'], 'rs', alpha=0.5)
+    if ajuste_dv is not None and ajuste_greedy is not None:
+        cruce = punto_cruce(ajuste_dv, ajuste_greedy)
+        if cruce is not None:
+            axes[2, 2].axvline(x=cruce, color='k', linestyle='--', alpha=0.5, label=f'Cruce ≈ {cruce:.0f}')
+    axes[2, 2].set_xlabel('Número de Clases (log)')
+    axes[2, 2].set_ylabel('Tiempo (log)')
+    axes[2, 2].set_title('Ajuste y ≈ a·n^b y Punto de Cruce')
+    axes[2, 2].legend()
+    axes[2, 2].grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    plt.savefig(os.path.join(directorio, 'comparacion_sobrecarga_algoritmos.png'), dpi=dpi, bbox_inches='tight')
+    _finalizar_figura(plt, mostrar)
+    
+    # Gráfica adicional: Análisis de puntos de equilibrio
+    plt.figure(figsize=(15, 10))
+    
+    plt.subplot(2, 3, 1)
+    plt.semilogx(resultados['tamanos'], ratios_tiempo, 'purple', marker='d', linewidth=2, markersize=6)
+    plt.axhline(y=1, color='k', linestyle='--', alpha=0.5, label='Equilibrio')
+    plt.xlabel('Número de Clases (log)')
+    plt.ylabel('Ratio de Tiempo (DV/Greedy)')
+    plt.title('Punto de Equilibrio Temporal')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    
+    plt.subplot(2, 3, 2)
+    plt.semilogx(resultados['tamanos'], ratios_eficiencia, 'orange', marker='o', linewidth=2, markersize=6)
+    plt.axhline(y=1, color='k', linestyle='--', alpha=0.5, label='Equilibrio')
+    plt.xlabel('Número de Clases (log)')
+    plt.ylabel('Ratio de Eficiencia (DV/Greedy)')
+    plt.title('Punto de Equilibrio de Eficiencia')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    
+    plt.subplot(2, 3, 3)
+    plt.semilogx(resultados['tamanos'], resultados['eficiencia_dv'], 'b-o', label='Divide y Vencerás')
+    plt.semilogx(resultados['tamanos'], resultados['eficiencia_greedy'], 'r-s', label='Greedy Adaptativo')
+    plt.xlabel('Número de Clases (log)')
+    plt.ylabel('Eficiencia (clases/segundo)')
+    plt.title('Eficiencia vs Tamaño (Log)')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    
+    plt.subplot(2, 3, 4)
+    plt.semilogx(resultados['tamanos'], resultados['memoria_dv'], 'b-o', label='Divide y Vencerás')
+    plt.semilogx(resultados['tamanos'], resultados['memoria_greedy'], 'r-s', label='Greedy Adaptativo')
+    plt.xlabel('Número de Clases (log)')
+    plt.ylabel('Memoria (MB)')
+    plt.title('Memoria vs Tamaño (Log)')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    
+    plt.subplot(2, 3, 5)
+    plt.semilogx(resultados['tamanos'], resultados['llamadas_recursivas'], 'b-o', label='Llamadas Recursivas')
+    plt.semilogx(resultados['tamanos'], resultados['iteraciones_greedy'], 'r-s', label='Iteraciones Greedy')
+    plt.xlabel('Número de Clases (log)')
+    plt.ylabel('Operaciones')
+    plt.title('Comportamiento vs Tamaño (Log)')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    
+    plt.subplot(2, 3, 6)
+    # Exponente local entre tamaños consecutivos: log(t2/t1) / log(n2/n1)
+    tamanos = resultados['tamanos']
+    for clave, estilo, etiqueta in (('tiempos_dv', 'b-o', 'DV'), ('tiempos_greedy', 'r-s', 'Greedy')):
+        exponentes = [math.log(t2 / t1) / math.log(n2 / n1)
+                      for n1, n2, t1, t2 in zip(tamanos, tamanos[1:], resultados[clave], resultados[clave][1:])
+                      if t1 > 0 and t2 > 0 and n2 > n1]
+        if len(exponentes) == len(tamanos) - 1:
+            plt.semilogx(tamanos[1:], exponentes, estilo, label=etiqueta, linewidth=2, markersize=6)
+    plt.axhline(y=1, color='k', linestyle='--', alpha=0.5, label='Lineal')
+    plt.xlabel('Número de Clases (log)')
+    plt.ylabel('Exponente local')
+    plt.title('Escalabilidad Relativa')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    plt.savefig(os.path.join(directorio, 'analisis_equilibrio_algoritmos.png'), dpi=dpi, bbox_inches='tight')
+    _finalizar_figura(plt, mostrar)
+
+
+def _matriz_barrido(celdas, algoritmo, dimension, valores_fila, valores_columna, metrica):
+    """Mediana de `metrica` por (clases, dimension), agregando sobre el resto de dimensiones"""
+    matriz = []
+    for valor_fila in valores_fila:
+        fila = []
+        for valor_columna in valores_columna:
+            valores = [c[metrica] for c in celdas
+                       if c['algoritmo'] == algoritmo and 'error' not in c
+                       and c['clases'] == valor_fila and c[dimension] == valor_columna]
+            fila.append(statistics.median(valores) if valores else float('nan'))
+        matriz.append(fila)
+    return matriz
+
+
+def renderizar_barrido(resultados, directorio='.', dpi=300, mostrar=False):
+    """Mapas de calor de tiempo y tasa de asignación: clases frente a cada otra dimensión"""
+    resultados = _resolver_resultados(resultados)
+    if not resultados['celdas']:
+        print("No hay datos para visualizar")
+        return
+    
+    plt = _pyplot(mostrar)
+    dimensiones = resultados['dimensiones']
+    metricas = (('tiempo', 'Tiempo (s, mediana)', 'viridis'),
+                ('tasa_asignacion', 'Tasa de Asignación', 'RdYlGn'))
+    
+    for algoritmo in sorted({c['algoritmo'] for c in resultados['celdas']}):
+        fig, axes = plt.subplots(2, 3, figsize=(18, 10), squeeze=False)
+        fig.suptitle(f'Barrido Multidimensional - {algoritmo}', fontsize=16, fontweight='bold')
+        
+        for fila, (metrica, etiqueta, mapa) in enumerate(metricas):
+            for columna, dimension in enumerate(('aulas', 'profesores', 'mezcla')):
+                matriz = _matriz_barrido(resultados['celdas'], algoritmo, dimension,
+                                         dimensiones['clases'], dimensiones[dimension], metrica)
+                eje = axes[fila, columna]
+                imagen = eje.imshow(matriz, aspect='auto', origin='lower', cmap=mapa)
+                for i, valores in enumerate(matriz):
+                    for j, valor in enumerate(valores):
+                        if not math.isnan(valor):
+                            eje.text(j, i, f'{valor:.3g}', ha='center', va='center', fontsize=8)
+                eje.set_xticks(range(len(dimensiones[dimension])))
+                eje.set_xticklabels([str(v) for v in dimensiones[dimension]])
+                eje.set_yticks(range(len(dimensiones['clases'])))
+                eje.set_yticklabels([str(v) for v in dimensiones['clases']])
+                eje.set_xlabel(dimension.capitalize())
+                eje.set_ylabel('Número de Clases')
+                eje.set_title(f'{etiqueta}: clases × {dimension}')
+                fig.colorbar(imagen, ax=eje)
+        
+        plt.tight_layout()
+        plt.savefig(os.path.join(directorio, f'barrido_{algoritmo}.png'), dpi=dpi, bbox_inches='tight')
+        _finalizar_figura(plt, mostrar)
+
+
+def _mapa_calor(fig, eje, matriz, titulo, mapa, etiquetas_x, etiquetas_y, anotar=False, vmax=None):
+    matriz = [[float('nan') if valor is None else valor for valor in fila] for fila in matriz]
+    imagen = eje.imshow(matriz, aspect='auto', cmap=mapa, vmin=0, vmax=vmax)
+    if anotar:
+        for i, valores in enumerate(matriz):
+            for j, valor in enumerate(valores):
+                if not math.isnan(valor):
+                    eje.text(j, i, f'{valor:.2f}', ha='center', va='center', fontsize=7)
+    eje.set_xticks(range(len(etiquetas_x)))
+    eje.set_xticklabels(etiquetas_x, fontsize=7)
+    eje.set_yticks(range(len(etiquetas_y)))
+    eje.set_yticklabels(etiquetas_y, fontsize=7)
+    eje.set_title(titulo)
+    fig.colorbar(imagen, ax=eje)
+
+
+def renderizar_utilizacion(resultados, directorio='.', dpi=300, mostrar=False):
+    """Mapas de calor de `analitica_utilizacion`: día × hora y aulas más usadas × franja"""
+    resultados = _resolver_resultados(resultados)
+    if not resultados['aulas']:
+        print("No hay datos para visualizar")
+        return
+    
+    plt = _pyplot(mostrar)
+    dias, horas = resultados['dias'], [f'{h}:00' for h in resultados['horas']]
+    franjas = [dia[:3] if h == resultados['horas'][0] else '' for dia in dias for h in resultados['horas']]
+    etiquetas_aulas = [f"{aula} ({capacidad})" for aula, capacidad in zip(resultados['aulas'], resultados['capacidades'])]
+    resumen = resultados['resumen']
+    
+    fig = plt.figure(figsize=(20, 14))
+    fig.suptitle(f"Utilización del Horario - {resumen['aulas']} aulas, utilización media "
+                 f"{resumen['utilizacion_media']:.1%}", fontsize=16, fontweight='bold')
+    rejilla = fig.add_gridspec(2, 3, height_ratios=[1, 1.6])
+    
+    _mapa_calor(fig, fig.add_subplot(rejilla[0, 0]), resultados['utilizacion_franja'],
+                'Fracción de aulas ocupadas (día × hora)', 'YlOrRd', horas, dias, anotar=True, vmax=1)
+    if resultados['ratio_asientos_franja'] is not None:
+        _mapa_calor(fig, fig.add_subplot(rejilla[0, 1]), resultados['ratio_asientos_franja'],
+                    'Estudiantes / capacidad de las aulas en uso', 'viridis', horas, dias, anotar=True, vmax=1)
+    _mapa_calor(fig, fig.add_subplot(rejilla[0, 2]), resultados['contencion'],
+                'Contención: clases que prefieren la franja por aula' if resultados['demanda'] is not None
+                else 'Contención: fracción de aulas ocupadas', 'magma_r', horas, dias, anotar=True)
+    
+    ocupacion = fig.add_subplot(rejilla[1, :2])
+    _mapa_calor(fig, ocupacion, resultados['ocupacion_aulas'],
+                f"Clases en curso: {len(resultados['aulas'])} aulas más usadas × franja", 'Blues',
+                franjas, etiquetas_aulas)
+    for separador in range(1, len(dias)):
+        ocupacion.axvline(separador * len(horas) - 0.5, color='black', linewidth=0.8)
+    if resultados['ratio_asientos_aulas'] is not None:
+        _mapa_calor(fig, fig.add_subplot(rejilla[1, 2]), resultados['ratio_asientos_aulas'],
+                    'Estudiantes / capacidad por aula × franja', 'viridis', franjas, etiquetas_aulas, vmax=1)
+    
+    plt.tight_layout()
+    plt.savefig(os.path.join(directorio, 'utilizacion_horario.png'), dpi=dpi, bbox_inches='tight')
+    _finalizar_figura(plt, mostrar)
+
+
+RENDERIZADORES = {
+    'greedy': renderizar_greedy,
+    'dv': renderizar_dv,
+    'comparacion': renderizar_comparativas,
+    'barrido': renderizar_barrido,
+    'utilizacion': renderizar_utilizacion,
+}
+
+
+def renderizar_en_segundo_plano(tipo, ruta_resultados, directorio='.', dpi=300):
+    """
+    Lanza el renderizado en un proceso aparte y devuelve el proceso.
+
+    El proceso recibe solo la ruta del archivo de resultados, por lo que el
+    proceso que ejecuta las pruebas nunca importa matplotlib.
+    """
+    proceso = mp.Process(target=RENDERIZADORES[tipo], args=(ruta_resultados, directorio, dpi, False))
+    proceso.start()
+    return proceso
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Renderiza gráficas desde archivos de resultados")
+    parser.add_argument('tipo', choices=list(RENDERIZADORES))
+    parser.add_argument('resultados', nargs='?', help="Archivo JSON de resultados")
+    parser.add_argument('--directorio', default='.', help="Directorio de salida de las imágenes")
+    parser.add_argument('--dpi', type=int, default=300)
+    parser.add_argument('--mostrar', action='store_true', help="Abrir ventanas interactivas")
+    args = parser.parse_args()
+
+    ruta = args.resultados or ARCHIVOS_RESULTADOS[args.tipo]
+    RENDERIZADORES[args.tipo](ruta, args.directorio, args.dpi, args.mostrar)
+
+
+if __name__ == "__main__":
+    main()